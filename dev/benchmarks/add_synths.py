@@ -0,0 +1,52 @@
+"""
+Benchmark adding many synths at once.
+
+Adds a burst of synths with per-synth frequencies to a ``Score``, one
+``add_synth()`` call per synth and via a single ``add_synths()`` call, and times
+each, including encoding the moment's bundle.
+"""
+
+import argparse
+import time
+
+from supriya.assets.synthdefs import default
+from supriya.contexts import Score
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=5)
+    return parser
+
+
+def burst(count, batched):
+    score = Score()
+    frequencies = [110.0 + i for i in range(count)]
+    started = time.perf_counter()
+    with score.at(0):
+        if batched:
+            score.add_synths(default, count, amplitude=0.1, frequency=frequencies)
+        else:
+            for frequency in frequencies:
+                score.add_synth(default, amplitude=0.1, frequency=frequency)
+    for datagram in score.iterate_datagrams():
+        pass
+    return time.perf_counter() - started
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    for batched in (False, True):
+        best = min(
+            burst(parsed_args.count, batched) for _ in range(parsed_args.iterations)
+        )
+        print(
+            f"{'add_synths()' if batched else 'add_synth()':<14} "
+            f"{best * 1e3:>9.1f} ms "
+            f"({best / parsed_args.count * 1e6:.2f} us per synth)"
+        )
+
+
+if __name__ == "__main__":
+    run()
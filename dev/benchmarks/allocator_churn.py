@@ -0,0 +1,52 @@
+"""
+Benchmark block allocator churn.
+
+Fills a heap with a fragmenting mix of block sizes, then repeatedly frees a
+random live block and allocates a new one, as a long session allocating and
+freeing buffers and buses does, timing each allocator on the same sequence.
+"""
+
+import argparse
+import random
+import time
+
+from supriya.contexts.allocators import BestFitBlockAllocator, BlockAllocator
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+def churn(allocator_class, sizes, choices):
+    allocator = allocator_class(heap_minimum=0, heap_maximum=sum(sizes) * 2)
+    live = [allocator.allocate(size) for size in sizes]
+    started = time.perf_counter()
+    for index, size in choices:
+        allocator.free(live[index])
+        live[index] = allocator.allocate(size)
+    return time.perf_counter() - started, live.count(None)
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    random_ = random.Random(parsed_args.seed)
+    sizes = [random_.choice([1, 2, 4, 8, 16, 3, 7]) for _ in range(parsed_args.blocks)]
+    choices = [
+        (random_.randrange(parsed_args.blocks), random_.choice([1, 2, 4, 8, 16, 3, 7]))
+        for _ in range(parsed_args.iterations)
+    ]
+    for allocator_class in (BlockAllocator, BestFitBlockAllocator):
+        elapsed, failures = churn(allocator_class, sizes, choices)
+        print(
+            f"{allocator_class.__name__:<22} {elapsed * 1e3:>9.1f} ms "
+            f"({elapsed / parsed_args.iterations * 1e6:.1f} us per free + allocate, "
+            f"{failures} failed)"
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,121 @@
+"""
+Benchmark moving buffer samples between NumPy arrays and a server.
+
+Connects a ``Server`` to a fake scsynth, a local UDP responder backing its
+buffers with NumPy arrays and answering ``/b_query``, ``/b_getn``, ``/b_setn``,
+``/b_write`` and ``/b_read`` as scsynth would, then times
+``Server.set_buffer_array()`` and ``Server.get_buffer_array()`` through both
+the temporary file and the OSC transfer methods.
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+import numpy
+
+from supriya.contexts import Buffer, Server
+from supriya.osc import OscBundle, OscMessage
+from supriya.soundfiles import read_float_wav, write_float_wav
+
+
+class FakeScsynthHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, socket_ = self.request
+        if data.startswith(b"#bundle"):
+            messages = list(OscBundle.from_datagram(data).contents)
+        else:
+            messages = [OscMessage.from_datagram(data)]
+        while messages:
+            message = messages.pop(0)
+            if isinstance(message, OscBundle):
+                messages[:0] = message.contents
+                continue
+            for reply in self.reply(message, self.server.buffers):
+                socket_.sendto(reply.to_datagram(), self.client_address)
+
+    def reply(self, message, buffers):
+        if message.address == "/notify":
+            yield OscMessage("/done", "/notify", 0, 1)
+        elif message.address == "/status":
+            yield OscMessage("/status.reply", 1, 0, 0, 0, 0, 0.0, 0.0, 44100.0, 44100.0)
+        elif message.address == "/sync":
+            yield OscMessage("/synced", *message.contents)
+        elif message.address == "/b_query":
+            for buffer_id in message.contents:
+                frame_count, channel_count = buffers[buffer_id].shape
+                yield OscMessage(
+                    "/b_info", buffer_id, frame_count, channel_count, 44100.0
+                )
+        elif message.address == "/b_getn":
+            buffer_id, index, count = message.contents
+            values = buffers[buffer_id].reshape(-1)[index : index + count].tolist()
+            yield OscMessage("/b_setn", buffer_id, index, count, *values)
+        elif message.address == "/b_setn":
+            buffer_id, index, count, *values = message.contents
+            buffers[buffer_id].reshape(-1)[index : index + count] = values
+        elif message.address == "/b_write":
+            buffer_id, path = message.contents[:2]
+            write_float_wav(path, buffers[buffer_id], 44100)
+            yield OscMessage("/done", "/b_write", buffer_id)
+        elif message.address == "/b_read":
+            buffer_id, path, _, _, starting_frame = message.contents[:5]
+            array = read_float_wav(path)
+            buffers[buffer_id][starting_frame : starting_frame + len(array)] = array
+            yield OscMessage("/done", "/b_read", buffer_id)
+        elif message.address in ("/d_recv", "/quit"):
+            yield OscMessage("/done", message.address)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--frames", type=int, default=44100 * 10)
+    parser.add_argument("--port", type=int, default=57199)
+    parser.add_argument("--window", type=int, default=16)
+    return parser
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    shape = (parsed_args.frames, parsed_args.channels)
+    fake_scsynth = socketserver.UDPServer(
+        ("127.0.0.1", parsed_args.port), FakeScsynthHandler
+    )
+    fake_scsynth.buffers = {0: numpy.zeros(shape, dtype=numpy.float32)}
+    threading.Thread(target=fake_scsynth.serve_forever, daemon=True).start()
+    server = Server().connect(port=parsed_args.port)
+    array = numpy.random.default_rng(0).uniform(-1, 1, shape).astype(numpy.float32)
+    megabytes = array.nbytes / 1e6
+    try:
+        buffer = Buffer(context=server, id_=0)
+        for method in ["file", "osc"]:
+            fake_scsynth.buffers[0][:] = 0.0
+            started = time.perf_counter()
+            server.set_buffer_array(
+                buffer, array, method=method, window=parsed_args.window
+            )
+            set_time = time.perf_counter() - started
+            started = time.perf_counter()
+            result = server.get_buffer_array(
+                buffer, method=method, window=parsed_args.window
+            )
+            get_time = time.perf_counter() - started
+            assert numpy.array_equal(result, array)
+            for label, elapsed in [
+                (f"set_buffer_array({method})", set_time),
+                (f"get_buffer_array({method})", get_time),
+            ]:
+                print(
+                    f"{label:<24} {elapsed * 1e3:>9.1f} ms "
+                    f"({megabytes / elapsed:.1f} MB/s)"
+                )
+    finally:
+        server.disconnect()
+        fake_scsynth.shutdown()
+        fake_scsynth.server_close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,65 @@
+"""
+Benchmark allocating node IDs for bursts of synths.
+
+Adds bursts of synths to a ``Score`` in one moment, as a pattern burst does,
+allocating their node IDs one at a time and via ``Context.reserve_node_ids()``,
+and times the allocator calls alone and the whole burst.
+"""
+
+import argparse
+import time
+
+from supriya.assets.synthdefs import default
+from supriya.contexts import Score
+from supriya.contexts.allocators import NodeIdAllocator
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=5)
+    return parser
+
+
+def allocate(count, reserved):
+    allocator = NodeIdAllocator()
+    started = time.perf_counter()
+    if reserved:
+        allocator.allocate_node_ids(count)
+    else:
+        for _ in range(count):
+            allocator.allocate_node_id()
+    return time.perf_counter() - started
+
+
+def burst(count, reserved):
+    score = Score()
+    started = time.perf_counter()
+    with score.at(0):
+        if reserved:
+            with score.reserve_node_ids(count):
+                for _ in range(count):
+                    score.add_synth(default)
+        else:
+            for _ in range(count):
+                score.add_synth(default)
+    return time.perf_counter() - started
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    for label, function in [("allocator", allocate), ("score burst", burst)]:
+        for reserved in (False, True):
+            best = min(
+                function(parsed_args.count, reserved)
+                for _ in range(parsed_args.iterations)
+            )
+            print(
+                f"{label:<12} {'reserved' if reserved else 'one at a time':<14} "
+                f"{best * 1e3:>9.1f} ms "
+                f"({best / parsed_args.count * 1e6:.2f} us per node)"
+            )
+
+
+if __name__ == "__main__":
+    run()
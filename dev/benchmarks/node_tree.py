@@ -0,0 +1,177 @@
+"""
+Benchmark mirroring a large node tree from notifications.
+
+Records a stream of ``/n_go``, ``/n_move``, ``/n_off``, ``/n_on`` and
+``/n_end`` notifications for thousands of synths churning under one group,
+as a dense pattern produces, then replays it through the list-based mirror
+``BaseServer`` used to keep, through ``NodeTree``, and through
+``BaseServer._handle_osc_callbacks()`` end to end.
+
+Streams can be saved with ``--record`` and replayed with ``--replay``, framed
+as length-prefixed OSC datagrams.
+"""
+
+import argparse
+import random
+import struct
+import time
+
+from supriya.contexts import Server
+from supriya.contexts.trees import NodeTree
+from supriya.osc import OscMessage
+
+
+class ListMirror:
+    def __init__(self):
+        self.children = {0: [], 1: []}
+        self.parents = {1: 0}
+
+    def add(self, id_, parent_id, previous_id, next_id):
+        self.parents[id_] = parent_id
+        children = self.children[parent_id]
+        if previous_id == -1:
+            children.insert(0, id_)
+        elif next_id == -1:
+            children.append(id_)
+        elif previous_id in children:
+            children.insert(children.index(previous_id) + 1, id_)
+        elif next_id in children:
+            children.insert(children.index(next_id), id_)
+
+    def remove(self, id_, parent_id):
+        children = self.children[parent_id]
+        try:
+            children.pop(children.index(id_))
+        except ValueError:
+            pass
+
+    def handle(self, message):
+        address, contents = message.address, message.contents
+        if address == "/n_go":
+            self.add(*contents[:4])
+        elif address == "/n_move":
+            self.remove(contents[0], self.parents[contents[0]])
+            self.add(*contents[:4])
+        elif address == "/n_end":
+            self.remove(contents[0], self.parents.pop(contents[0]))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--record", metavar="PATH")
+    parser.add_argument("--replay", metavar="PATH")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--synths", type=int, default=5000)
+    return parser
+
+
+def record(synth_count, event_count, seed):
+    # Simulate scsynth placing synths in group 1, describing each change the
+    # way its notifications do.
+    random_ = random.Random(seed)
+    children = []
+    next_node_id = 1000
+    messages = [OscMessage("/n_go", 1, 0, -1, -1, 1)]
+
+    def describe(address, index, *extra):
+        previous_id = children[index - 1] if index else -1
+        next_id = children[index + 1] if index + 1 < len(children) else -1
+        return OscMessage(address, children[index], 1, previous_id, next_id, *extra)
+
+    while len(messages) < event_count:
+        action = random_.random()
+        if len(children) < synth_count and (action < 0.4 or not children):
+            index = random_.randint(0, len(children))
+            children.insert(index, next_node_id)
+            next_node_id += 1
+            messages.append(describe("/n_go", index, 0))
+        elif action < 0.6:
+            node_id = children.pop(random_.randrange(len(children)))
+            index = random_.randint(0, len(children))
+            children.insert(index, node_id)
+            messages.append(describe("/n_move", index, 0))
+        elif action < 0.7:
+            node_id = random_.choice(children)
+            address = random_.choice(["/n_off", "/n_on"])
+            messages.append(OscMessage(address, node_id, 1, -1, -1, 0))
+        else:
+            index = random_.randrange(len(children))
+            messages.append(describe("/n_end", index, 0))
+            children.pop(index)
+    return messages
+
+
+def load(path):
+    messages = []
+    with open(path, "rb") as file_pointer:
+        data = file_pointer.read()
+    offset = 0
+    while offset < len(data):
+        (size,) = struct.unpack(">i", data[offset : offset + 4])
+        messages.append(OscMessage.from_datagram(data[offset + 4 : offset + 4 + size]))
+        offset += 4 + size
+    return messages
+
+
+def save(path, messages):
+    with open(path, "wb") as file_pointer:
+        for message in messages:
+            datagram = message.to_datagram()
+            file_pointer.write(struct.pack(">i", len(datagram)) + datagram)
+
+
+def replay_list_mirror(messages):
+    mirror = ListMirror()
+    started = time.perf_counter()
+    for message in messages:
+        mirror.handle(message)
+    return time.perf_counter() - started
+
+
+def replay_node_tree(messages):
+    tree = NodeTree()
+    started = time.perf_counter()
+    for message in messages:
+        address, contents = message.address, message.contents
+        if address == "/n_go":
+            tree.add(*contents[:4], is_group=bool(contents[4]))
+        elif address == "/n_move":
+            tree.move(*contents[:4])
+        elif address == "/n_end":
+            tree.remove(contents[0])
+        else:
+            tree.set_active(contents[0], address == "/n_on")
+    return time.perf_counter() - started
+
+
+def replay_server(messages):
+    server = Server()
+    started = time.perf_counter()
+    for message in messages:
+        server._handle_osc_callbacks(message)
+    return time.perf_counter() - started
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    if parsed_args.replay:
+        messages = load(parsed_args.replay)
+    else:
+        messages = record(parsed_args.synths, parsed_args.events, parsed_args.seed)
+    if parsed_args.record:
+        save(parsed_args.record, messages)
+    for label, function in [
+        ("list mirror", replay_list_mirror),
+        ("NodeTree", replay_node_tree),
+        ("server callbacks", replay_server),
+    ]:
+        elapsed = function(messages)
+        print(
+            f"{label:<17} {elapsed * 1e3:>9.1f} ms "
+            f"({elapsed / len(messages) * 1e6:.2f} us per notification)"
+        )
+
+
+if __name__ == "__main__":
+    run()
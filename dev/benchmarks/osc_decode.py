@@ -0,0 +1,61 @@
+"""
+Micro-benchmark OSC datagram decoding.
+
+Decodes synthetic ``/b_setn`` replies of increasing size, so per-float cost
+should stay flat as the datagram grows.
+"""
+
+import argparse
+import timeit
+
+from supriya.osc import OscBundle, OscMessage
+
+
+def build_b_setn(count: int) -> bytes:
+    values = [float(i) / count for i in range(count)]
+    return OscMessage("/b_setn", 0, 0, count, *values).to_datagram()
+
+
+def build_bundle(count: int) -> bytes:
+    return OscBundle(
+        contents=[
+            OscMessage("/n_set", 1000 + i, "frequency", 440.0) for i in range(count)
+        ]
+    ).to_datagram()
+
+
+def run_benchmark(label, datagram, function, repeat, number):
+    timings = timeit.repeat(lambda: function(datagram), repeat=repeat, number=number)
+    best = min(timings) / number
+    print(f"{label:<32} {len(datagram):>10} bytes {best * 1e3:>10.3f} ms")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    return parser
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    for count in (100, 1000, 10000):
+        run_benchmark(
+            f"/b_setn reply ({count} floats)",
+            build_b_setn(count),
+            OscMessage.from_datagram,
+            parsed_args.repeat,
+            parsed_args.number,
+        )
+    for count in (10, 100, 1000):
+        run_benchmark(
+            f"bundle ({count} messages)",
+            build_bundle(count),
+            OscBundle.from_datagram,
+            parsed_args.repeat,
+            parsed_args.number,
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+"""
+Benchmark OSC callback dispatch.
+
+Registers many one-shot callbacks of the kind ``Requestable.communicate()``
+produces (a unique ``/synced`` or ``/done`` success pattern, some sharing a
+``/fail`` failure pattern), then dispatches one reply to each so every
+callback fires and unregisters itself. Also times steady-state dispatch of
+``/n_go`` notifications against exact and wildcard callbacks.
+"""
+
+import argparse
+import time
+import timeit
+
+from supriya.osc import AsyncOscProtocol, OscMessage
+
+
+def procedure(message):
+    pass
+
+
+def one_shots(count):
+    osc_protocol = AsyncOscProtocol()
+    replies = []
+    for i in range(count):
+        if i % 2:
+            osc_protocol.register(
+                pattern=["/synced", i], procedure=procedure, once=True
+            )
+            replies.append(OscMessage("/synced", i))
+        else:
+            osc_protocol.register(
+                pattern=["/done", "/b_alloc", i],
+                failure_pattern=["/fail", "/b_alloc"],
+                procedure=procedure,
+                once=True,
+            )
+            replies.append(OscMessage("/done", "/b_alloc", i))
+    started = time.perf_counter()
+    for reply in replies:
+        osc_protocol._match_callbacks(reply)
+    elapsed = time.perf_counter() - started
+    assert not osc_protocol.callbacks
+    return elapsed
+
+
+def notifications(pattern):
+    osc_protocol = AsyncOscProtocol()
+    for address in ("/n_end", "/n_off", "/n_on", "/n_move", "/synced", "/done"):
+        osc_protocol.register(pattern=[address], procedure=procedure)
+    osc_protocol.register(pattern=[pattern], procedure=procedure)
+    message = OscMessage("/n_go", 1000, 1, -1, -1, 0)
+    assert len(osc_protocol._match_callbacks(message)) == 1
+    return lambda: osc_protocol._match_callbacks(message)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=100000)
+    return parser
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    best = min(one_shots(parsed_args.count) for _ in range(parsed_args.repeat))
+    print(
+        f"{parsed_args.count} one-shot callbacks: {best * 1e3:.3f} ms "
+        f"({best / parsed_args.count * 1e6:.3f} us per reply)"
+    )
+    for label, pattern in [("exact", "/n_go"), ("wildcard", "/n_*")]:
+        timings = timeit.repeat(
+            notifications(pattern),
+            repeat=parsed_args.repeat,
+            number=parsed_args.number,
+        )
+        best = min(timings) / parsed_args.number
+        print(f"/n_go dispatch ({label}): {best * 1e6:.3f} us")
+
+
+if __name__ == "__main__":
+    run()
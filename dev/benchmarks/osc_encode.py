@@ -0,0 +1,59 @@
+"""
+Micro-benchmark OSC datagram encoding.
+
+Encodes ``/n_setn`` messages of increasing size, plus the small ``/n_set``
+messages that dominate realtime traffic.
+"""
+
+import argparse
+import timeit
+
+from supriya.osc import OscBundle, OscMessage
+
+
+def build_n_setn(count: int) -> OscMessage:
+    return OscMessage("/n_setn", 1000, 0, count, *(float(i) for i in range(count)))
+
+
+def build_n_set() -> OscMessage:
+    return OscMessage("/n_set", 1000, "frequency", 440.0, "amplitude", 0.5)
+
+
+def build_bundle(count: int) -> OscBundle:
+    return OscBundle(contents=[build_n_set() for _ in range(count)])
+
+
+def run_benchmark(label, osc_message, repeat, number):
+    timings = timeit.repeat(osc_message.to_datagram, repeat=repeat, number=number)
+    best = min(timings) / number
+    print(f"{label:<32} {best * 1e6:>12.3f} us")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=100)
+    return parser
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    run_benchmark("/n_set", build_n_set(), parsed_args.repeat, parsed_args.number)
+    for count in (200, 2000, 20000):
+        run_benchmark(
+            f"/n_setn ({count} controls)",
+            build_n_setn(count),
+            parsed_args.repeat,
+            parsed_args.number,
+        )
+    for count in (10, 100, 1000):
+        run_benchmark(
+            f"bundle ({count} messages)",
+            build_bundle(count),
+            parsed_args.repeat,
+            parsed_args.number,
+        )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,120 @@
+"""
+Benchmark receiving bursts of node notifications.
+
+Connects a ``Server`` to a fake scsynth, a local UDP responder which answers a
+``/blast`` request with a burst of ``/n_go`` and ``/n_end`` notifications, as
+under heavy synth churn, and times how long the default per-datagram handler
+and the batched receive mode take to process each burst, and how many
+notifications each loses.
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+from supriya.contexts import Server
+from supriya.osc import OscBundle, OscMessage
+
+
+class FakeScsynthHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, socket_ = self.request
+        if data.startswith(b"#bundle"):
+            messages = list(OscBundle.from_datagram(data).contents)
+        else:
+            messages = [OscMessage.from_datagram(data)]
+        while messages:
+            message = messages.pop(0)
+            if isinstance(message, OscBundle):
+                messages[:0] = message.contents
+                continue
+            for reply in self.reply(message):
+                socket_.sendto(reply, self.client_address)
+
+    def reply(self, message):
+        if message.address == "/notify":
+            yield OscMessage("/done", "/notify", 0, 1).to_datagram()
+        elif message.address == "/status":
+            yield OscMessage(
+                "/status.reply", 1, 0, 0, 0, 0, 0.0, 0.0, 44100.0, 44100.0
+            ).to_datagram()
+        elif message.address == "/sync":
+            yield OscMessage("/synced", *message.contents).to_datagram()
+        elif message.address == "/blast":
+            start, count = message.contents
+            for node_id in range(start, start + count):
+                yield OscMessage("/n_go", node_id, 0, -1, -1, 0).to_datagram()
+                yield OscMessage("/n_end", node_id, 0, -1, -1, 0).to_datagram()
+        elif message.address in ("/d_recv", "/quit"):
+            yield OscMessage("/done", message.address).to_datagram()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--port", type=int, default=57199)
+    parser.add_argument("--receive-buffer-size", type=int, default=None)
+    return parser
+
+
+def blast(server, start, count, timeout=5.0):
+    received = []
+    done = threading.Event()
+
+    def callback(message):
+        received.append(message)
+        if message.contents[0] == start + count - 1:
+            done.set()
+
+    callback_ = server.osc_protocol.register(pattern="/n_end", procedure=callback)
+    started = time.perf_counter()
+    server.osc_protocol.send(OscMessage("/blast", start, count))
+    done.wait(timeout)
+    elapsed = time.perf_counter() - started
+    server.osc_protocol.unregister(callback_)
+    return elapsed, count - len(received)
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    fake_scsynth = socketserver.UDPServer(
+        ("127.0.0.1", parsed_args.port), FakeScsynthHandler
+    )
+    threading.Thread(target=fake_scsynth.serve_forever, daemon=True).start()
+    try:
+        for label, kwargs in [
+            ("per-datagram handler", {}),
+            (
+                "batched receive",
+                dict(
+                    batched_receive=True,
+                    receive_buffer_size=parsed_args.receive_buffer_size,
+                ),
+            ),
+        ]:
+            server = Server(**kwargs).connect(port=parsed_args.port)
+            try:
+                timings, losses = [], 0
+                for i in range(parsed_args.iterations):
+                    elapsed, lost = blast(
+                        server, 1000 + i * parsed_args.count, parsed_args.count
+                    )
+                    timings.append(elapsed)
+                    losses += lost
+                best = min(timings)
+                print(
+                    f"{label:<22} {best * 1e3:>9.1f} ms "
+                    f"({best / parsed_args.count * 1e6:.1f} us per node), "
+                    f"{losses} lost"
+                )
+            finally:
+                server.disconnect()
+    finally:
+        fake_scsynth.shutdown()
+        fake_scsynth.server_close()
+
+
+if __name__ == "__main__":
+    run()
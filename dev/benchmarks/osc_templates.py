@@ -0,0 +1,64 @@
+"""
+Benchmark pre-encoded OSC message templates against the generic encoder.
+
+Builds the ``/n_set nodeID "frequency" f "amplitude" f`` datagram that
+dominates realtime traffic, through the generic ``OscMessage`` path, through
+an ``OscMessageTemplate`` and through ``SetNodeControl.to_osc()``.
+"""
+
+import argparse
+import timeit
+
+from supriya.contexts.requests import SetNodeControl
+from supriya.osc import OscMessage, OscMessageTemplate
+
+TEMPLATE = OscMessageTemplate("/n_set", int, "frequency", float, "amplitude", float)
+
+
+def generic():
+    return OscMessage(
+        "/n_set", 1000, "frequency", 440.0, "amplitude", 0.5
+    ).to_datagram()
+
+
+def template_datagram():
+    return TEMPLATE.to_datagram(1000, 440.0, 0.5)
+
+
+def template_message():
+    return TEMPLATE.to_osc_message(1000, 440.0, 0.5).to_datagram()
+
+
+def request():
+    return (
+        SetNodeControl(node_id=1000, items=[("frequency", 440.0), ("amplitude", 0.5)])
+        .to_osc()
+        .to_datagram()
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=10000)
+    return parser
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    assert generic() == template_datagram() == template_message() == request()
+    for label, function in [
+        ("OscMessage.to_datagram()", generic),
+        ("OscMessageTemplate.to_datagram()", template_datagram),
+        ("OscMessageTemplate.to_osc_message()", template_message),
+        ("SetNodeControl.to_osc()", request),
+    ]:
+        timings = timeit.repeat(
+            function, repeat=parsed_args.repeat, number=parsed_args.number
+        )
+        best = min(timings) / parsed_args.number
+        print(f"{label:<40} {best * 1e6:>8.3f} us")
+
+
+if __name__ == "__main__":
+    run()
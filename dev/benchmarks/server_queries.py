@@ -0,0 +1,86 @@
+"""
+Benchmark pipelined server queries against serialized round trips.
+
+Connects a ``Server`` to a fake scsynth, a local UDP responder that answers
+just enough of the protocol to connect and to reply to ``/n_query``, then
+queries the same nodes once per round trip with ``Server.query_node()`` and
+all at once with ``Server.query_nodes()``.
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+from supriya.contexts import Group, Server
+from supriya.osc import OscBundle, OscMessage
+
+
+class FakeScsynthHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, socket_ = self.request
+        if data.startswith(b"#bundle"):
+            messages = list(OscBundle.from_datagram(data).contents)
+        else:
+            messages = [OscMessage.from_datagram(data)]
+        while messages:
+            message = messages.pop(0)
+            if isinstance(message, OscBundle):
+                messages[:0] = message.contents
+                continue
+            for reply in self.reply(message):
+                socket_.sendto(reply.to_datagram(), self.client_address)
+
+    def reply(self, message):
+        if message.address == "/notify":
+            yield OscMessage("/done", "/notify", 0, 1)
+        elif message.address == "/status":
+            yield OscMessage("/status.reply", 1, 0, 0, 0, 0, 0.0, 0.0, 44100.0, 44100.0)
+        elif message.address == "/sync":
+            yield OscMessage("/synced", *message.contents)
+        elif message.address == "/n_query":
+            for node_id in message.contents:
+                yield OscMessage("/n_info", node_id, 1, -1, -1, 0)
+        elif message.address in ("/d_recv", "/quit"):
+            yield OscMessage("/done", message.address)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--port", type=int, default=57199)
+    return parser
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    fake_scsynth = socketserver.UDPServer(
+        ("127.0.0.1", parsed_args.port), FakeScsynthHandler
+    )
+    threading.Thread(target=fake_scsynth.serve_forever, daemon=True).start()
+    server = Server().connect(port=parsed_args.port)
+    try:
+        groups = [Group(context=server, id_=1000 + i) for i in range(parsed_args.count)]
+        started = time.perf_counter()
+        serial = [server.query_node(group) for group in groups]
+        serial_time = time.perf_counter() - started
+        started = time.perf_counter()
+        pipelined = server.query_nodes(groups)
+        pipelined_time = time.perf_counter() - started
+        assert serial == pipelined
+        for label, elapsed in [
+            ("Server.query_node() x N", serial_time),
+            ("Server.query_nodes()", pipelined_time),
+        ]:
+            print(
+                f"{label:<28} {elapsed * 1e3:>9.1f} ms "
+                f"({elapsed / parsed_args.count * 1e6:.1f} us per node)"
+            )
+    finally:
+        server.disconnect()
+        fake_scsynth.shutdown()
+        fake_scsynth.server_close()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,166 @@
+"""
+Benchmark building large procedurally generated SynthDefs.
+
+Generates graphs of thousands of UGens in a few shapes - a random DAG of
+filters and binary operators, a wide additive bank mixed down through a
+balanced tree of sums, a bank of FFT chains whose PV chains fan out, and a
+graph padded with dead code for the optimizer to strip - then times
+``SynthDefBuilder.build()`` end to end and each of the passes
+``SynthDef.__init__`` runs.
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+
+from supriya.ugens import (
+    FFT,
+    IFFT,
+    LPF,
+    Mix,
+    Out,
+    PV_BrickWall,
+    PV_MagFreeze,
+    SinOsc,
+    SynthDef,
+    SynthDefBuilder,
+    WhiteNoise,
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--graph",
+        action="append",
+        choices=["additive", "dead-code", "random", "spectral"],
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ugens", type=int, action="append")
+    return parser
+
+
+def mix_down(sources):
+    # Sum pairwise so the graph's depth grows logarithmically.
+    while len(sources) > 1:
+        sources = [
+            sources[i] + sources[i + 1] if i + 1 < len(sources) else sources[i]
+            for i in range(0, len(sources), 2)
+        ]
+    return sources[0]
+
+
+def generate_additive(ugen_count, random_):
+    with SynthDefBuilder(frequency=110, amplitude=0.1) as builder:
+        partials = []
+        for i in range(ugen_count // 3):
+            partials.append(
+                SinOsc.ar(frequency=builder["frequency"] * (i + 1)) * random_.random()
+            )
+        Out.ar(bus=0, source=mix_down(partials) * builder["amplitude"])
+    return builder
+
+
+def generate_dead_code(ugen_count, random_):
+    with SynthDefBuilder(frequency=110) as builder:
+        sources = []
+        for i in range(ugen_count // 4):
+            source = SinOsc.ar(frequency=builder["frequency"] * random_.random())
+            # Pure UGens nothing reads from are eliminated as dead code.
+            LPF.ar(source=source * 0.5, frequency=random_.random() * 1000)
+            sources.append(source)
+        Out.ar(bus=0, source=Mix.new(sources[:8]))
+    return builder
+
+
+def generate_random(ugen_count, random_):
+    with SynthDefBuilder(frequency=110) as builder:
+        sources = [WhiteNoise.ar(), SinOsc.ar(frequency=builder["frequency"])]
+        while len(sources) < ugen_count // 2:
+            # Draw inputs from anywhere earlier, keeping the graph shallow
+            # enough to deep-copy.
+            a, b = random_.choice(sources), random_.choice(sources)
+            if random_.random() < 0.5:
+                sources.append(a * b)
+            else:
+                sources.append(LPF.ar(source=a, frequency=random_.random() * 1000))
+        Out.ar(bus=0, source=mix_down(sources))
+    return builder
+
+
+def generate_spectral(ugen_count, random_):
+    with SynthDefBuilder() as builder:
+        outputs = []
+        for _ in range(ugen_count // 12):
+            chain = FFT.kr(source=WhiteNoise.ar())
+            # Chains read by several PV UGens are copied into new LocalBufs.
+            for _ in range(3):
+                branch = PV_BrickWall.kr(pv_chain=chain, wipe=random_.random())
+                branch = PV_MagFreeze.kr(pv_chain=branch)
+                outputs.append(IFFT.ar(pv_chain=branch))
+        Out.ar(bus=0, source=mix_down(outputs))
+    return builder
+
+
+def time_passes(builder):
+    # Mirror ``SynthDefBuilder.build()`` and ``SynthDef.__init__()``, timing
+    # each pass.
+    timings = {}
+    started = time.perf_counter()
+    ugens = copy.deepcopy(list(builder._parameters.values()) + builder._ugens)
+    ugens, parameters = SynthDef._extract_parameters(ugens)
+    control_ugens, control_mapping = SynthDef._build_control_mapping(parameters)
+    SynthDef._remap_controls(ugens, control_mapping)
+    ugens = list(control_ugens + ugens)
+    timings["prepare"] = time.perf_counter() - started
+    for label, function in [
+        ("PV chains", SynthDef._cleanup_pv_chains),
+        ("LocalBufs", SynthDef._cleanup_local_bufs),
+        ("optimize", SynthDef._optimize_ugen_graph),
+        ("sort", SynthDef._sort_ugens_topologically),
+        ("constants", SynthDef._collect_constants),
+    ]:
+        started = time.perf_counter()
+        # PV chain cleanup adds UGens, which must share the builder's scope.
+        with builder:
+            result = function(ugens)
+        timings[label] = time.perf_counter() - started
+        if label != "constants":
+            ugens = result
+    return timings
+
+
+def run():
+    parsed_args = build_parser().parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 20000))
+    generators = {
+        "additive": generate_additive,
+        "dead-code": generate_dead_code,
+        "random": generate_random,
+        "spectral": generate_spectral,
+    }
+    for graph in parsed_args.graph or sorted(generators):
+        for ugen_count in parsed_args.ugens or [5000, 10000, 20000]:
+            # Building mutates the builder, so time each on a fresh one.
+            builders = [
+                generators[graph](ugen_count, random.Random(parsed_args.seed))
+                for _ in range(2)
+            ]
+            started = time.perf_counter()
+            synthdef = builders[0].build()
+            elapsed = time.perf_counter() - started
+            timings = time_passes(builders[1])
+            print(
+                f"{graph:<10} {len(synthdef.ugens):>6} UGens "
+                f"{elapsed * 1e3:>9.1f} ms build ("
+                + ", ".join(
+                    f"{label} {value * 1e3:.1f} ms" for label, value in timings.items()
+                )
+                + ")"
+            )
+
+
+if __name__ == "__main__":
+    run()
@@ -25,6 +25,7 @@ from .contexts import (
     Score,
     Server,
     Synth,
+    SynthGroup,
 )
 from .enums import (  # noqa
     AddAction,
@@ -34,7 +35,7 @@ from .enums import (  # noqa
     ParameterRate,
     SampleFormat,
 )
-from .io import graph, play, plot, render
+from .io import graph, play, plot, render, render_many
 from .osc import OscBundle, OscCallback, OscMessage
 from .patterns import Pattern
 from .ugens import (
@@ -91,6 +92,7 @@ __all__ = [
     "Score",
     "Server",
     "Synth",
+    "SynthGroup",
     "SynthDef",
     "SynthDefBuilder",
     "TimeUnit",
@@ -105,6 +107,7 @@ __all__ = [
     "play",
     "plot",
     "render",
+    "render_many",
     "synthdef",
 ]
 
@@ -12,6 +12,7 @@ from .entities import (
     Group,
     Node,
     Synth,
+    SynthGroup,
 )
 from .nonrealtime import Score
 from .realtime import AsyncServer, BaseServer, Server
@@ -30,4 +31,5 @@ __all__ = [
     "Score",
     "Server",
     "Synth",
+    "SynthGroup",
 ]
@@ -5,6 +5,7 @@ Context subclasses expose a common interface for realtime and non-realtime synth
 """
 
 import abc
+import collections
 import contextlib
 import dataclasses
 import itertools
@@ -12,7 +13,11 @@ import threading
 from os import PathLike
 from typing import (
     Callable,
+    ContextManager,
+    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -40,7 +45,7 @@ from ..typing import (
     SampleFormatLike,
     SupportsOsc,
 )
-from ..ugens import SynthDef
+from ..ugens import Parameter, SynthDef
 from .allocators import BlockAllocator, NodeIdAllocator
 from .entities import (
     Buffer,
@@ -52,8 +57,10 @@ from .entities import (
     Node,
     RootNode,
     Synth,
+    SynthGroup,
 )
 from .errors import AllocationError, ContextError, InvalidCalculationRate, MomentClosed
+from .optimizers import optimize_requests
 from .requests import (
     AllocateBuffer,
     AllocateReadBuffer,
@@ -68,6 +75,7 @@ from .requests import (
     FreeBuffer,
     FreeGroupChildren,
     FreeGroupDeep,
+    FreeNode,
     FreeSynthDef,
     GenerateBuffer,
     LoadSynthDefDirectory,
@@ -81,6 +89,7 @@ from .requests import (
     NewGroup,
     NewParallelGroup,
     NewSynth,
+    NewSynths,
     NormalizeBuffer,
     OrderNodes,
     ReadBuffer,
@@ -100,6 +109,33 @@ from .requests import (
     ZeroBuffer,
 )
 
+_batch_local = threading.local()
+
+
+@contextlib.contextmanager
+def _batch_messages() -> Iterator[None]:
+    """
+    Collect messages from moments closed inside this block, on any context,
+    and send each context's run of messages together via ``send_many()`` on
+    exit.
+
+    Messages are discarded if the block raises, so a half-built batch never
+    reaches a server.
+    """
+    if getattr(_batch_local, "outbox", None) is not None:  # Already batching
+        yield
+        return
+    outbox: List[Tuple["Context", SupportsOsc]] = []
+    _batch_local.outbox = outbox
+    try:
+        yield
+    except BaseException:
+        _batch_local.outbox = None
+        raise
+    _batch_local.outbox = None
+    for context, group in itertools.groupby(outbox, key=lambda x: x[0]):
+        context.send_many([message for _, message in group])
+
 
 @dataclasses.dataclass
 class Moment:
@@ -134,15 +170,24 @@ class Moment:
         """
         self.context._pop_moment()
         requests = self.context._apply_completions(self.requests)
+        if self.context._optimize_moments:
+            requests = optimize_requests(requests)
         timestamp = (
             self.seconds + self.context._latency if self.seconds is not None else None
         )
+        message: Optional[Union[Request, RequestBundle]] = None
         if len(requests) and timestamp is not None:
-            self.context.send(RequestBundle(timestamp=timestamp, contents=requests))
+            message = RequestBundle(timestamp=timestamp, contents=requests)
         elif len(requests) > 1:
-            self.context.send(RequestBundle(contents=requests))
+            message = RequestBundle(contents=requests)
         elif len(requests):
-            self.context.send(requests[0])
+            message = requests[0]
+        if message is None:
+            pass
+        elif (outbox := getattr(_batch_local, "outbox", None)) is not None:
+            outbox.append((self.context, message))
+        else:
+            self.context.send(message)
         self.closed = True
 
 
@@ -199,12 +244,24 @@ class Context(metaclass=abc.ABCMeta):
     A synthesis execution context.
 
     :param options: The context's options.
+    :param block_allocator_class: The allocator class for buffer and bus IDs,
+        e.g. :py:class:`~supriya.contexts.allocators.BestFitBlockAllocator`.
+    :param optimize_moments: Flag for optimizing each moment's requests on exit,
+        via :py:func:`~supriya.contexts.optimizers.optimize_requests`.
     :param kwargs: Keyword arguments for options.
     """
 
     ### INITIALIZER ###
 
-    def __init__(self, options: Optional[Options], **kwargs) -> None:
+    def __init__(
+        self,
+        options: Optional[Options],
+        *,
+        block_allocator_class: Type[BlockAllocator] = BlockAllocator,
+        optimize_moments: bool = False,
+        **kwargs,
+    ) -> None:
+        self._block_allocator_class = block_allocator_class
         self._audio_bus_allocator = BlockAllocator()
         self._buffer_allocator = BlockAllocator()
         self._client_id = 0
@@ -212,6 +269,7 @@ class Context(metaclass=abc.ABCMeta):
         self._latency = 0.0
         self._lock = threading.RLock()
         self._node_id_allocator = NodeIdAllocator()
+        self._optimize_moments = optimize_moments
         self._options = new(options or Options(), **kwargs)
         self._sync_id = self._sync_id_minimum = 0
         self._sync_id_maximum = 32 << 26
@@ -269,6 +327,8 @@ class Context(metaclass=abc.ABCMeta):
         if type_ is Node:
             if permanent:
                 id_ = self._node_id_allocator.allocate_permanent_node_id()
+            elif node_ids := self._get_reserved_node_ids():
+                id_ = node_ids.popleft()
             else:
                 id_ = self._node_id_allocator.allocate_node_id()
         elif type_ is Buffer:
@@ -340,6 +400,12 @@ class Context(metaclass=abc.ABCMeta):
                 self._sync_id = self._sync_id_minimum
             return sync_id
 
+    def _get_reserved_node_ids(self) -> Optional[Deque[int]]:
+        reservations = self._thread_local.__dict__.get("node_id_reservations", [])
+        if not reservations:
+            return None
+        return reservations[-1]
+
     def _get_request_context(self) -> Optional[Union[Completion, Moment]]:
         moments = self._thread_local.__dict__.get("moments", [])
         completions = self._thread_local.__dict__.get("completions", [])
@@ -365,24 +431,40 @@ class Context(metaclass=abc.ABCMeta):
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         raise NotImplementedError
 
+    @staticmethod
+    def _resolve_synth_control(
+        parameter: Parameter, value
+    ) -> Union[float, str, Tuple[float, ...]]:
+        if parameter.parameter_rate is ParameterRate.SCALAR:
+            return float(value)
+        elif parameter.name in ("in_", "out"):
+            return float(value)
+        elif isinstance(value, Bus):
+            return value.map_symbol()
+        elif isinstance(value, str):
+            return value
+        elif isinstance(value, tuple):
+            return tuple((float(v) for v in value))
+        return float(value)
+
     def _setup_allocators(self) -> None:
         # audio buses
         audio_bus_minimum, audio_bus_maximum = self.options.get_audio_bus_ids(
             self.client_id
         )
-        self._audio_bus_allocator = BlockAllocator(
+        self._audio_bus_allocator = self._block_allocator_class(
             heap_minimum=audio_bus_minimum, heap_maximum=audio_bus_maximum
         )
         # control buses
         control_bus_minimum, control_bus_maximum = self.options.get_control_bus_ids(
             self.client_id
         )
-        self._control_bus_allocator = BlockAllocator(
+        self._control_bus_allocator = self._block_allocator_class(
             heap_minimum=control_bus_minimum, heap_maximum=control_bus_maximum
         )
         # buffers
         buffer_minimum, buffer_maximum = self.options.get_buffer_ids(self.client_id)
-        self._buffer_allocator = BlockAllocator(
+        self._buffer_allocator = self._block_allocator_class(
             heap_minimum=buffer_minimum, heap_maximum=buffer_maximum
         )
         # node IDs
@@ -614,18 +696,9 @@ class Context(metaclass=abc.ABCMeta):
             value = settings[parameter.name]
             if value == parameter.value:
                 continue
-            if parameter.parameter_rate is ParameterRate.SCALAR:
-                synthdef_kwargs[parameter.name] = float(value)
-            elif parameter.name in ("in_", "out"):
-                synthdef_kwargs[parameter.name] = float(value)
-            elif isinstance(value, Bus):
-                synthdef_kwargs[parameter.name] = value.map_symbol()
-            elif isinstance(value, str):
-                synthdef_kwargs[parameter.name] = value
-            elif isinstance(value, tuple):
-                synthdef_kwargs[parameter.name] = tuple((float(v) for v in value))
-            else:
-                synthdef_kwargs[parameter.name] = float(value)
+            synthdef_kwargs[parameter.name] = self._resolve_synth_control(
+                parameter, value
+            )
         id_ = self._allocate_id(Node, permanent=permanent)
         self._add_requests(
             NewSynth(
@@ -638,6 +711,93 @@ class Context(metaclass=abc.ABCMeta):
         )
         return Synth(context=self, id_=id_, synthdef=synthdef)
 
+    def add_synths(
+        self,
+        synthdef: SynthDef,
+        count: int,
+        *,
+        add_action: AddActionLike = AddAction.ADD_TO_HEAD,
+        target_node: Optional[SupportsInt] = None,
+        **settings,
+    ) -> SynthGroup:
+        """
+        Add many synth nodes sharing a SynthDef to the context.
+
+        Emit ``/s_new`` requests, one per synth, in a single bundle.
+
+        Each setting is either shared by every synth, or a sequence or NumPy array
+        holding one value per synth. For array-valued controls, per-synth values
+        are a sequence of sequences, or a two-dimensional array.
+
+        :param synthdef: The :term:`SynthDef` to use for the new synths.
+        :param count: The number of synths to add.
+        :param add_action: The :term:`add action` to use when placing the new synths.
+        :param target_node: The node to place the new synths relative to.
+        :param settings: The new synths' control settings.
+        """
+        self._validate_can_request()
+        if count < 1:
+            raise ValueError(count)
+        add_action_ = AddAction.from_expr(add_action)
+        if isinstance(target_node, Node):
+            if add_action_ not in target_node._valid_add_actions:
+                raise ValueError(add_action_)
+        target_node_id = self._resolve_node(target_node)
+        synthdef_kwargs: Dict[
+            Union[int, str],
+            Union[
+                SupportsFloat,
+                str,
+                Tuple[float, ...],
+                List[Union[SupportsFloat, str, Tuple[float, ...]]],
+            ],
+        ] = {}
+        for _, parameter in synthdef.indexed_parameters:
+            if parameter.name not in settings:
+                continue
+            value = settings[parameter.name]
+            if hasattr(value, "tolist"):  # NumPy arrays and scalars
+                value = value.tolist()
+            if isinstance(value, Sequence) and not isinstance(value, str):
+                values = list(value)
+                if len(parameter) == 1 or (
+                    values and all(isinstance(x, (list, tuple)) for x in values)
+                ):
+                    # One value per synth
+                    if len(values) != count:
+                        raise ValueError(parameter.name, len(values), count)
+                    synthdef_kwargs[parameter.name] = [
+                        self._resolve_synth_control(
+                            parameter, tuple(x) if isinstance(x, list) else x
+                        )
+                        for x in values
+                    ]
+                    continue
+                value = tuple(values)
+            if value == parameter.value:
+                continue
+            synthdef_kwargs[parameter.name] = self._resolve_synth_control(
+                parameter, value
+            )
+        # IDs wrapping around their range aren't contiguous, so skip ahead to the
+        # bottom of the range, which only wraps again if it can't fit the synths.
+        for _ in range(2):
+            node_ids = self._node_id_allocator.allocate_node_ids(count)
+            if node_ids[-1] - node_ids[0] == count - 1:
+                break
+        else:
+            raise ValueError(count)
+        self._add_requests(
+            NewSynths(
+                add_action=add_action_,
+                synth_ids=node_ids,
+                synthdef=synthdef,
+                target_node_id=target_node_id,
+                controls=synthdef_kwargs,
+            )
+        )
+        return SynthGroup(context=self, id_=node_ids[0], synthdef=synthdef, count=count)
+
     def add_synthdefs(
         self,
         *synthdefs: SynthDef,
@@ -668,6 +828,17 @@ class Context(metaclass=abc.ABCMeta):
         self._validate_moment_timestamp(seconds)
         return Moment(context=self, seconds=seconds)
 
+    def batch_messages(self) -> ContextManager[None]:
+        """
+        Batch the messages of moments closed inside a block.
+
+        Moments closed inside the block, on this or any other context in the
+        current thread, are sent together via ``send_many()`` when the block exits,
+        rather than one at a time as they close. Nested blocks join the outermost
+        block's batch. If the block raises, its messages are discarded.
+        """
+        return _batch_messages()
+
     def clear_schedule(self) -> None:
         """
         Clear all scheduled bundles.
@@ -872,6 +1043,27 @@ class Context(metaclass=abc.ABCMeta):
         )
         self._add_requests(request)
 
+    def free_synth_group(self, synth_group: SynthGroup, force: bool = False) -> None:
+        """
+        Free a synth group's synths.
+
+        Emit a single ``/n_free`` for synths without a ``gate`` control, or when
+        ``force`` is ``True``.
+
+        Emit ``/n_set <node_id> gate 0`` for each synth with a ``gate`` control.
+
+        :param synth_group: The synth group to free.
+        :param force: Flag for force-freeing, without releasing.
+        """
+        self._validate_can_request()
+        node_ids = range(synth_group.id_, synth_group.id_ + synth_group.count)
+        if force or "gate" not in synth_group.synthdef.parameters:
+            self._add_requests(FreeNode(node_ids=node_ids))
+        else:
+            self._add_requests(
+                *(ReleaseNode(node_id, has_gate=True) for node_id in node_ids)
+            )
+
     def free_synthdefs(self, *synthdefs: SynthDef) -> None:
         """
         Free one or more SynthDefs.
@@ -1149,6 +1341,29 @@ class Context(metaclass=abc.ABCMeta):
             )
         return self._add_request_with_completion(request, on_completion)
 
+    @contextlib.contextmanager
+    def reserve_node_ids(self, count: int) -> Iterator[List[int]]:
+        """
+        Reserve temporary node IDs for the current thread in a single step.
+
+        Groups and synths added by this thread inside the block take their IDs
+        from the reservation, in order, before falling back to allocating them
+        one at a time. Unused IDs are returned to the allocator on exit.
+
+        :param count: The number of node IDs to reserve.
+        """
+        node_ids = self._node_id_allocator.allocate_node_ids(count)
+        reservation = collections.deque(node_ids)
+        reservations = self._thread_local.__dict__.setdefault(
+            "node_id_reservations", []
+        )
+        reservations.append(reservation)
+        try:
+            yield node_ids
+        finally:
+            reservations.pop()
+            self._node_id_allocator.free_node_ids(list(reservation))
+
     @abc.abstractmethod
     def send(self, message: SupportsOsc):
         """
@@ -1158,6 +1373,15 @@ class Context(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def send_many(self, messages: Iterable[SupportsOsc]) -> None:
+        """
+        Send many messages to the execution context.
+
+        :param messages: The messages to send, in order.
+        """
+        for message in messages:
+            self.send(message)
+
     def set_buffer(self, buffer: Buffer, index: int, value: float) -> None:
         """
         Set a buffer sample.
@@ -1274,6 +1498,14 @@ class Context(metaclass=abc.ABCMeta):
         )
         self._add_requests(request)
 
+    def set_optimize_moments(self, optimize_moments: bool) -> None:
+        """
+        Set the context's moment optimization flag.
+
+        :param optimize_moments: Flag for optimizing each moment's requests on exit.
+        """
+        self._optimize_moments = bool(optimize_moments)
+
     def unpause_node(self, node: Node) -> None:
         """
         Unpause a node.
@@ -1386,6 +1618,13 @@ class Context(metaclass=abc.ABCMeta):
         """
         return self._latency
 
+    @property
+    def optimize_moments(self) -> bool:
+        """
+        Get the context's moment optimization flag.
+        """
+        return self._optimize_moments
+
     @property
     def options(self) -> Options:
         """
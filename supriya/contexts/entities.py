@@ -8,6 +8,7 @@ from typing import (
     Callable,
     Container,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -185,6 +186,29 @@ class Buffer(ContextObject):
         """
         return self.context.free_buffer(self, on_completion=on_completion)
 
+    def from_numpy(
+        self,
+        array: "numpy.ndarray",
+        *,
+        starting_frame: int = 0,
+        method: Optional[Literal["file", "osc"]] = None,
+    ) -> Union[Awaitable[None], None]:
+        """
+        Set the buffer's samples from an array.
+
+        Emit ``/b_read`` or ``/b_setn`` requests, depending on the array's size and
+        the server's locality.
+
+        :param array: The samples to write, of shape ``(frame_count, channel_count)``,
+            or interleaved if one-dimensional.
+        :param starting_frame: The frame to start writing at.
+        :param method: The transfer method, ``"file"`` or ``"osc"``, or None to pick
+            one automatically.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).set_buffer_array(
+            self, array, starting_frame=starting_frame, method=method
+        )
+
     def generate(
         self,
         command_name: Literal["sine1", "sine2", "sine3", "cheby"],
@@ -341,6 +365,22 @@ class Buffer(ContextObject):
         """
         self.context.set_buffer_range(buffer=self, index=index, values=values)
 
+    def to_numpy(
+        self, *, method: Optional[Literal["file", "osc"]] = None
+    ) -> Union[Awaitable["numpy.ndarray"], "numpy.ndarray"]:
+        """
+        Get the buffer's samples as an array of shape ``(frame_count, channel_count)``.
+
+        Emit ``/b_write`` or ``/b_getn`` requests, depending on the buffer's size and
+        the server's locality.
+
+        :param method: The transfer method, ``"file"`` or ``"osc"``, or None to pick
+            one automatically.
+        """
+        return cast(Union["AsyncServer", "Server"], self.context).get_buffer_array(
+            self, method=method
+        )
+
     def write(
         self,
         file_path: PathLike,
@@ -747,14 +787,14 @@ class Node(ContextObject):
         """
         Get the node's paused/unpaused status.
         """
-        return cast("BaseServer", self.context)._node_active.get(self.id_, True)
+        return cast("BaseServer", self.context)._node_tree.is_active(self.id_)
 
     @property
     def parent(self) -> Optional["Group"]:
         """
         Get the node's parent, as currently cached on the context.
         """
-        parent_id = cast("BaseServer", self.context)._node_parents.get(self.id_)
+        parent_id = cast("BaseServer", self.context)._node_tree.get_parent(self.id_)
         if parent_id is None:
             return None
         elif parent_id == 0:
@@ -767,8 +807,10 @@ class Node(ContextObject):
         Get the node's parentage, as currently cached on the context.
         """
         context = cast("BaseServer", self.context)
+        with context._lock:
+            parent_ids = context._node_tree.get_parentage(self.id_)[1:]
         parentage: List["Node"] = [self]
-        while (parent_id := context._node_parents.get(parentage[-1].id_)) is not None:
+        for parent_id in parent_ids:
             if parent_id:
                 parentage.append(Group(context=context, id_=parent_id))
             else:
@@ -803,9 +845,15 @@ class Group(Node):
         """
         Get the group's children, as currently cached on the context.
         """
+        node_tree = cast("BaseServer", self.context)._node_tree
+        with self.context._lock:
+            child_ids = [
+                (id_, node_tree.is_group(id_))
+                for id_ in node_tree.iterate_children(self.id_)
+            ]
         children: List[Node] = []
-        for id_ in cast("BaseServer", self.context)._node_children.get(self.id_, []):
-            if id_ in cast("BaseServer", self.context)._node_children:
+        for id_, is_group in child_ids:
+            if is_group:
                 children.append(Group(context=self.context, id_=id_))
             else:
                 # cannot get synthdef name without running /g_queryTree
@@ -885,3 +933,44 @@ class Synth(Node):
     @property
     def _valid_add_actions(self) -> Container[int]:
         return (AddAction.ADD_AFTER, AddAction.ADD_BEFORE, AddAction.REPLACE)
+
+
+@dataclasses.dataclass(frozen=True)
+class SynthGroup(ContextObject):
+    r"""
+    A group of synth nodes sharing a SynthDef, with contiguous IDs.
+
+    Not a :py:class:`Group` node, but a compact handle on synths added together
+    via :py:meth:`~supriya.contexts.core.Context.add_synths`.
+
+    :param context: The synth group's context.
+    :param id\_: The first synth's context ID.
+    :param synthdef: The synths' SynthDef.
+    :param count: The number of synths.
+    """
+
+    synthdef: SynthDef
+    count: int = 1
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return tuple(self[i] for i in range(self.count)[item])
+        index = range(self.id_, self.id_ + self.count)[item]
+        return Synth(context=self.context, id_=index, synthdef=self.synthdef)
+
+    def __iter__(self) -> Iterator[Synth]:
+        for id_ in range(self.id_, self.id_ + self.count):
+            yield Synth(context=self.context, id_=id_, synthdef=self.synthdef)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def free(self, force: bool = False) -> None:
+        """
+        Free the synth group's synths.
+
+        Emit ``/n_free`` or ``/n_set`` requests.
+
+        :param force: Flag for force-freeing, without releasing.
+        """
+        self.context.free_synth_group(self, force=force)
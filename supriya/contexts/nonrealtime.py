@@ -3,27 +3,62 @@ Tools for interacting with non-realtime execution contexts.
 """
 
 import asyncio
+import bisect
 import hashlib
+import itertools
 import logging
+import math
+import os
 import platform
 import shutil
 import struct
+import warnings
+from collections import Counter
 from contextlib import ExitStack
 from os import PathLike
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Dict, Iterator, List, Optional, SupportsInt, Tuple, Type, Union
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    SupportsInt,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from uqbar.objects import new
 
 from ..assets.synthdefs import system_synthdefs
 from ..enums import CalculationRate, HeaderFormat, SampleFormat
+from ..exceptions import NonrealtimeRenderError
+from ..io import RenderCache, _render_many
 from ..osc import OscBundle
 from ..scsynth import AsyncNonrealtimeProcessProtocol, Options
 from ..typing import HeaderFormatLike, SampleFormatLike, SupportsOsc
 from ..ugens import SynthDef
 from .core import Context, ContextError, ContextObject, Node
-from .requests import DoNothing, RequestBundle, Requestable
+from .requests import (
+    AllocateReadBuffer,
+    AllocateReadBufferChannel,
+    DoNothing,
+    ReadBuffer,
+    ReadBufferChannel,
+    RequestBundle,
+    Requestable,
+)
+from .segments import ScoreState, stitch_segments
+
+if TYPE_CHECKING:
+    from hashlib import _Hash
 
 logger = logging.getLogger(__name__)
 
@@ -40,13 +75,14 @@ class Score(Context):
 
     def __init__(self, options: Optional[Options] = None, **kwargs):
         super().__init__(options=options, **kwargs)
+        self._datagrams: Dict[float, bytes] = {}
         self._requests: Dict[float, List[Requestable]] = {}
+        self._timestamps: List[float] = []
 
     ### CLASS METHODS ###
 
     async def __render__(
         self,
-        *,
         output_file_path: Optional[PathLike] = None,
         render_directory_path: Optional[PathLike] = None,
         **kwargs,
@@ -59,6 +95,34 @@ class Score(Context):
 
     ### PRIVATE METHODS ###
 
+    def _build_progress_callback(
+        self,
+        on_progress: Optional[Callable[[float], None]],
+        duration: Optional[float],
+    ) -> Optional[Callable[[float], None]]:
+        if on_progress is None:
+            return None
+        total_duration = self._get_duration(duration)
+
+        def callback(timestamp: float) -> None:
+            if total_duration > 0:
+                on_progress(min(timestamp / total_duration, 1.0))
+
+        return callback
+
+    def _extend_requests(
+        self, timestamp: float, requestables: Sequence[Requestable]
+    ) -> None:
+        if (requests := self._requests.get(timestamp)) is None:
+            requests = self._requests[timestamp] = []
+            # scores are mostly built in order, so skip bisecting when appending
+            if not self._timestamps or timestamp > self._timestamps[-1]:
+                self._timestamps.append(timestamp)
+            else:
+                bisect.insort(self._timestamps, timestamp)
+        requests.extend(requestables)
+        self._datagrams.pop(timestamp, None)
+
     def _free_id(
         self,
         type_: Type[ContextObject],
@@ -67,11 +131,85 @@ class Score(Context):
     ) -> None:
         pass
 
+    def _get_duration(self, duration: Optional[float] = None) -> float:
+        if duration:
+            return duration
+        return self._timestamps[-1] if self._timestamps else 0.0
+
+    def _get_datagram(self, timestamp: float, cache: bool = False) -> bytes:
+        # Datagrams are immutable, so can be shared until more requests are added
+        if (datagram := self._datagrams.get(timestamp)) is None:
+            datagram = (
+                self._get_request_bundle(timestamp).to_osc().to_datagram(realtime=False)
+            )
+            if cache:
+                self._datagrams[timestamp] = datagram
+        return datagram
+
+    def _get_request_bundle(self, timestamp: float) -> RequestBundle:
+        return RequestBundle(
+            timestamp=timestamp, contents=list(self._requests[timestamp])
+        )
+
+    def _get_until_request_bundle(self, stop_index: int, until: float) -> RequestBundle:
+        timestamps = self._timestamps
+        if stop_index < len(timestamps) and timestamps[stop_index] == until:
+            return RequestBundle(
+                timestamp=until, contents=self._requests[until] + [DoNothing()]
+            )
+        return RequestBundle(timestamp=until, contents=[DoNothing()])
+
+    def _hash_input_files(
+        self,
+        hasher: "_Hash",
+        input_file_path: Optional[PathLike],
+        render_directory_path: Path,
+    ) -> None:
+        # scsynth reads the input file and any soundfiles buffers are read from,
+        # relative to the render directory, so their sizes and modification times
+        # are part of what determines a render.
+        paths = [input_file_path] if input_file_path else []
+        for timestamp in self._timestamps:
+            requestables = list(self._requests[timestamp])
+            while requestables:
+                requestable = requestables.pop()
+                if isinstance(requestable, RequestBundle):
+                    requestables.extend(requestable.contents)
+                    continue
+                if isinstance(
+                    requestable,
+                    (
+                        AllocateReadBuffer,
+                        AllocateReadBufferChannel,
+                        ReadBuffer,
+                        ReadBufferChannel,
+                    ),
+                ):
+                    paths.append(requestable.path)
+                if on_completion := getattr(requestable, "on_completion", None):
+                    requestables.append(on_completion)
+        for path in paths:
+            path_ = render_directory_path / path
+            try:
+                stat = path_.stat()
+            except OSError:
+                hasher.update(f"{path_}:missing".encode())
+            else:
+                hasher.update(f"{path_}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         if node is None:
             return 0
         return int(node)
 
+    def _slice_timestamps(
+        self, start: Optional[float], until: Optional[float]
+    ) -> Tuple[int, int]:
+        timestamps = self._timestamps
+        index = 0 if start is None else bisect.bisect_left(timestamps, start)
+        stop_index = bisect.bisect_left(timestamps, until) if until else len(timestamps)
+        return index, stop_index
+
     def _validate_can_request(self) -> None:
         if self._get_moment() is None:
             raise ContextError
@@ -82,13 +220,59 @@ class Score(Context):
 
     ### PUBLIC METHODS ###
 
+    def find_quiet_points(self, until: Optional[float] = None) -> List[float]:
+        """
+        Find the timestamps the score is quiet at, to split it at.
+
+        The score is quiet wherever no synth it eventually frees or releases is
+        playing. Synths never freed, e.g. effects running for the whole score,
+        don't count: splitting the score rebuilds them, and each segment's pre-roll
+        refills their state. Synths freeing themselves via done actions count as
+        playing until their lines or envelopes run their course, or for the rest of
+        the score if how long they run for is unknown.
+
+        :param until: Timestamp to stop searching at.
+
+        :return: The quiet timestamps, strictly inside the score, in order.
+        """
+        total_duration = self._get_duration(until)
+        state = ScoreState()
+        timestamps = self._timestamps[
+            : bisect.bisect_left(self._timestamps, total_duration)
+        ]
+        for timestamp in timestamps:
+            for request in self._requests[timestamp]:
+                state.apply(request, timestamp)
+        lifetimes = state.lifetimes + [
+            (synth.started, math.inf if synth.expires is None else synth.expires)
+            for synth in state.synths.values()
+            if synth.frees_itself
+        ]
+        lifetimes = [(start, stop) for start, stop in lifetimes if start < stop]
+        starts = Counter(start for start, _ in lifetimes)
+        # done actions may free synths between timestamps
+        stops = sorted(stop for _, stop in lifetimes)
+        quiet_points: List[float] = []
+        playing_count = stop_index = 0
+        for timestamp in timestamps:
+            while stop_index < len(stops) and stops[stop_index] <= timestamp:
+                playing_count -= 1
+                stop_index += 1
+            if not playing_count and timestamp > 0:
+                quiet_points.append(timestamp)
+            playing_count += starts[timestamp]
+        return quiet_points
+
     async def render(
         self,
         output_file_path: Optional[PathLike] = None,
         *,
+        cache: Union[bool, RenderCache] = True,
         duration: Optional[float] = None,
         header_format: HeaderFormatLike = HeaderFormat.AIFF,
         input_file_path: Optional[PathLike] = None,
+        memory_budget: int = 2**20,
+        on_progress: Optional[Callable[[float], None]] = None,
         options: Optional[Options] = None,
         render_directory_path: Optional[PathLike] = None,
         sample_format: SampleFormatLike = SampleFormat.INT24,
@@ -99,9 +283,21 @@ class Score(Context):
         """
         Render the score.
 
+        Renders are cached by digest, so rendering an unchanged score again copies
+        or returns the cached output without running ``scsynth``. Digests cover the
+        sizes and modification times of the input file and of any soundfiles read
+        into buffers, and only successful renders are cached.
+
+        :param cache: The :py:class:`~supriya.io.RenderCache` to look up and publish
+            renders in, ``True`` for the default render cache, or ``False`` to always
+            render.
         :param duration: Optional duration to render the score until.
         :param header_format: The :term:`header format` to render with.
         :param input_file_path: The input file to render with.
+        :param memory_budget: The number of bytes of the score's OSC stream to buffer
+            before writing them to disk.
+        :param on_progress: An optional callback, called with the fraction of the
+            score rendered so far as ``scsynth`` progresses.
         :param options: The context's options.
         :param render_directory_path: The directory to render the output in. This
             affords using relative paths and (therefore) stable hashes when rendering
@@ -115,7 +311,8 @@ class Score(Context):
         :return: A pair of the output path (if output exists) and the process exit code.
             If no output file path was provided, one will be generated based on the hash
             of the score's datagram, its input file (if provided) and any flags to
-            ``scsynth`` that affect rendering.
+            ``scsynth`` that affect rendering. Failed cached renders without an output
+            file path have no output path.
         """
         from .. import output_path
 
@@ -124,12 +321,6 @@ class Score(Context):
         sample_format_ = SampleFormat.from_expr(sample_format).name.lower()
         # build initial command
         command = new(options or self._options, **kwargs, realtime=False).serialize()
-        # build datagram
-        datagram_pieces: List[bytes] = []
-        for datagram_piece in self.iterate_datagrams(until=duration):
-            datagram_pieces.append(struct.pack(">i", len(datagram_piece)))
-            datagram_pieces.append(datagram_piece)
-        datagram = b"".join(datagram_pieces)
         # setup render directory
         exit_stack = ExitStack()
         with exit_stack:
@@ -145,14 +336,26 @@ class Score(Context):
             input_file_path_ = "_"  # underscore, not dash
             if input_file_path:
                 input_file_path_ = str(Path(input_file_path).resolve())
-            # build file name
+            # stream datagrams to disk, hashing them on the way
             hasher = hashlib.sha256()
-            hasher.update(datagram)
+            with NamedTemporaryFile(
+                "wb", delete=False, dir=render_directory_path_, suffix=".osc"
+            ) as file_pointer:
+                exit_stack.callback(Path(file_pointer.name).unlink, missing_ok=True)
+                self.write_datagrams(
+                    file_pointer,
+                    hasher=hasher,
+                    memory_budget=memory_budget,
+                    until=duration,
+                )
+            # build file name
             hasher.update((" ".join(command[1:])).encode())
             hasher.update(input_file_path_.encode())
             hasher.update(str(sample_rate).encode())
+            self._hash_input_files(hasher, input_file_path, render_directory_path_)
             digest = hasher.hexdigest()
             # build render file path and output file path
+            render_cache = None
             if suppress_output:
                 render_file_name = (
                     "NUL" if platform.system() == "Windows" else "/dev/null"
@@ -160,12 +363,20 @@ class Score(Context):
                 output_file_path_ = None
             else:
                 render_file_name = f"score-{digest}.{header_format_}"
+                # skip rendering entirely on cache hits
+                if (render_cache := RenderCache.from_expr(cache)) is not None and (
+                    cached_path := render_cache.get(render_file_name)
+                ) is not None:
+                    if output_file_path is None:
+                        return cached_path, 0
+                    shutil.copy(cached_path, output_file_path)
+                    return Path(output_file_path), 0
                 output_file_path_ = Path(
                     output_file_path or (output_path / render_file_name)
                 )
-            # write .osc file
+            # publish .osc file
             osc_file_name = f"score-{digest}.osc"
-            (render_directory_path_ / osc_file_name).write_bytes(datagram)
+            Path(file_pointer.name).replace(render_directory_path_ / osc_file_name)
             # build nonrealtime command
             command.extend(
                 [
@@ -180,56 +391,265 @@ class Score(Context):
             )
             # render the datagram
             exit_future = asyncio.get_running_loop().create_future()
-            protocol = AsyncNonrealtimeProcessProtocol(exit_future)
+            protocol = AsyncNonrealtimeProcessProtocol(
+                exit_future,
+                on_progress=self._build_progress_callback(on_progress, duration),
+            )
             await protocol.run(command, render_directory_path_)
-            exit_code: int = await exit_future
-            assert render_directory_path_ / render_file_name
+            try:
+                exit_code: int = await exit_future
+            except asyncio.CancelledError:
+                protocol.kill()
+                raise
             if output_file_path_:
-                shutil.copy(
-                    render_directory_path_ / render_file_name, output_file_path_
-                )
+                rendered_path = render_directory_path_ / render_file_name
+                if render_cache is None:
+                    shutil.copy(rendered_path, output_file_path_)
+                elif exit_code:
+                    # only successful renders may ever be written into the cache
+                    if output_file_path is None:
+                        return None, exit_code
+                    shutil.copy(rendered_path, output_file_path_)
+                else:
+                    cached_path = render_cache.publish(render_file_name, rendered_path)
+                    if output_file_path is None:
+                        return cached_path, exit_code
+                    shutil.copy(cached_path, output_file_path_)
         return output_file_path_, exit_code
 
-    def iterate_datagrams(self, until: Optional[float] = None) -> Iterator[bytes]:
+    async def render_segmented(
+        self,
+        output_file_path: Optional[PathLike] = None,
+        *,
+        boundaries: Optional[Sequence[float]] = None,
+        cache: Union[bool, RenderCache] = True,
+        crossfade: float = 0.01,
+        duration: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+        options: Optional[Options] = None,
+        preroll: float = 1.0,
+        render_directory_path: Optional[PathLike] = None,
+        sample_rate: float = 44100,
+        tolerance: float = 1e-4,
+        verify: bool = False,
+        **kwargs,
+    ) -> Tuple[Optional[Path], int]:
+        """
+        Render the score in segments, in parallel, and stitch them together.
+
+        The score is split via :py:meth:`split`, each segment rendering on its own
+        ``scsynth`` process, and their renders are crossfaded together. Segments
+        are cached like any other render, so re-rendering an edited score only
+        re-renders the segments the edit touches.
+
+        Segments are rendered and stitched as 32-bit float WAV files, so the
+        crossfades don't requantize samples.
+
+        :param boundaries: The timestamps to split the score at. If omitted, the
+            score is split into ``max_workers`` segments of roughly equal duration,
+            at the nearest of its :py:meth:`quiet points <find_quiet_points>`.
+        :param cache: The :py:class:`~supriya.io.RenderCache` to look up and publish
+            segment renders in, ``True`` for the default render cache, or ``False``
+            to always render.
+        :param crossfade: The duration to crossfade between segments over, in
+            seconds.
+        :param duration: Optional duration to render the score until.
+        :param max_workers: The maximum number of segments to render at once,
+            defaulting to the number of CPUs.
+        :param on_progress: An optional callback, called with the fraction of the
+            score rendered so far, across all segments.
+        :param options: The context's options.
+        :param preroll: The duration each segment starts early by, in seconds.
+        :param render_directory_path: The directory to render segments in.
+        :param sample_rate: The sample rate to render at.
+        :param tolerance: The largest sample difference verification allows.
+        :param verify: Flag for also rendering the score whole, and raising
+            :py:class:`~supriya.exceptions.NonrealtimeRenderError` if any sample
+            of the stitched render differs from it by more than ``tolerance``.
+        :param kwargs: Keyword arguments for options.
+
+        :return: A pair of the output path (if every segment rendered) and the
+            first non-zero segment exit code, if any.
+        """
+        import numpy
+
+        from .. import output_path
+        from ..soundfiles import read_float_wav, write_float_wav
+
+        max_workers = max_workers or os.cpu_count() or 1
+        options_ = new(options or self._options, **kwargs)
+        total_duration = self._get_duration(duration)
+        if boundaries is None:
+            quiet_points = self.find_quiet_points(until=total_duration)
+            boundaries = []
+            for i in range(1, max_workers if quiet_points else 1):
+                target = total_duration * i / max_workers
+                point = min(quiet_points, key=lambda x: abs(x - target))
+                if (
+                    point - (boundaries[-1] if boundaries else 0.0) > crossfade
+                    and total_duration - point > crossfade
+                ):
+                    boundaries.append(point)
+        segments = self.split(
+            boundaries,
+            crossfade=crossfade,
+            duration=total_duration,
+            options=options_,
+            preroll=preroll,
+            sample_rate=sample_rate,
+        )
+        logger.info(f"Rendering {len(segments)} segments")
+        render_kwargs: Dict[str, Any] = dict(
+            cache=cache,
+            header_format=HeaderFormat.WAV,
+            options=options_,
+            sample_format=SampleFormat.FLOAT,
+            sample_rate=sample_rate,
+        )
+        segment_on_progress: Optional[Callable[[int, float], None]] = None
+        if (callback := on_progress) is not None:
+            fractions = [0.0] * len(segments)
+            weights = [
+                score._get_duration() / total_duration if total_duration else 1.0
+                for _, score in segments
+            ]
+
+            def report_progress(index: int, fraction: float) -> None:
+                fractions[index] = fraction
+                callback(min(sum(x * y for x, y in zip(fractions, weights)), 1.0))
+
+            segment_on_progress = report_progress
+        rendering = _render_many(
+            [score for _, score in segments],
+            max_workers,
+            segment_on_progress,
+            render_directory_path,
+            render_kwargs,
+        )
+        if verify:
+            # render the whole score alongside its segments, to compare against
+            segment_results, (expected_path, exit_code) = await asyncio.gather(
+                rendering,
+                self.render(
+                    duration=total_duration,
+                    render_directory_path=render_directory_path,
+                    **render_kwargs,
+                ),
+            )
+            if exit_code:
+                return None, exit_code
+        else:
+            segment_results = await rendering
+        for path, exit_code in segment_results:
+            if exit_code or path is None:
+                return None, exit_code
+        # stitch the segments, crossfading at each boundary
+        boundary_frames = [round(x * sample_rate) for x in boundaries]
+        crossfade_frames = round(crossfade * sample_rate)
+        hasher = hashlib.sha256()
+        hasher.update(f"{boundary_frames} {crossfade_frames}".encode())
+        segment_arrays = []
+        for (starting_frame, _), (path, _) in zip(segments, segment_results):
+            hasher.update(f"{starting_frame} {cast(Path, path).name}".encode())
+            segment_arrays.append((starting_frame, read_float_wav(cast(Path, path))))
+        array = stitch_segments(segment_arrays, boundary_frames, crossfade_frames)
+        output_file_path_ = Path(
+            output_file_path
+            or output_path / f"score-segmented-{hasher.hexdigest()}.wav"
+        )
+        write_float_wav(output_file_path_, array, sample_rate)
+        if verify:
+            expected = read_float_wav(cast(Path, expected_path))
+            frame_count = min(len(array), len(expected))
+            difference = float(
+                numpy.max(
+                    numpy.abs(array[:frame_count] - expected[:frame_count]),
+                    initial=0.0,
+                )
+            )
+            logger.info(f"Segmented render differs by at most {difference}")
+            if len(array) != len(expected) or difference > tolerance:
+                raise NonrealtimeRenderError(
+                    f"Segmented render differs from whole render: "
+                    f"{len(array)} vs {len(expected)} frames, "
+                    f"samples differ by up to {difference}"
+                )
+        return output_file_path_, 0
+
+    def iterate_datagrams(
+        self,
+        start: Optional[float] = None,
+        until: Optional[float] = None,
+        *,
+        cache: bool = False,
+    ) -> Iterator[bytes]:
         """
         Iterate datagrams.
 
+        Datagrams are encoded as they're iterated, and only kept if ``cache`` is
+        true, e.g. for repeatedly previewing a growing score. Kept datagrams are
+        reused by every later iteration, until requests are added at their
+        timestamp.
+
+        :param start: Timestamp to start iterating at.
         :param until: Timestamp to stop iterating at.
+        :param cache: Flag for keeping the datagrams encoded.
         """
-        for osc_bundle in self.iterate_osc_bundles(until=until):
-            yield osc_bundle.to_datagram(realtime=False)
+        index, stop_index = self._slice_timestamps(start, until)
+        for timestamp in itertools.islice(self._timestamps, index, stop_index):
+            if self._requests[timestamp]:
+                yield self._get_datagram(timestamp, cache)
+        if until:
+            yield self._get_until_request_bundle(
+                max(index, stop_index), until
+            ).to_osc().to_datagram(realtime=False)
 
-    def iterate_osc_bundles(self, until: Optional[float] = None) -> Iterator[OscBundle]:
+    def iterate_osc_bundles(
+        self, start: Optional[float] = None, until: Optional[float] = None
+    ) -> Iterator[OscBundle]:
         """
         Iterate OSC bundles.
 
+        :param start: Timestamp to start iterating at.
         :param until: Timestamp to stop iterating at.
         """
-        for request_bundle in self.iterate_request_bundles(until=until):
+        for request_bundle in self.iterate_request_bundles(start=start, until=until):
             yield request_bundle.to_osc()
 
     def iterate_request_bundles(
-        self, until: Optional[float] = None
+        self, start: Optional[float] = None, until: Optional[float] = None
     ) -> Iterator[RequestBundle]:
         """
         Iterate request bundles.
 
+        Timestamps are kept sorted as requests are added, so iterating a range of
+        a long score only visits that range.
+
+        ::
+
+            >>> from supriya.contexts.nonrealtime import Score
+            >>> score = Score()
+            >>> for timestamp in [3.0, 1.0, 2.0, 0.0]:
+            ...     with score.at(timestamp):
+            ...         group = score.add_group()
+            ...
+            >>> for bundle in score.iterate_request_bundles(start=1.0, until=2.5):
+            ...     bundle.timestamp, bundle.contents
+            ...
+            (1.0, [NewGroup(items=[(1001, AddAction.ADD_TO_HEAD, 0)])])
+            (2.0, [NewGroup(items=[(1002, AddAction.ADD_TO_HEAD, 0)])])
+            (2.5, [DoNothing()])
+
+        :param start: Timestamp to start iterating at.
         :param until: Timestamp to stop iterating at.
         """
-        for timestamp, requests in sorted(self._requests.items()):
-            if until:
-                if timestamp == until:
-                    yield RequestBundle(
-                        timestamp=timestamp, contents=requests + [DoNothing()]
-                    )
-                    return
-                elif timestamp > until:
-                    yield RequestBundle(timestamp=until, contents=[DoNothing()])
-                    return
-            if requests:
-                yield RequestBundle(timestamp=timestamp, contents=requests)
-        if until and until > timestamp:
-            yield RequestBundle(timestamp=until, contents=[DoNothing()])
+        index, stop_index = self._slice_timestamps(start, until)
+        for timestamp in itertools.islice(self._timestamps, index, stop_index):
+            if self._requests[timestamp]:
+                yield self._get_request_bundle(timestamp)
+        if until:
+            yield self._get_until_request_bundle(max(index, stop_index), until)
 
     def send(self, message: SupportsOsc) -> None:
         """
@@ -241,7 +661,7 @@ class Score(Context):
             raise ContextError
         elif message.timestamp is None:
             raise ContextError
-        self._requests.setdefault(message.timestamp, []).extend(message.contents)
+        self._extend_requests(message.timestamp, message.contents)
 
     def setup_system_synthdefs(self) -> None:
         """
@@ -254,3 +674,157 @@ class Score(Context):
                 synthdefs.append(synthdef)
         with self.at(0):
             self.add_synthdefs(*synthdefs)
+
+    def split(
+        self,
+        boundaries: Sequence[float],
+        *,
+        crossfade: float = 0.01,
+        duration: Optional[float] = None,
+        options: Optional[Options] = None,
+        preroll: float = 1.0,
+        sample_rate: float = 44100,
+    ) -> List[Tuple[int, "Score"]]:
+        """
+        Split the score into segments which render independently.
+
+        Each segment covers the score from one boundary up to the next, plus
+        ``crossfade`` seconds past it, but starts ``preroll`` seconds early, and
+        opens by rebuilding the state the score's earlier requests left behind, via
+        :py:class:`~supriya.contexts.segments.ScoreState`: SynthDefs, buffers,
+        buses, groups, and any synths still playing, with their controls as last
+        set. Rebuilt synths start from scratch, so the pre-roll should outlast any
+        envelope, release or effect tail crossing into a segment, and splitting at
+        :py:meth:`quiet points <find_quiet_points>` keeps segments exact. Synths
+        freeing themselves via done actions are only rebuilt if still playing when
+        a segment starts, with a warning if they may still be playing at its
+        boundary, as their rebuilt lines and envelopes restart too.
+
+        Segment starts are rounded down to the nearest control block, so every
+        bundle executes on the same sample it would in the whole score.
+
+        ::
+
+            >>> from supriya import default
+            >>> from supriya.contexts.nonrealtime import Score
+            >>> score = Score()
+            >>> with score.at(0):
+            ...     with score.add_synthdefs(default):
+            ...         synth = score.add_synth(default)
+            ...
+            >>> with score.at(2):
+            ...     synth.free()
+            ...
+            >>> with score.at(4):
+            ...     score.do_nothing()
+            ...
+            >>> for starting_frame, segment in score.split([3.0], preroll=0.5):
+            ...     starting_frame
+            ...     for bundle in segment.iterate_osc_bundles():
+            ...         bundle.timestamp, [x.address for x in bundle.contents]
+            ...
+            0
+            (0.0, ['/d_recv'])
+            (2.0, ['/n_set'])
+            (3.01, [0])
+            110208
+            (0.0, ['/d_recv'])
+            (1.500952380952381, [0])
+
+        :param boundaries: The timestamps to split the score at.
+        :param crossfade: The duration to crossfade between segments over, in
+            seconds.
+        :param duration: Optional duration to split the score until.
+        :param options: The options the segments will be rendered with.
+        :param preroll: The duration each segment starts early by, in seconds.
+        :param sample_rate: The sample rate the segments will be rendered at.
+
+        :return: Pairs of each segment's starting frame and score.
+        """
+        total_duration = self._get_duration(duration)
+        edges = [0.0, *sorted(boundaries), total_duration]
+        for previous, next_ in zip(edges, edges[1:]):
+            if next_ - previous <= crossfade:
+                raise ValueError(boundaries)
+        options_ = options or self._options
+        timestamps = self._timestamps
+        state = ScoreState()
+        segments: List[Tuple[int, "Score"]] = []
+        index = 0
+        for i, edge in enumerate(edges[:-1]):
+            starting_frame = (
+                math.floor(max(edge - preroll, 0.0) * sample_rate / options_.block_size)
+                * options_.block_size
+            )
+            start = starting_frame / sample_rate
+            while index < len(timestamps) and timestamps[index] < start:
+                for request in self._requests[timestamps[index]]:
+                    state.apply(request, timestamps[index])
+                index += 1
+            state.expire(start)
+            for synth_id, synth in state.synths.items():
+                if synth.frees_itself and (
+                    synth.expires is None or synth.expires > edge
+                ):
+                    warnings.warn(
+                        f"Synth {synth_id} frees itself via a done action, "
+                        f"so can't be rebuilt exactly at {edge}"
+                    )
+            is_last = i + 2 == len(edges)
+            stop = total_duration if is_last else edges[i + 1] + crossfade
+            segment = Score(options=options_)
+            segment._extend_requests(0.0, state.to_requests())
+            for timestamp in timestamps[index:]:
+                if timestamp > stop or (timestamp == stop and not is_last):
+                    break
+                segment._extend_requests(timestamp - start, self._requests[timestamp])
+            if stop - start not in segment._requests:
+                segment._extend_requests(stop - start, [DoNothing()])
+            segments.append((starting_frame, segment))
+        return segments
+
+    def write_datagrams(
+        self,
+        file_pointer: IO[bytes],
+        *,
+        hasher: Optional["_Hash"] = None,
+        memory_budget: int = 2**20,
+        until: Optional[float] = None,
+    ) -> int:
+        """
+        Write datagrams to a binary file, each prefixed with its length.
+
+        This is the format ``scsynth`` reads non-realtime scores in. Bundles are
+        encoded one at a time and written out whenever ``memory_budget`` bytes are
+        pending, so the score's OSC stream is never held in memory whole.
+
+        :param file_pointer: The binary file to write to.
+        :param hasher: An optional :py:mod:`hashlib` hash object to update with the
+            bytes written.
+        :param memory_budget: The number of bytes to buffer between writes.
+        :param until: Timestamp to stop iterating at.
+
+        :return: The number of bytes written.
+        """
+        pieces: List[bytes] = []
+        pending_size = written_size = 0
+        for datagram in self.iterate_datagrams(until=until):
+            pieces.append(struct.pack(">i", len(datagram)))
+            pieces.append(datagram)
+            pending_size += len(datagram) + 4
+            if pending_size < memory_budget:
+                continue
+            chunk = b"".join(pieces)
+            if hasher is not None:
+                hasher.update(chunk)
+            file_pointer.write(chunk)
+            written_size += pending_size
+            pieces.clear()
+            pending_size = 0
+        if pieces:
+            chunk = b"".join(pieces)
+            if hasher is not None:
+                hasher.update(chunk)
+            file_pointer.write(chunk)
+            written_size += pending_size
+        return written_size
@@ -0,0 +1,435 @@
+"""
+Moment-wide request optimization.
+
+Requests made inside a moment are performed by the server one after another,
+with no audio calculated in between, so only the state they leave behind is
+observable, short of requests which read state back. Within that model,
+:py:func:`optimize_requests` rewrites a moment's requests into fewer, larger
+ones:
+
+- nodes created and freed within the moment, and never used as a target by
+  any other request, are never created at all
+- node control and control bus writes overwritten later in the moment are
+  dropped
+- requests of the same kind are merged across the moment, wherever every
+  request in between commutes with them
+
+Requests which aren't understood act as barriers, and nothing is moved or
+dropped across them.
+"""
+
+from typing import (
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from ..enums import AddAction
+from .requests import (
+    NODE_CONTROL_RANGE_REQUESTS,
+    FillBuffer,
+    FillControlBusRange,
+    FreeGroupChildren,
+    FreeGroupDeep,
+    FreeNode,
+    MapAudioBusToNode,
+    MapControlBusToNode,
+    MoveNodeAfter,
+    MoveNodeBefore,
+    MoveNodeToGroupHead,
+    MoveNodeToGroupTail,
+    NewGroup,
+    NewParallelGroup,
+    NewSynth,
+    NewSynths,
+    OrderNodes,
+    ReleaseNode,
+    Request,
+    RunNode,
+    SetBuffer,
+    SetBufferRange,
+    SetControlBus,
+    SetControlBusRange,
+    SetNodeControl,
+)
+
+# A key of ``None`` stands for any control, bus or buffer, e.g. for
+# integer-indexed controls, which may alias named ones.
+_ANY_BUFFER: Tuple[Hashable, ...] = ("buffer", None)
+_ANY_BUS: Tuple[Hashable, ...] = ("bus", None)
+_ANY_CONTROL: Tuple[Hashable, ...] = ("control", None)
+_TREE: Tuple[Hashable, ...] = ("tree",)
+
+_MAP_REQUESTS = (MapAudioBusToNode, MapControlBusToNode)
+_MOVE_REQUESTS = (
+    MoveNodeAfter,
+    MoveNodeBefore,
+    MoveNodeToGroupHead,
+    MoveNodeToGroupTail,
+)
+_NEW_GROUP_REQUESTS = (NewGroup, NewParallelGroup)
+
+# Requests whose ``merge()`` folds any run of them sharing a merge key into a
+# single request.
+_MERGEABLE_REQUESTS = (
+    FillBuffer,
+    FillControlBusRange,
+    NewGroup,
+    NewParallelGroup,
+    RunNode,
+    SetBuffer,
+    SetBufferRange,
+    SetControlBus,
+    SetControlBusRange,
+)
+
+
+def _get_control_key(control) -> Tuple[Hashable, ...]:
+    if isinstance(control, str):
+        return ("control", control)
+    return _ANY_CONTROL
+
+
+def _get_node_ids(request: Request) -> Optional[Set[int]]:
+    """
+    Get the IDs of every node a request refers to, or ``None`` if unknown.
+    """
+    if isinstance(request, (SetNodeControl, ReleaseNode)):
+        return {int(request.node_id)}
+    elif isinstance(request, _MAP_REQUESTS + NODE_CONTROL_RANGE_REQUESTS):
+        return {int(request.node_id)}
+    elif isinstance(request, NewSynth):
+        return {int(request.synth_id), int(request.target_node_id)}
+    elif isinstance(request, NewSynths):
+        return {int(request.target_node_id), *(int(x) for x in request.synth_ids)}
+    elif isinstance(request, _NEW_GROUP_REQUESTS):
+        return {
+            int(node_id)
+            for group_id, _, target_node_id in request.items
+            for node_id in (group_id, target_node_id)
+        }
+    elif isinstance(request, _MOVE_REQUESTS):
+        return {int(node_id) for item in request.items for node_id in item}
+    elif isinstance(request, RunNode):
+        return {int(node_id) for node_id, _ in request.items}
+    elif isinstance(request, (FreeGroupChildren, FreeGroupDeep, FreeNode)):
+        return {int(node_id) for node_id in request.node_ids}
+    elif isinstance(request, OrderNodes):
+        return {int(request.target_node_id), *(int(x) for x in request.node_ids)}
+    elif isinstance(
+        request,
+        (
+            FillBuffer,
+            FillControlBusRange,
+            SetBuffer,
+            SetBufferRange,
+            SetControlBus,
+            SetControlBusRange,
+        ),
+    ):
+        return set()
+    return None
+
+
+def _get_writes(request: Request) -> Optional[FrozenSet[Tuple[Hashable, ...]]]:
+    """
+    Get the state a request writes, or ``None`` if unknown.
+
+    New synths read the buses mapped to their controls, and any buffers they use,
+    as they're created, so count as writing every bus and buffer, keeping writes
+    to them in place around the synths. No other request understood here reads
+    state.
+    """
+    if isinstance(request, SetNodeControl):
+        return frozenset(_get_control_key(control) for control, _ in request.items)
+    elif isinstance(request, _MAP_REQUESTS):
+        return frozenset(_get_control_key(item[0]) for item in request.items)
+    elif isinstance(request, NODE_CONTROL_RANGE_REQUESTS):
+        return frozenset([_ANY_CONTROL])
+    elif isinstance(request, RunNode):
+        return frozenset([_TREE])
+    elif isinstance(request, (NewSynth, NewSynths)):
+        return frozenset([_TREE, _ANY_CONTROL, _ANY_BUS, _ANY_BUFFER])
+    elif isinstance(
+        request,
+        _MOVE_REQUESTS
+        + _NEW_GROUP_REQUESTS
+        + (
+            FreeGroupChildren,
+            FreeGroupDeep,
+            FreeNode,
+            OrderNodes,
+            ReleaseNode,
+        ),
+    ):
+        # Creating, freeing or moving nodes changes which nodes a control write
+        # reaches, e.g. via a parent group.
+        return frozenset([_TREE, _ANY_CONTROL])
+    elif isinstance(request, SetControlBus):
+        return frozenset(("bus", int(index)) for index, _ in request.items)
+    elif isinstance(request, SetControlBusRange):
+        return frozenset(
+            ("bus", int(index) + i)
+            for index, values in request.items
+            for i in range(len(values))
+        )
+    elif isinstance(request, FillControlBusRange):
+        return frozenset(
+            ("bus", int(index) + i)
+            for index, count, _ in request.items
+            for i in range(count)
+        )
+    elif isinstance(request, (FillBuffer, SetBuffer, SetBufferRange)):
+        return frozenset([("buffer", int(request.buffer_id))])
+    return None
+
+
+def _get_merge_key(request: Request) -> Optional[Hashable]:
+    if isinstance(request, SetNodeControl):
+        return (SetNodeControl, int(request.node_id))
+    elif isinstance(request, (FillBuffer, SetBuffer, SetBufferRange)):
+        # Buffer requests only merge into a single request per buffer.
+        return (type(request), int(request.buffer_id))
+    elif isinstance(request, _MERGEABLE_REQUESTS):
+        return type(request)
+    return None
+
+
+def _eliminate_created_and_freed_nodes(requests: List[Request]) -> List[Request]:
+    # Find each node's creation and free.
+    created_at: Dict[int, int] = {}
+    freed_at: Dict[int, int] = {}
+    for i, request in enumerate(requests):
+        if isinstance(request, NewSynth):
+            add_action = AddAction.from_expr(request.add_action)
+            if add_action != AddAction.REPLACE:
+                created_at.setdefault(int(request.synth_id), i)
+        elif isinstance(request, _NEW_GROUP_REQUESTS):
+            for node_id, add_action, _ in request.items:
+                if AddAction.from_expr(add_action) != AddAction.REPLACE:
+                    created_at.setdefault(int(node_id), i)
+        elif isinstance(request, FreeNode):
+            for node_id in request.node_ids:
+                freed_at.setdefault(int(node_id), i)
+        elif isinstance(request, ReleaseNode):
+            if request.force or not request.has_gate:
+                freed_at.setdefault(int(request.node_id), i)
+    candidates = {
+        node_id: (start, freed_at[node_id])
+        for node_id, start in created_at.items()
+        if start < freed_at.get(node_id, -1)
+    }
+    if not candidates:
+        return requests
+    # Keep only nodes which nothing in between targets, or can't be understood,
+    # and drop every request on them from their creation to their free.
+    dropped_node_ids: Dict[int, Set[int]] = {}
+    for node_id, (start, stop) in candidates.items():
+        if isinstance(creation := requests[start], _NEW_GROUP_REQUESTS) and any(
+            int(target_node_id) == node_id for _, _, target_node_id in creation.items
+        ):
+            continue
+        for request in requests[start + 1 : stop]:
+            if (node_ids := _get_node_ids(request)) is None:
+                break
+            if node_id not in node_ids:
+                continue
+            if isinstance(request, (SetNodeControl, RunNode)):
+                continue
+            if isinstance(request, _MAP_REQUESTS + NODE_CONTROL_RANGE_REQUESTS):
+                continue
+            break
+        else:
+            for i in range(start, stop + 1):
+                dropped_node_ids.setdefault(i, set()).add(node_id)
+    if not dropped_node_ids:
+        return requests
+    optimized_requests: List[Request] = []
+    for i, request in enumerate(requests):
+        if not (dropped := dropped_node_ids.get(i)):
+            pass
+        elif isinstance(request, NewSynth):
+            if int(request.synth_id) in dropped:
+                continue
+        elif isinstance(request, _NEW_GROUP_REQUESTS):
+            items = [item for item in request.items if int(item[0]) not in dropped]
+            if not items:
+                continue
+            if len(items) < len(request.items):
+                request = type(request)(items=items)
+        elif isinstance(request, FreeNode):
+            free_ids = [x for x in request.node_ids if int(x) not in dropped]
+            if not free_ids:
+                continue
+            if len(free_ids) < len(request.node_ids):
+                request = FreeNode(node_ids=free_ids)
+        elif isinstance(request, RunNode):
+            run_items = [x for x in request.items if int(x[0]) not in dropped]
+            if not run_items:
+                continue
+            if len(run_items) < len(request.items):
+                request = RunNode(items=run_items)
+        elif isinstance(
+            request,
+            (ReleaseNode, SetNodeControl) + _MAP_REQUESTS + NODE_CONTROL_RANGE_REQUESTS,
+        ):
+            if int(request.node_id) in dropped:
+                continue
+        optimized_requests.append(request)
+    return optimized_requests
+
+
+def _eliminate_dead_writes(requests: List[Request]) -> List[Request]:
+    # Walk backwards, tracking which controls and buses are written later on.
+    # Barriers and new synths, which read buses, reset tracking, as do changes to
+    # the node tree for controls.
+    controls: Dict[Tuple[int, str], int] = {}  # (node, control) -> width
+    buses: Set[int] = set()
+    optimized_requests: List[Request] = []
+    for request in reversed(requests):
+        if isinstance(request, SetNodeControl):
+            node_id = int(request.node_id)
+            node_items: List[Tuple[Union[int, str], Union[float, Sequence[float]]]] = []
+            for control, value in reversed(request.items):
+                width = len(value) if isinstance(value, Sequence) else 1
+                if not isinstance(control, str):
+                    node_items.append((control, value))
+                    continue
+                if width <= controls.get((node_id, control), 0):
+                    continue
+                controls[(node_id, control)] = width
+                node_items.append((control, value))
+            if not node_items:
+                continue
+            if len(node_items) < len(request.items):
+                request = SetNodeControl(node_id=node_id, items=node_items[::-1])
+        elif isinstance(request, SetControlBus):
+            bus_items = []
+            for index, value in reversed(request.items):
+                if int(index) in buses:
+                    continue
+                buses.add(int(index))
+                bus_items.append((index, value))
+            if not bus_items:
+                continue
+            if len(bus_items) < len(request.items):
+                request = SetControlBus(items=bus_items[::-1])
+        elif isinstance(request, (FillControlBusRange, SetControlBusRange)):
+            buses.update(cast(int, key[1]) for key in _get_writes(request) or ())
+        elif (writes := _get_writes(request)) is None:
+            controls.clear()
+            buses.clear()
+        else:
+            if _TREE in writes:
+                # Moving nodes changes which nodes a write to a group reaches.
+                controls.clear()
+            if _ANY_BUS in writes:
+                buses.clear()
+        optimized_requests.append(request)
+    optimized_requests.reverse()
+    return optimized_requests
+
+
+def _merge_requests(requests: List[Request]) -> List[Request]:
+    # Sink each mergeable request forward into the next one sharing its merge
+    # key, as long as it commutes with every request in between. Open merge
+    # candidates are indexed by the state they write, so each request only
+    # closes the candidates it conflicts with.
+    optimized_requests: List[Optional[Request]] = []
+    open_indices: Dict[Hashable, int] = {}
+    open_by_write: Dict[Tuple[Hashable, ...], Set[Hashable]] = {}
+    for request in requests:
+        writes = _get_writes(request)
+        if writes is None:
+            open_indices.clear()
+            open_by_write.clear()
+            optimized_requests.append(request)
+            continue
+        merge_key = _get_merge_key(request)
+        if merge_key is not None and merge_key in open_indices:
+            index = open_indices.pop(merge_key)
+            previous_request = optimized_requests[index]
+            optimized_requests[index] = None
+            assert previous_request is not None
+            if isinstance(request, SetNodeControl):
+                assert isinstance(previous_request, SetNodeControl)
+                request = SetNodeControl(
+                    node_id=request.node_id,
+                    items=[*previous_request.items, *request.items],
+                )
+            else:
+                (request,) = type(request).merge([previous_request, request])
+            writes = _get_writes(request) or frozenset()
+        # Close candidates which don't commute with this request.
+        closed: Set[Hashable] = set()
+        for write in writes:
+            closed.update(open_by_write.pop(write, ()))
+            if len(write) < 2:
+                continue
+            if write[1] is None:
+                closed.update(open_by_write.pop(write[:1], ()))
+            else:
+                closed.update(open_by_write.get((write[0], None), ()))
+        for key in closed:
+            open_indices.pop(key, None)
+        if merge_key is not None:
+            open_indices[merge_key] = len(optimized_requests)
+            for write in writes:
+                open_by_write.setdefault(write, set()).add(merge_key)
+                # Indexed by kind too, for requests writing any of that kind
+                open_by_write.setdefault(write[:1], set()).add(merge_key)
+        optimized_requests.append(request)
+    return [request for request in optimized_requests if request is not None]
+
+
+def optimize_requests(requests: Sequence[Request]) -> List[Request]:
+    """
+    Optimize a moment's requests, leaving the server in the same state.
+
+    ::
+
+        >>> from supriya.contexts.optimizers import optimize_requests
+        >>> from supriya.contexts.requests import (
+        ...     FreeNode,
+        ...     NewSynth,
+        ...     SetControlBus,
+        ...     SetNodeControl,
+        ... )
+        >>> for request in optimize_requests(
+        ...     [
+        ...         SetNodeControl(node_id=1000, items=[("frequency", 440.0)]),
+        ...         SetControlBus(items=[(0, 0.5)]),
+        ...         SetNodeControl(node_id=1000, items=[("amplitude", 0.5)]),
+        ...         NewSynth(
+        ...             synthdef="default",
+        ...             synth_id=1001,
+        ...             add_action="ADD_TO_HEAD",
+        ...             target_node_id=1,
+        ...         ),
+        ...         SetNodeControl(node_id=1001, items=[("frequency", 220.0)]),
+        ...         SetControlBus(items=[(0, 0.25)]),
+        ...         FreeNode(node_ids=[1001]),
+        ...     ]
+        ... ):
+        ...     request.to_osc()
+        ...
+        OscMessage('/n_set', 1000, 'frequency', 440.0, 'amplitude', 0.5)
+        OscMessage('/c_set', 0, 0.25)
+
+    :param requests: The requests to optimize, in order.
+    """
+    optimized_requests = list(requests)
+    # Eliminating a node may free up the group it was created in, and so on.
+    while (
+        eliminated_requests := _eliminate_created_and_freed_nodes(optimized_requests)
+    ) is not optimized_requests:
+        optimized_requests = eliminated_requests
+    optimized_requests = _eliminate_dead_writes(optimized_requests)
+    return _merge_requests(optimized_requests)
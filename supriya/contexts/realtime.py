@@ -6,11 +6,15 @@ import asyncio
 import dataclasses
 import enum
 import logging
+import tempfile
 import warnings
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Dict,
+    Iterable,
     List,
+    Literal,
     Optional,
     Sequence,
     Set,
@@ -34,11 +38,15 @@ from ..exceptions import (
 )
 from ..osc import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
+    OscBundle,
     OscMessage,
     OscProtocol,
     OscProtocolOffline,
+    ThreadedBatchOscProtocol,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
 )
 from ..scsynth import (
     AsyncProcessProtocol,
@@ -71,8 +79,13 @@ from .requests import (
     QueryTree,
     QueryVersion,
     Quit,
+    ReadBuffer,
+    Requestable,
+    ResponseMultiplexer,
+    SetBufferRange,
     Sync,
     ToggleNotifications,
+    WriteBuffer,
 )
 from .responses import (
     BufferInfo,
@@ -91,9 +104,12 @@ from .responses import (
     StatusInfo,
     VersionInfo,
 )
+from .trees import NodeTree
 
 if TYPE_CHECKING:
-    from ..realtime.shm import ServerSHM
+    import numpy
+
+    from .shm import ServerSHM
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +151,10 @@ class BaseServer(Context):
 
     _contexts: Set["BaseServer"] = set()
 
+    # Buffers of at least this many samples are transferred via a temporary file when
+    # the server is local, rather than as OSC messages.
+    _buffer_file_transfer_threshold = 16384
+
     ### INITIALIZER ###
 
     def __init__(
@@ -144,17 +164,16 @@ class BaseServer(Context):
         process_protocol: ProcessProtocol,
         **kwargs,
     ) -> None:
-        super().__init__(options)
+        super().__init__(options, **kwargs)
         self._latency = 0.1
         self._is_owner = False
         self._boot_status = BootStatus.OFFLINE
         self._buffers: Set[int] = set()
         self._maximum_logins = 1
-        self._node_active: Dict[int, bool] = {}
-        self._node_children: Dict[int, List[int]] = {}
-        self._node_parents: Dict[int, int] = {}
+        self._node_tree = NodeTree()
         self._osc_protocol = osc_protocol
         self._process_protocol = process_protocol
+        self._response_multiplexer = ResponseMultiplexer()
         self._shm: Optional["ServerSHM"] = None
         self._setup_osc_callbacks()
         self._status: Optional[StatusInfo] = None
@@ -166,9 +185,7 @@ class BaseServer(Context):
             return False
         if self.boot_status != BootStatus.ONLINE:
             return False
-        if isinstance(object_, Node) and (
-            object_.id_ in self._node_parents or object_.id_ == 0
-        ):
+        if isinstance(object_, Node) and object_.id_ in self._node_tree:
             return True
         if isinstance(object_, Buffer) and object_.id_ in self._buffers:
             return True
@@ -210,60 +227,26 @@ class BaseServer(Context):
             warnings.warn(" ".join(str(x) for x in message.contents), FailWarning)
 
         def _handle_n_end(message: OscMessage) -> None:
-            id_, parent_id, *_ = message.contents
-            if parent_id == -1:
-                parent_id = self._node_parents.get(id_)
-            if parent_id is not None:
-                _remove_node_from_children(id_, parent_id)
-            self._free_id(Node, id_)
-            self._node_active.pop(id_, None)
-            self._node_children.pop(id_, None)
-            self._node_parents.pop(id_, None)
+            self._free_id(Node, message.contents[0])
+            self._node_tree.remove(message.contents[0])
 
         def _handle_n_go(message: OscMessage) -> None:
             id_, parent_id, previous_id, next_id, is_group, *_ = message.contents
-            self._node_parents[id_] = parent_id
-            self._node_active[id_] = True
-            if is_group:
-                self._node_children[id_] = []
-            _add_node_to_children(id_, parent_id, previous_id, next_id)
+            self._node_tree.add(id_, parent_id, previous_id, next_id, bool(is_group))
 
         def _handle_n_move(message: OscMessage) -> None:
             id_, parent_id, previous_id, next_id, *_ = message.contents
-            old_parent_id = self._node_parents[id_]
-            _remove_node_from_children(id_, old_parent_id)
-            _add_node_to_children(id_, parent_id, previous_id, next_id)
+            self._node_tree.move(id_, parent_id, previous_id, next_id)
 
         def _handle_n_off(message: OscMessage) -> None:
-            self._node_active[message.contents[0]] = False
+            self._node_tree.set_active(message.contents[0], False)
 
         def _handle_n_on(message: OscMessage) -> None:
-            self._node_active[message.contents[0]] = True
+            self._node_tree.set_active(message.contents[0], True)
 
         def _handle_status_reply(message: OscMessage):
             self._status = cast(StatusInfo, StatusInfo.from_osc(message))
 
-        def _add_node_to_children(
-            id_: int, parent_id: int, previous_id: int, next_id: int
-        ) -> None:
-            self._node_parents[id_] = parent_id
-            children = self._node_children[parent_id]
-            if previous_id == -1:
-                children.insert(0, id_)
-            elif next_id == -1:
-                children.append(id_)
-            elif previous_id in children:
-                children.insert(children.index(previous_id) + 1, id_)
-            elif next_id in children:
-                children.insert(children.index(next_id), id_)
-
-        def _remove_node_from_children(id_: int, parent_id: int) -> None:
-            children = self._node_children[parent_id]
-            try:
-                children.pop(children.index(id_))
-            except ValueError:
-                pass
-
         handlers = {
             "/done": _handle_done,
             "/fail": _handle_fail,
@@ -280,6 +263,40 @@ class BaseServer(Context):
             if handler is not None:
                 handler(message)
 
+    def _get_buffer_transfer_method(
+        self, sample_count: int, method: Optional[Literal["file", "osc"]]
+    ) -> Literal["file", "osc"]:
+        if method is None:
+            if (
+                self._is_local()
+                and sample_count >= self._buffer_file_transfer_threshold
+            ):
+                return "file"
+            return "osc"
+        if method not in ("file", "osc"):
+            raise ValueError(method)
+        return method
+
+    def _get_shm_bus_range(self, bus: Bus, count: int) -> Optional[Sequence[float]]:
+        if self._shm is None:
+            return None
+        view = memoryview(self._shm)
+        if bus.id_ < 0 or count < 0 or bus.id_ + count > len(view):
+            return None
+        # Copy, as a view would keep changing under the caller as scsynth writes
+        # to the buses, unlike the values /c_getn replies with. Zero-copy reads
+        # can view ServerSHM directly.
+        return tuple(view[bus.id_ : bus.id_ + count].tolist())
+
+    def _is_local(self) -> bool:
+        return self._options.ip_address in ("127.0.0.1", "localhost", "::1")
+
+    def _query_local_tree(
+        self, group: Optional[Group]
+    ) -> Optional[Union[QueryTreeGroup, QueryTreeSynth]]:
+        with self._lock:
+            return QueryTreeGroup.from_node_tree(self._node_tree, int(group or 0))
+
     def _resolve_node(self, node: Union[Node, SupportsInt, None]) -> int:
         if node is None:
             return self._client_id + 1
@@ -301,17 +318,19 @@ class BaseServer(Context):
             )
 
     def _setup_shm(self) -> None:
+        # scsynth's shared memory is only reachable from the same machine
+        if not self._is_local():
+            return
         try:
-            from ..realtime.shm import ServerSHM
+            from .shm import ServerSHM
 
             self._shm = ServerSHM(
                 self._options.port, self._options.control_bus_channel_count
             )
-        except (ImportError, ModuleNotFoundError):
+        except (ImportError, ModuleNotFoundError, RuntimeError):
             pass
 
     def _setup_system(self) -> None:
-        self._node_children[0] = []
         with self.at():
             for i in range(self._maximum_logins):
                 self.add_group(permanent=True, add_action="ADD_TO_TAIL", target_node=0)
@@ -325,11 +344,31 @@ class BaseServer(Context):
         self._shm = None
 
     def _teardown_state(self) -> None:
-        self._node_active.clear()
-        self._node_children.clear()
-        self._node_parents.clear()
+        self._node_tree.clear()
         self._buffers.clear()
 
+    def _validate_buffer_array(
+        self, array: "numpy.ndarray", info: BufferInfo.Item, starting_frame: int
+    ) -> "numpy.ndarray":
+        import numpy
+
+        array = numpy.asarray(array, dtype=numpy.float32)
+        channel_count = info.channel_count
+        if array.ndim == 1 and channel_count and not array.size % channel_count:
+            # One-dimensional arrays hold interleaved samples
+            array = array.reshape(-1, channel_count)
+        if array.ndim != 2 or array.shape[1] != channel_count:
+            raise ValueError(
+                f"array of shape {array.shape} does not match "
+                f"buffer {info.buffer_id}'s {channel_count} channel(s)"
+            )
+        if starting_frame < 0 or starting_frame + len(array) > info.frame_count:
+            raise ValueError(
+                f"{len(array)} frame(s) starting at {starting_frame} do not fit "
+                f"buffer {info.buffer_id}'s {info.frame_count} frame(s)"
+            )
+        return array
+
     def _validate_can_request(self) -> None:
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline
@@ -344,13 +383,45 @@ class BaseServer(Context):
         """
         Send a message to the execution context.
 
+        Bundles encoding to more than the OSC protocol's
+        ``maximum_datagram_size`` are split into several bundles sharing their
+        timestamp, so the server still performs their contents together.
+
         :param message: The message to send.
         """
         if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
             raise ServerOffline
-        self._osc_protocol.send(
-            message.to_osc() if hasattr(message, "to_osc") else message
-        )
+        osc_message = message.to_osc() if hasattr(message, "to_osc") else message
+        if isinstance(osc_message, OscBundle) and (
+            maximum_size := self._osc_protocol.maximum_datagram_size
+        ):
+            # Split bundles too large for the transport, keeping their timestamp.
+            bundles = osc_message.pack(maximum_size=maximum_size)
+            if len(bundles) > 1:
+                self._osc_protocol.send_many(bundles)
+                return
+        self._osc_protocol.send(osc_message)
+
+    def send_many(self, messages: Iterable[SupportsOsc]) -> None:
+        """
+        Send many messages to the execution context.
+
+        Messages are encoded in one pass and sent back to back, splitting
+        bundles too large for the transport as in :py:meth:`send`.
+
+        :param messages: The messages to send, in order.
+        """
+        if self._boot_status not in (BootStatus.BOOTING, BootStatus.ONLINE):
+            raise ServerOffline
+        maximum_size = self._osc_protocol.maximum_datagram_size
+        osc_messages: List[Union[OscBundle, OscMessage, SupportsOsc]] = []
+        for message in messages:
+            osc_message = message.to_osc() if hasattr(message, "to_osc") else message
+            if isinstance(osc_message, OscBundle) and maximum_size:
+                osc_messages.extend(osc_message.pack(maximum_size=maximum_size))
+            else:
+                osc_messages.append(osc_message)
+        self._osc_protocol.send_many(osc_messages)
 
     def set_latency(self, latency: float) -> None:
         """
@@ -410,23 +481,39 @@ class Server(BaseServer):
     A realtime execution context with :py:mod:`threading`-based OSC and process protocols.
 
     :param options: The context's options.
+    :param batched_receive: Flag for draining UDP replies on a dedicated thread
+        and delivering them in batches, via
+        :py:class:`~supriya.osc.ThreadedBatchOscProtocol`.
+    :param receive_buffer_size: The OSC socket's ``SO_RCVBUF`` size in bytes,
+        when receiving in batches.
     :param kwargs: Keyword arguments for options.
     """
 
     ### INITIALIZER ###
 
-    def __init__(self, options: Optional[Options] = None, **kwargs):
+    def __init__(
+        self,
+        options: Optional[Options] = None,
+        *,
+        batched_receive: bool = False,
+        receive_buffer_size: Optional[int] = None,
+        **kwargs,
+    ):
+        self._batched_receive = batched_receive
+        self._receive_buffer_size = receive_buffer_size
         super().__init__(
             osc_protocol=ThreadedOscProtocol(),
             options=options,
             process_protocol=SyncProcessProtocol(),
             **kwargs,
         )
+        self._setup_osc_protocol()
 
     ### PRIVATE METHODS ###
 
     def _connect(self) -> None:
         logger.info("Connecting")
+        self._setup_osc_protocol()
         cast(ThreadedOscProtocol, self._osc_protocol).connect(
             ip_address=self._options.ip_address,
             port=self._options.port,
@@ -438,6 +525,7 @@ class Server(BaseServer):
         self._contexts.add(self)
         self._osc_protocol.activate_healthcheck()
         self._setup_allocators()
+        self._setup_shm()
         if self._client_id == 0:
             self._setup_system()
             self.sync()
@@ -472,6 +560,28 @@ class Server(BaseServer):
             self._client_id = int(response.other[0])
             self._maximum_logins = int(response.other[1])
 
+    def _setup_osc_protocol(self) -> None:
+        osc_protocol_class: Type[ThreadedOscProtocol] = ThreadedOscProtocol
+        if self._options.protocol == "tcp":
+            osc_protocol_class = ThreadedTcpOscProtocol
+        elif self._batched_receive:
+            osc_protocol_class = ThreadedBatchOscProtocol
+        if type(self._osc_protocol) is osc_protocol_class:
+            return
+        osc_protocol = cast(ThreadedOscProtocol, self._osc_protocol)
+        # Apply queued (un)registrations before handing the callbacks over.
+        osc_protocol._process_command_queue()
+        if osc_protocol_class is ThreadedBatchOscProtocol:
+            # Take the state lock once per batch of notifications, not per message.
+            self._osc_protocol = ThreadedBatchOscProtocol(
+                receive_buffer_size=self._receive_buffer_size,
+                delivery_lock=self._lock,
+            )
+        else:
+            self._osc_protocol = osc_protocol_class()
+        self._osc_protocol.callbacks = osc_protocol.callbacks
+        self._osc_protocol.metrics = osc_protocol.metrics
+
     def _shutdown(self):
         if self.is_owner:
             self.quit()
@@ -499,7 +609,6 @@ class Server(BaseServer):
             raise
         self._is_owner = True
         self._connect()
-        self._setup_shm()
         return self
 
     def connect(self, *, options: Optional[Options] = None, **kwargs) -> "Server":
@@ -547,6 +656,65 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def get_buffer_array(
+        self,
+        buffer: Buffer,
+        *,
+        chunk_size: int = 1024,
+        method: Optional[Literal["file", "osc"]] = None,
+        timeout: float = 1.0,
+        window: int = 16,
+    ) -> "numpy.ndarray":
+        """
+        Get a buffer's samples as an array of shape ``(frame_count, channel_count)``.
+
+        Large buffers on local servers are written to a temporary file with
+        ``/b_write`` and memory-mapped back. Otherwise samples are fetched as
+        pipelined ``/b_getn`` requests of ``chunk_size`` samples each.
+
+        :param buffer: The buffer whose samples to get.
+        :param chunk_size: The number of samples per ``/b_getn`` request.
+        :param method: The transfer method, ``"file"`` or ``"osc"``, or None to pick
+            one by the buffer's size and the server's locality.
+        :param timeout: How long to wait for each response.
+        :param window: The maximum number of ``/b_getn`` requests in flight at once.
+        """
+        import numpy
+
+        from ..soundfiles import read_float_wav
+
+        info = cast(
+            BufferInfo,
+            QueryBuffer(buffer_ids=[buffer.id_]).communicate(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        sample_count = info.frame_count * info.channel_count
+        if self._get_buffer_transfer_method(sample_count, method) == "file":
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                WriteBuffer(
+                    buffer_id=buffer.id_,
+                    path=path,
+                    header_format="wav",
+                    sample_format="float",
+                ).communicate(server=self, timeout=timeout)
+                return numpy.array(read_float_wav(path))
+        array = numpy.empty(sample_count, dtype=numpy.float32)
+        requests = [
+            GetBufferRange(
+                buffer_id=buffer.id_, items=[(i, min(chunk_size, sample_count - i))]
+            )
+            for i in range(0, sample_count, chunk_size)
+        ]
+        for response in Requestable.communicate_many(
+            requests, server=self, timeout=timeout, window=window
+        ):
+            # Responses share an address, so place them by their starting indices
+            for index, values in cast(GetBufferRangeInfo, response).items:
+                array[index : index + len(values)] = values
+        return array.reshape(info.frame_count, info.channel_count)
+
     def get_buffer_range(
         self, buffer: Buffer, index: int, count: int, sync: bool = True
     ) -> Optional[Sequence[float]]:
@@ -595,7 +763,9 @@ class Server(BaseServer):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, unless reading synchronously from a local server
+        whose shared memory is available, in which case the values are copied from
+        shared memory directly.
 
         :param bus: The control bus to start reading at.
         :param count: The number of contiguous buses whose values to get.
@@ -604,6 +774,8 @@ class Server(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and (values := self._get_shm_bus_range(bus, count)) is not None:
+            return values
         request = GetControlBusRange(items=[(bus.id_, count)])
         if sync:
             return cast(GetControlBusRangeInfo, request.communicate(server=self)).items[
@@ -687,6 +859,27 @@ class Server(BaseServer):
         self._add_requests(request)
         return None
 
+    def query_nodes(
+        self, nodes: Sequence[Node], timeout: float = 1.0
+    ) -> List[NodeInfo]:
+        """
+        Query many nodes, pipelining the requests.
+
+        Emit ``/n_query`` requests, raising
+        :py:class:`concurrent.futures.TimeoutError` if any goes unanswered.
+
+        :param nodes: The nodes to query.
+        :param timeout: How long to wait for each response.
+        """
+        return cast(
+            List[NodeInfo],
+            Requestable.communicate_many(
+                [QueryNode(node_ids=[node.id_]) for node in nodes],
+                server=self,
+                timeout=timeout,
+            ),
+        )
+
     def query_status(self, sync: bool = True) -> Optional[StatusInfo]:
         """
         Query the server's status.
@@ -707,17 +900,24 @@ class Server(BaseServer):
         group: Optional[Group] = None,
         include_controls: bool = True,
         sync: bool = True,
+        source: Literal["local", "remote"] = "remote",
     ) -> Optional[Union[QueryTreeGroup, QueryTreeSynth]]:
         """
         Query the server's node tree.
 
-        Emit ``/g_queryTree`` requests.
+        Emit ``/g_queryTree`` requests, unless snapshotting the local node tree
+        mirror.
 
         :param group: The group whose tree to query. Defaults to the root node.
         :param include_controls: Flag for including synth control values.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
+        :param source: ``"remote"`` to query the server, or ``"local"`` to snapshot
+            the node tree mirrored from notifications, immediately and without a
+            round trip. Local snapshots carry no synthdef names or controls.
         """
+        if source == "local":
+            return self._query_local_tree(group)
         request = QueryTree(items=[(group or 0, include_controls)])
         if sync:
             return QueryTreeGroup.from_query_tree_info(
@@ -788,6 +988,70 @@ class Server(BaseServer):
         self.sync()
         return self
 
+    def set_buffer_array(
+        self,
+        buffer: Buffer,
+        array: "numpy.ndarray",
+        *,
+        starting_frame: int = 0,
+        chunk_size: int = 1024,
+        method: Optional[Literal["file", "osc"]] = None,
+        timeout: float = 1.0,
+        window: int = 16,
+    ) -> None:
+        """
+        Set a buffer's samples from an array.
+
+        Two-dimensional arrays are of shape ``(frame_count, channel_count)``;
+        one-dimensional arrays hold interleaved samples.
+
+        Large arrays bound for local servers are written to a temporary file and
+        loaded with ``/b_read``. Otherwise samples are sent as ``/b_setn`` requests of
+        ``chunk_size`` samples each, syncing after every ``window`` requests.
+
+        :param buffer: The buffer whose samples to set.
+        :param array: The samples to write.
+        :param starting_frame: The frame to start writing at.
+        :param chunk_size: The number of samples per ``/b_setn`` request.
+        :param method: The transfer method, ``"file"`` or ``"osc"``, or None to pick
+            one by the array's size and the server's locality.
+        :param timeout: How long to wait for each response.
+        :param window: The maximum number of ``/b_setn`` requests in flight at once.
+        """
+        from ..soundfiles import write_float_wav
+
+        info = cast(
+            BufferInfo,
+            QueryBuffer(buffer_ids=[buffer.id_]).communicate(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        array = self._validate_buffer_array(array, info, starting_frame)
+        if self._get_buffer_transfer_method(array.size, method) == "file":
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                write_float_wav(path, array, info.sample_rate)
+                ReadBuffer(
+                    buffer_id=buffer.id_,
+                    path=path,
+                    starting_frame_in_buffer=starting_frame,
+                ).communicate(server=self, timeout=timeout)
+            return
+        samples = array.reshape(-1)
+        offset = starting_frame * info.channel_count
+        requests = [
+            SetBufferRange(
+                buffer_id=buffer.id_,
+                items=[(offset + i, samples[i : i + chunk_size].tolist())],
+            )
+            for i in range(0, samples.size, chunk_size)
+        ]
+        for start in range(0, len(requests), window):
+            self.send_many(requests[start : start + window])
+            Sync(sync_id=self._get_next_sync_id()).communicate(
+                server=self, timeout=timeout
+            )
+
     def sync(self, sync_id: Optional[int] = None) -> "Server":
         """
         Sync the server.
@@ -821,11 +1085,13 @@ class AsyncServer(BaseServer):
             process_protocol=AsyncProcessProtocol(),
             **kwargs,
         )
+        self._setup_osc_protocol()
 
     ### PRIVATE METHODS ###
 
     async def _connect(self) -> None:
         logger.info("Connecting")
+        self._setup_osc_protocol()
         await cast(AsyncOscProtocol, self._osc_protocol).connect(
             ip_address=self._options.ip_address,
             port=self._options.port,
@@ -837,6 +1103,7 @@ class AsyncServer(BaseServer):
         self._contexts.add(self)
         self._osc_protocol.activate_healthcheck()
         self._setup_allocators()
+        self._setup_shm()
         if self._client_id == 0:
             self._setup_system()
             await self.sync()
@@ -870,6 +1137,18 @@ class AsyncServer(BaseServer):
             self._client_id = int(response.other[0])
             self._maximum_logins = int(response.other[1])
 
+    def _setup_osc_protocol(self) -> None:
+        osc_protocol_class: Type[AsyncOscProtocol] = AsyncOscProtocol
+        if self._options.protocol == "tcp":
+            osc_protocol_class = AsyncTcpOscProtocol
+        if type(self._osc_protocol) is osc_protocol_class:
+            return
+        callbacks = self._osc_protocol.callbacks
+        metrics = self._osc_protocol.metrics
+        self._osc_protocol = osc_protocol_class()
+        self._osc_protocol.callbacks = callbacks
+        self._osc_protocol.metrics = metrics
+
     async def _shutdown(self):
         if self.is_owner:
             await self.quit()
@@ -950,6 +1229,65 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def get_buffer_array(
+        self,
+        buffer: Buffer,
+        *,
+        chunk_size: int = 1024,
+        method: Optional[Literal["file", "osc"]] = None,
+        timeout: float = 1.0,
+        window: int = 16,
+    ) -> "numpy.ndarray":
+        """
+        Get a buffer's samples as an array of shape ``(frame_count, channel_count)``.
+
+        Large buffers on local servers are written to a temporary file with
+        ``/b_write`` and memory-mapped back. Otherwise samples are fetched as
+        pipelined ``/b_getn`` requests of ``chunk_size`` samples each.
+
+        :param buffer: The buffer whose samples to get.
+        :param chunk_size: The number of samples per ``/b_getn`` request.
+        :param method: The transfer method, ``"file"`` or ``"osc"``, or None to pick
+            one by the buffer's size and the server's locality.
+        :param timeout: How long to wait for each response.
+        :param window: The maximum number of ``/b_getn`` requests in flight at once.
+        """
+        import numpy
+
+        from ..soundfiles import read_float_wav
+
+        info = cast(
+            BufferInfo,
+            await QueryBuffer(buffer_ids=[buffer.id_]).communicate_async(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        sample_count = info.frame_count * info.channel_count
+        if self._get_buffer_transfer_method(sample_count, method) == "file":
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                await WriteBuffer(
+                    buffer_id=buffer.id_,
+                    path=path,
+                    header_format="wav",
+                    sample_format="float",
+                ).communicate_async(server=self, timeout=timeout)
+                return numpy.array(read_float_wav(path))
+        array = numpy.empty(sample_count, dtype=numpy.float32)
+        requests = [
+            GetBufferRange(
+                buffer_id=buffer.id_, items=[(i, min(chunk_size, sample_count - i))]
+            )
+            for i in range(0, sample_count, chunk_size)
+        ]
+        for response in await Requestable.communicate_many_async(
+            requests, server=self, timeout=timeout, window=window
+        ):
+            # Responses share an address, so place them by their starting indices
+            for index, values in cast(GetBufferRangeInfo, response).items:
+                array[index : index + len(values)] = values
+        return array.reshape(info.frame_count, info.channel_count)
+
     async def get_buffer_range(
         self, buffer: Buffer, index: int, count: int, sync: bool = True
     ) -> Optional[Sequence[float]]:
@@ -998,7 +1336,9 @@ class AsyncServer(BaseServer):
         """
         Get a range of control bus values.
 
-        Emit ``/c_getn`` requests.
+        Emit ``/c_getn`` requests, unless reading synchronously from a local server
+        whose shared memory is available, in which case the values are copied from
+        shared memory directly.
 
         :param bus: The control bus to start reading at.
         :param count: The number of contiguous buses whose values to get.
@@ -1007,6 +1347,8 @@ class AsyncServer(BaseServer):
         """
         if bus.calculation_rate != CalculationRate.CONTROL:
             raise InvalidCalculationRate
+        if sync and (values := self._get_shm_bus_range(bus, count)) is not None:
+            return values
         request = GetControlBusRange(items=[(bus.id_, count)])
         if sync:
             return cast(
@@ -1094,6 +1436,27 @@ class AsyncServer(BaseServer):
         self._add_requests(request)
         return None
 
+    async def query_nodes(
+        self, nodes: Sequence[Node], timeout: float = 1.0
+    ) -> List[NodeInfo]:
+        """
+        Query many nodes, pipelining the requests.
+
+        Emit ``/n_query`` requests, raising :py:class:`asyncio.TimeoutError` if any
+        goes unanswered.
+
+        :param nodes: The nodes to query.
+        :param timeout: How long to wait for each response.
+        """
+        return cast(
+            List[NodeInfo],
+            await Requestable.communicate_many_async(
+                [QueryNode(node_ids=[node.id_]) for node in nodes],
+                server=self,
+                timeout=timeout,
+            ),
+        )
+
     async def query_status(self, sync: bool = True) -> Optional[StatusInfo]:
         """
         Query the server's status.
@@ -1114,17 +1477,24 @@ class AsyncServer(BaseServer):
         group: Optional[Group] = None,
         include_controls: bool = True,
         sync: bool = True,
+        source: Literal["local", "remote"] = "remote",
     ) -> Optional[Union[QueryTreeGroup, QueryTreeSynth]]:
         """
         Query the server's node tree.
 
-        Emit ``/g_queryTree`` requests.
+        Emit ``/g_queryTree`` requests, unless snapshotting the local node tree
+        mirror.
 
         :param group: The group whose tree to query. Defaults to the root node.
         :param include_controls: Flag for including synth control values.
         :param sync: If true, communicate the request immediately. Otherwise bundle it
             with the current request context.
+        :param source: ``"remote"`` to query the server, or ``"local"`` to snapshot
+            the node tree mirrored from notifications, immediately and without a
+            round trip. Local snapshots carry no synthdef names or controls.
         """
+        if source == "local":
+            return self._query_local_tree(group)
         request = QueryTree(items=[(group or 0, include_controls)])
         if sync:
             return QueryTreeGroup.from_query_tree_info(
@@ -1194,6 +1564,70 @@ class AsyncServer(BaseServer):
         await self.sync()
         return self
 
+    async def set_buffer_array(
+        self,
+        buffer: Buffer,
+        array: "numpy.ndarray",
+        *,
+        starting_frame: int = 0,
+        chunk_size: int = 1024,
+        method: Optional[Literal["file", "osc"]] = None,
+        timeout: float = 1.0,
+        window: int = 16,
+    ) -> None:
+        """
+        Set a buffer's samples from an array.
+
+        Two-dimensional arrays are of shape ``(frame_count, channel_count)``;
+        one-dimensional arrays hold interleaved samples.
+
+        Large arrays bound for local servers are written to a temporary file and
+        loaded with ``/b_read``. Otherwise samples are sent as ``/b_setn`` requests of
+        ``chunk_size`` samples each, syncing after every ``window`` requests.
+
+        :param buffer: The buffer whose samples to set.
+        :param array: The samples to write.
+        :param starting_frame: The frame to start writing at.
+        :param chunk_size: The number of samples per ``/b_setn`` request.
+        :param method: The transfer method, ``"file"`` or ``"osc"``, or None to pick
+            one by the array's size and the server's locality.
+        :param timeout: How long to wait for each response.
+        :param window: The maximum number of ``/b_setn`` requests in flight at once.
+        """
+        from ..soundfiles import write_float_wav
+
+        info = cast(
+            BufferInfo,
+            await QueryBuffer(buffer_ids=[buffer.id_]).communicate_async(
+                server=self, timeout=timeout
+            ),
+        ).items[0]
+        array = self._validate_buffer_array(array, info, starting_frame)
+        if self._get_buffer_transfer_method(array.size, method) == "file":
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "buffer.wav"
+                write_float_wav(path, array, info.sample_rate)
+                await ReadBuffer(
+                    buffer_id=buffer.id_,
+                    path=path,
+                    starting_frame_in_buffer=starting_frame,
+                ).communicate_async(server=self, timeout=timeout)
+            return
+        samples = array.reshape(-1)
+        offset = starting_frame * info.channel_count
+        requests = [
+            SetBufferRange(
+                buffer_id=buffer.id_,
+                items=[(offset + i, samples[i : i + chunk_size].tolist())],
+            )
+            for i in range(0, samples.size, chunk_size)
+        ]
+        for start in range(0, len(requests), window):
+            self.send_many(requests[start : start + window])
+            await Sync(sync_id=self._get_next_sync_id()).communicate_async(
+                server=self, timeout=timeout
+            )
+
     async def sync(self, sync_id: Optional[int] = None) -> "AsyncServer":
         """
         Sync the server.
@@ -4,12 +4,19 @@ Classes for modeling requests to :term:`scsynth`.
 
 import asyncio
 import dataclasses
+import functools
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from os import PathLike
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Deque,
     Dict,
     List,
     Optional,
@@ -18,6 +25,7 @@ from typing import (
     SupportsInt,
     Tuple,
     Union,
+    cast,
 )
 
 try:
@@ -28,12 +36,13 @@ except ImportError:
 from uqbar.objects import new
 
 from ..enums import AddAction, HeaderFormat, RequestName, SampleFormat
-from ..osc import OscBundle, OscMessage
+from ..osc import OscBundle, OscCallback, OscMessage, OscMessageTemplate
 from ..typing import AddActionLike, HeaderFormatLike, SampleFormatLike, SupportsOsc
 from ..ugens import SynthDef, compile_synthdefs
 from .responses import Response
 
 if TYPE_CHECKING:
+    from ..osc import OscProtocol
     from .contexts.core import Context
     from .contexts.realtime import AsyncServer, Server
 
@@ -41,6 +50,149 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_osc_message_template(address, *contents) -> OscMessageTemplate:
+    return OscMessageTemplate(address, *contents)
+
+
+class PendingResponse:
+    """
+    A request in flight, awaiting its response in a :py:class:`ResponseMultiplexer`.
+    """
+
+    __slots__ = ("future", "keys", "started")
+
+    def __init__(
+        self, future: Any, keys: Tuple[Tuple, ...], started: Optional[int] = None
+    ) -> None:
+        self.future = future
+        self.keys = keys
+        self.started = started
+
+
+class ResponseMultiplexer:
+    """
+    A correlation table for requests in flight.
+
+    Expected responses are keyed on their response patterns, e.g. ``("/n_info",
+    1000)`` or ``("/done", "/b_alloc", 0)``, and each reply resolves the oldest
+    pending response with a matching key. A single persistent callback per
+    reply address feeds the table, so any number of requests may be in flight
+    without registering one callback each.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.callbacks: Dict[Any, OscCallback] = {}
+        self.key_lengths: Dict[Any, Dict[int, int]] = {}
+        self.lock = threading.RLock()
+        self.osc_protocol: Optional["OscProtocol"] = None
+        self.pending: Dict[Tuple, Deque[PendingResponse]] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self) -> int:
+        return sum(len(pending) for pending in self.pending.values())
+
+    ### PRIVATE METHODS ###
+
+    def _handle_message(self, message: OscMessage) -> None:
+        items = (message.address, *message.contents)
+        with self.lock:
+            for length in sorted(self.key_lengths.get(message.address, ())):
+                if (pending := self.pending.get(items[:length])) is not None:
+                    break
+            else:
+                return
+            pending_response = pending[0]
+            self._remove(pending_response)
+        if pending_response.started is not None and (
+            metrics := cast("OscProtocol", self.osc_protocol).metrics
+        ):
+            metrics.record_latency(
+                pending_response.keys[0],
+                time.perf_counter_ns() - pending_response.started,
+            )
+        if not pending_response.future.done():
+            pending_response.future.set_result(Response.from_osc(message))
+
+    def _remove(self, pending_response: PendingResponse) -> None:
+        for key in pending_response.keys:
+            if (pending := self.pending.get(key)) is None:
+                continue
+            try:
+                pending.remove(pending_response)
+            except ValueError:
+                continue
+            if pending:
+                continue
+            del self.pending[key]
+            key_lengths = self.key_lengths[key[0]]
+            key_lengths[len(key)] -= 1
+            if not key_lengths[len(key)]:
+                del key_lengths[len(key)]
+            if not key_lengths:
+                del self.key_lengths[key[0]]
+                cast("OscProtocol", self.osc_protocol).unregister(
+                    self.callbacks.pop(key[0])
+                )
+
+    ### PUBLIC METHODS ###
+
+    def add(
+        self,
+        osc_protocol: "OscProtocol",
+        future: Any,
+        success_pattern: Sequence[Union[float, str]],
+        failure_pattern: Optional[Sequence[Union[float, str]]] = None,
+    ) -> PendingResponse:
+        """
+        Add a pending response, resolving ``future`` on a matching reply.
+
+        :param osc_protocol: The OSC protocol to listen on.
+        :param future: The future to resolve with the response.
+        :param success_pattern: The success response pattern.
+        :param failure_pattern: The failure response pattern.
+        """
+        keys = tuple(
+            tuple(pattern) for pattern in (success_pattern, failure_pattern) if pattern
+        )
+        pending_response = PendingResponse(
+            future,
+            keys,
+            time.perf_counter_ns() if osc_protocol.metrics is not None else None,
+        )
+        with self.lock:
+            self.osc_protocol = osc_protocol
+            for key in keys:
+                if key not in self.pending:
+                    self.pending[key] = deque()
+                    key_lengths = self.key_lengths.setdefault(key[0], {})
+                    key_lengths[len(key)] = key_lengths.get(len(key), 0) + 1
+                    if key[0] not in self.callbacks:
+                        self.callbacks[key[0]] = osc_protocol.register(
+                            pattern=[key[0]], procedure=self._handle_message
+                        )
+                self.pending[key].append(pending_response)
+        return pending_response
+
+    def discard(self, pending_response: PendingResponse) -> None:
+        """
+        Discard a pending response, e.g. after timing out.
+
+        :param pending_response: The pending response to discard.
+        """
+        with self.lock:
+            self._remove(pending_response)
+        if (
+            pending_response.started is not None
+            and not pending_response.future.done()
+            and (metrics := cast("OscProtocol", self.osc_protocol).metrics)
+        ):
+            metrics.record_latency(pending_response.keys[0], None)
+
+
 class Requestable(ABC):
     """
     Abstract base for request-like classes.
@@ -74,8 +226,18 @@ class Requestable(ABC):
             procedure=lambda message: future.set_result(Response.from_osc(message)),
             once=True,
         )
+        if (metrics := server._osc_protocol.metrics) is None:
+            server.send(requestable)
+            return future.result(timeout=timeout)
+        started = time.perf_counter_ns()
         server.send(requestable)
-        return future.result(timeout=timeout)
+        try:
+            response = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            metrics.record_latency(success_pattern, None)
+            raise
+        metrics.record_latency(success_pattern, time.perf_counter_ns() - started)
+        return response
 
     async def communicate_async(
         self, server: "AsyncServer", timeout: float = 1.0
@@ -95,15 +257,128 @@ class Requestable(ABC):
             procedure=lambda message: future.set_result(Response.from_osc(message)),
             once=True,
         )
+        metrics = server._osc_protocol.metrics
+        started = time.perf_counter_ns()
         server.send(requestable)
         try:
             await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
             # No response received, so make sure to cleanup
             server._osc_protocol.unregister(osc_callback)
+            if metrics is not None:
+                metrics.record_latency(success_pattern, None)
             raise
+        if metrics is not None:
+            metrics.record_latency(success_pattern, time.perf_counter_ns() - started)
         return future.result()
 
+    @staticmethod
+    def communicate_many(
+        requestables: Sequence["Requestable"],
+        server: "Server",
+        timeout: float = 1.0,
+        window: int = 256,
+    ) -> List[Optional[Response]]:
+        """
+        Communicate many requestables, pipelining their responses.
+
+        Up to ``window`` requestables are sent back to back and awaited together
+        through the server's :py:class:`ResponseMultiplexer`, rather than one
+        round trip at a time.
+
+        :param requestables: The requestables to communicate.
+        :param server: The server to communicate with.
+        :param timeout: How long to wait for each response after sending.
+        :param window: The maximum number of requests in flight at once.
+        """
+        multiplexer = server._response_multiplexer
+        responses: List[Optional[Response]] = [None] * len(requestables)
+        for start in range(0, len(requestables), window):
+            in_flight: List[Tuple[int, Future[Response], PendingResponse]] = []
+            messages = []
+            for index in range(start, min(start + window, len(requestables))):
+                (
+                    success_pattern,
+                    failure_pattern,
+                    requestable,
+                ) = requestables[
+                    index
+                ]._get_response_patterns_and_requestable(server)
+                if not success_pattern:
+                    messages.append(requestables[index])
+                    continue
+                future: Future[Response] = Future()
+                pending_response = multiplexer.add(
+                    server._osc_protocol, future, success_pattern, failure_pattern
+                )
+                in_flight.append((index, future, pending_response))
+                messages.append(requestable)
+            try:
+                server.send_many(messages)
+                deadline = time.monotonic() + timeout
+                for index, future, _ in in_flight:
+                    responses[index] = future.result(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+            finally:
+                for _, _, pending_response in in_flight:
+                    multiplexer.discard(pending_response)
+        return responses
+
+    @staticmethod
+    async def communicate_many_async(
+        requestables: Sequence["Requestable"],
+        server: "AsyncServer",
+        timeout: float = 1.0,
+        window: int = 256,
+    ) -> List[Optional[Response]]:
+        """
+        Communicate many requestables, pipelining their responses.
+
+        Up to ``window`` requestables are sent back to back and awaited together
+        through the server's :py:class:`ResponseMultiplexer`, rather than one
+        round trip at a time.
+
+        :param requestables: The requestables to communicate.
+        :param server: The server to communicate with.
+        :param timeout: How long to wait for each response after sending.
+        :param window: The maximum number of requests in flight at once.
+        """
+        loop = asyncio.get_running_loop()
+        multiplexer = server._response_multiplexer
+        responses: List[Optional[Response]] = [None] * len(requestables)
+        for start in range(0, len(requestables), window):
+            in_flight: List[Tuple[int, asyncio.Future[Response], PendingResponse]] = []
+            messages = []
+            for index in range(start, min(start + window, len(requestables))):
+                (
+                    success_pattern,
+                    failure_pattern,
+                    requestable,
+                ) = requestables[
+                    index
+                ]._get_response_patterns_and_requestable(server)
+                if not success_pattern:
+                    messages.append(requestables[index])
+                    continue
+                future: asyncio.Future[Response] = loop.create_future()
+                pending_response = multiplexer.add(
+                    server._osc_protocol, future, success_pattern, failure_pattern
+                )
+                in_flight.append((index, future, pending_response))
+                messages.append(requestable)
+            try:
+                server.send_many(messages)
+                deadline = loop.time() + timeout
+                for index, future, _ in in_flight:
+                    responses[index] = await asyncio.wait_for(
+                        future, timeout=max(0.0, deadline - loop.time())
+                    )
+            finally:
+                for _, _, pending_response in in_flight:
+                    multiplexer.discard(pending_response)
+        return responses
+
     @abstractmethod
     def to_osc(self) -> Union[OscBundle, OscMessage]:
         raise NotImplementedError
@@ -165,9 +440,17 @@ class RequestBundle(Requestable):
     ### PUBLIC METHODS ###
 
     def to_osc(self) -> OscBundle:
-        return OscBundle(
-            contents=[x.to_osc() for x in self.contents], timestamp=self.timestamp
-        )
+        contents: List[Union[OscBundle, OscMessage]] = []
+        for requestable in self.contents:
+            osc = requestable.to_osc()
+            # Splice in batched requests, e.g. NewSynths, so their messages run
+            # in order at the bundle's own timestamp whichever way servers treat
+            # nested bundles, and a size-aware packer can split them up.
+            if isinstance(osc, OscBundle) and isinstance(requestable, Request):
+                contents.extend(osc.contents)
+            else:
+                contents.append(osc)
+        return OscBundle(contents=contents, timestamp=self.timestamp)
 
 
 @dataclasses.dataclass
@@ -1313,17 +1596,36 @@ class NewSynth(Request):
     ] = None
 
     def to_osc(self) -> OscMessage:
+        synthdef_name = (
+            self.synthdef.actual_name
+            if isinstance(self.synthdef, SynthDef)
+            else self.synthdef
+        )
+        controls = sorted((self.controls or {}).items())
+        # scalar-only requests encode through a cached template
+        template_contents: List[Union[int, str, type]] = []
+        values: List[Union[float, int]] = []
+        for key, value in controls:
+            if not isinstance(value, (float, int)):
+                break
+            template_contents.extend((key if isinstance(key, str) else int(key), float))
+            values.append(value)
+        else:
+            return _get_osc_message_template(
+                RequestName.SYNTH_NEW, synthdef_name, int, int, int, *template_contents
+            ).to_osc_message(
+                self.synth_id,
+                AddAction.from_expr(self.add_action),
+                self.target_node_id,
+                *values,
+            )
         contents: List[Union[float, str, Tuple[float, ...]]] = [
-            (
-                self.synthdef.actual_name
-                if isinstance(self.synthdef, SynthDef)
-                else self.synthdef
-            ),
+            synthdef_name,
             int(self.synth_id),
             int(AddAction.from_expr(self.add_action)),
             int(self.target_node_id),
         ]
-        for key, value in sorted((self.controls or {}).items()):
+        for key, value in controls:
             contents.append(key if isinstance(key, str) else int(key))
             if isinstance(value, str):
                 contents.append(value)
@@ -1334,6 +1636,111 @@ class NewSynth(Request):
         return OscMessage(RequestName.SYNTH_NEW, *contents)
 
 
+@dataclasses.dataclass
+class NewSynths(Request):
+    """
+    A batch of ``/s_new`` requests for synths sharing a SynthDef.
+
+    Controls given as lists hold one value per synth. Any other value, including
+    tuples for array-valued controls, is shared by every synth. The batch
+    encodes to an untimed bundle, whose messages are spliced into any enclosing
+    :py:class:`RequestBundle`.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts.requests import NewSynths
+        >>> request = NewSynths(
+        ...     synthdef=default,
+        ...     synth_ids=[1001, 1002],
+        ...     add_action="ADD_TO_TAIL",
+        ...     target_node_id=1000,
+        ...     controls={
+        ...         "frequency": [432.0, 648.0],
+        ...         "amplitude": 0.5,
+        ...     },
+        ... )
+        >>> for osc_message in request.to_osc().contents:
+        ...     osc_message
+        ...
+        OscMessage('/s_new', 'default', 1001, 1, 1000, 'amplitude', 0.5, 'frequency', 432.0)
+        OscMessage('/s_new', 'default', 1002, 1, 1000, 'amplitude', 0.5, 'frequency', 648.0)
+    """
+
+    synthdef: Union[SynthDef, str]
+    synth_ids: Sequence[SupportsInt]
+    add_action: AddActionLike
+    target_node_id: SupportsInt
+    controls: Optional[
+        Dict[
+            Union[int, str],
+            Union[
+                SupportsFloat,
+                str,
+                Tuple[float, ...],
+                List[Union[SupportsFloat, str, Tuple[float, ...]]],
+            ],
+        ]
+    ] = None
+
+    def to_osc(self) -> OscBundle:
+        synthdef_name = (
+            self.synthdef.actual_name
+            if isinstance(self.synthdef, SynthDef)
+            else self.synthdef
+        )
+        add_action = AddAction.from_expr(self.add_action)
+        target_node_id = int(self.target_node_id)
+        controls = sorted((self.controls or {}).items())
+        for key, value in controls:
+            if isinstance(value, list) and len(value) != len(self.synth_ids):
+                raise ValueError(key, len(value), len(self.synth_ids))
+        # scalar-only batches encode every synth through one cached template
+        if all(
+            isinstance(value, (float, int))
+            or (
+                isinstance(value, list)
+                and all(isinstance(x, (float, int)) for x in value)
+            )
+            for _, value in controls
+        ):
+            template_contents: List[Union[int, str, type]] = []
+            for key, _ in controls:
+                template_contents.extend(
+                    (key if isinstance(key, str) else int(key), float)
+                )
+            template = _get_osc_message_template(
+                RequestName.SYNTH_NEW, synthdef_name, int, int, int, *template_contents
+            )
+            columns = [
+                value if isinstance(value, list) else [value] * len(self.synth_ids)
+                for _, value in controls
+            ]
+            return OscBundle(
+                contents=[
+                    template.to_osc_message(
+                        synth_id, add_action, target_node_id, *values
+                    )
+                    for synth_id, *values in zip(self.synth_ids, *columns)
+                ]
+            )
+        return OscBundle(
+            contents=[
+                NewSynth(
+                    synthdef=synthdef_name,
+                    synth_id=synth_id,
+                    add_action=add_action,
+                    target_node_id=target_node_id,
+                    controls={
+                        key: value[i] if isinstance(value, list) else value
+                        for key, value in controls
+                    },
+                ).to_osc()
+                for i, synth_id in enumerate(self.synth_ids)
+            ]
+        )
+
+
 @dataclasses.dataclass
 class NormalizeBuffer(Request):
     """
@@ -1870,6 +2277,20 @@ class SetNodeControl(Request):
     items: Sequence[Tuple[Union[int, str], Union[float, Sequence[float]]]]
 
     def to_osc(self) -> OscMessage:
+        # scalar-only requests encode through a cached template
+        template_contents: List[Union[int, str, type]] = []
+        scalars: List[Union[float, int]] = []
+        for control, values in self.items:
+            if not isinstance(values, (float, int)):
+                break
+            template_contents.extend(
+                (control if isinstance(control, str) else int(control), float)
+            )
+            scalars.append(values)
+        else:
+            return _get_osc_message_template(
+                RequestName.NODE_SET, int, *template_contents
+            ).to_osc_message(self.node_id, *scalars)
         contents: List[Union[float, str, List[float]]] = [int(self.node_id)]
         for control, values in self.items:
             contents.append(control if isinstance(control, str) else int(control))
@@ -2078,3 +2499,13 @@ class ZeroBuffer(Request):
         if self.on_completion:
             contents.append(self.on_completion.to_osc())
         return OscMessage(RequestName.BUFFER_ZERO, *contents)
+
+
+#: Requests which write a run of a node's controls, starting from a named or
+#: indexed control.
+NODE_CONTROL_RANGE_REQUESTS = (
+    FillNode,
+    MapAudioBusRangeToNode,
+    MapControlBusRangeToNode,
+    SetNodeControlRange,
+)
@@ -4,11 +4,24 @@ Classes for modeling responses from :term:`scsynth`.
 
 import dataclasses
 from collections import deque
-from typing import Deque, Dict, List, Optional, Sequence, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from ..enums import NodeAction
 from ..osc import OscMessage
 
+if TYPE_CHECKING:
+    from .trees import NodeTree
+
 
 @dataclasses.dataclass
 class Response:
@@ -428,6 +441,195 @@ class QueryTreeGroup:
             deque(response.items),
         )
 
+    @classmethod
+    def from_node_tree(
+        cls, node_tree: "NodeTree", node_id: int = 0
+    ) -> Optional[Union["QueryTreeGroup", "QueryTreeSynth"]]:
+        """
+        Build a snapshot from a client-side node tree mirror.
+
+        Mirrors are built from node notifications alone, so synths carry neither
+        synthdef names nor controls.
+
+        :param node_tree: The node tree to snapshot.
+        :param node_id: The ID of the node to snapshot from. Defaults to the root
+            node.
+        """
+        if node_id not in node_tree:
+            return None
+        if not node_tree.is_group(node_id):
+            return QueryTreeSynth(node_id=node_id, synthdef_name=None)
+        root = QueryTreeGroup(node_id=node_id, children=[])
+        stack = [root]
+        while stack:
+            group = stack.pop()
+            for child_id in node_tree.iterate_children(group.node_id):
+                if node_tree.is_group(child_id):
+                    child = QueryTreeGroup(node_id=child_id, children=[])
+                    stack.append(child)
+                    group.children.append(child)
+                else:
+                    group.children.append(
+                        QueryTreeSynth(node_id=child_id, synthdef_name=None)
+                    )
+        return root
+
+
+@dataclasses.dataclass
+class QueryTreeDiff:
+    """
+    The changes between two snapshots of the same node tree.
+
+    Changes are listed like node notifications: created and moved nodes with
+    their new parent and previous sibling, each after its parent and previous
+    sibling, then removed nodes, so applying them in order turns the old tree
+    into the new one.
+
+    ::
+
+        >>> from supriya.contexts.responses import (
+        ...     QueryTreeDiff,
+        ...     QueryTreeGroup,
+        ...     QueryTreeSynth,
+        ... )
+        >>> old = QueryTreeGroup(
+        ...     node_id=0,
+        ...     children=[
+        ...         QueryTreeGroup(node_id=1, children=[]),
+        ...         QueryTreeSynth(node_id=1000, synthdef_name="default"),
+        ...     ],
+        ... )
+        >>> new = QueryTreeGroup(
+        ...     node_id=0,
+        ...     children=[
+        ...         QueryTreeSynth(node_id=1000, synthdef_name="default"),
+        ...         QueryTreeGroup(
+        ...             node_id=1,
+        ...             children=[QueryTreeSynth(node_id=1001, synthdef_name="default")],
+        ...         ),
+        ...     ],
+        ... )
+        >>> for item in QueryTreeDiff.from_query_tree_groups(old, new).items:
+        ...     item
+        ...
+        QueryTreeDiff.Item(action=NodeAction.NODE_MOVED, node_id=1000, parent_id=0, previous_id=-1, is_group=False, synthdef_name='default')
+        QueryTreeDiff.Item(action=NodeAction.NODE_MOVED, node_id=1, parent_id=0, previous_id=1000, is_group=True, synthdef_name=None)
+        QueryTreeDiff.Item(action=NodeAction.NODE_CREATED, node_id=1001, parent_id=1, previous_id=-1, is_group=False, synthdef_name='default')
+    """
+
+    @dataclasses.dataclass
+    class Item:
+        action: NodeAction
+        node_id: int
+        parent_id: int
+        previous_id: int
+        is_group: bool
+        synthdef_name: Optional[str] = None
+
+    items: List[Item]
+
+    ### SPECIAL METHODS ###
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _flatten(
+        group: QueryTreeGroup,
+    ) -> Dict[int, Tuple[int, int, Union[QueryTreeGroup, QueryTreeSynth]]]:
+        # node ID -> (parent ID, previous sibling ID, node), with each node
+        # after its parent and previous sibling
+        positions: Dict[int, Tuple[int, int, Union[QueryTreeGroup, QueryTreeSynth]]]
+        positions = {}
+        stack: List[Union[QueryTreeGroup, QueryTreeSynth]] = [group]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, QueryTreeGroup):
+                continue
+            previous_id = -1
+            for child in node.children:
+                positions[child.node_id] = (node.node_id, previous_id, child)
+                previous_id = child.node_id
+            stack.extend(reversed(node.children))
+        return positions
+
+    @classmethod
+    def _make_item(
+        cls,
+        action: NodeAction,
+        node_id: int,
+        parent_id: int,
+        previous_id: int,
+        node: Union[QueryTreeGroup, QueryTreeSynth],
+    ) -> "QueryTreeDiff.Item":
+        return cls.Item(
+            action=action,
+            node_id=node_id,
+            parent_id=parent_id,
+            previous_id=previous_id,
+            is_group=isinstance(node, QueryTreeGroup),
+            synthdef_name=getattr(node, "synthdef_name", None),
+        )
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_query_tree_groups(
+        cls, old: QueryTreeGroup, new: QueryTreeGroup
+    ) -> "QueryTreeDiff":
+        """
+        Diff two snapshots, in time linear in their size.
+
+        Nodes are matched by ID.
+
+        :param old: The earlier snapshot.
+        :param new: The later snapshot.
+        """
+        old_positions = cls._flatten(old)
+        new_positions = cls._flatten(new)
+        items: List[QueryTreeDiff.Item] = []
+        for node_id, (parent_id, previous_id, node) in new_positions.items():
+            if (old_position := old_positions.get(node_id)) is None:
+                action = NodeAction.NODE_CREATED
+            elif old_position[:2] != (parent_id, previous_id):
+                action = NodeAction.NODE_MOVED
+            else:
+                continue
+            items.append(cls._make_item(action, node_id, parent_id, previous_id, node))
+        for node_id, (parent_id, previous_id, node) in old_positions.items():
+            if node_id not in new_positions:
+                items.append(
+                    cls._make_item(
+                        NodeAction.NODE_REMOVED, node_id, parent_id, previous_id, node
+                    )
+                )
+        return cls(items=items)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def added(self) -> List[Item]:
+        """
+        Get the created nodes' changes.
+        """
+        return [item for item in self.items if item.action == NodeAction.NODE_CREATED]
+
+    @property
+    def moved(self) -> List[Item]:
+        """
+        Get the moved nodes' changes.
+        """
+        return [item for item in self.items if item.action == NodeAction.NODE_MOVED]
+
+    @property
+    def removed(self) -> List[Item]:
+        """
+        Get the removed nodes' changes.
+        """
+        return [item for item in self.items if item.action == NodeAction.NODE_REMOVED]
+
 
 @dataclasses.dataclass
 class StatusInfo(Response):
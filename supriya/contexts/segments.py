@@ -0,0 +1,674 @@
+"""
+Tools for splitting non-realtime scores into independently renderable segments.
+
+A score can't simply be rendered from partway through its timeline, as the
+requests before that point leave state behind: SynthDefs, buffers, buses, and a
+tree of groups and synths. :py:class:`ScoreState` replays a score's requests to
+track that state, and rebuilds it as requests a segment can open with.
+:py:func:`stitch_segments` joins the segments' renders back together.
+"""
+
+import dataclasses
+import heapq
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    SupportsFloat,
+    Tuple,
+    Union,
+)
+
+from uqbar.objects import new
+
+from ..enums import AddAction
+from ..typing import AddActionLike
+from ..ugens import (
+    Control,
+    EnvGen,
+    FreeSelf,
+    FreeSelfWhenDone,
+    Line,
+    Linen,
+    OutputProxy,
+    SynthDef,
+    XLine,
+)
+from .requests import (
+    NODE_CONTROL_RANGE_REQUESTS,
+    AllocateBuffer,
+    AllocateReadBuffer,
+    AllocateReadBufferChannel,
+    CloseBuffer,
+    CopyBuffer,
+    DoNothing,
+    DumpTree,
+    FillBuffer,
+    FillControlBusRange,
+    FreeBuffer,
+    FreeGroupChildren,
+    FreeGroupDeep,
+    FreeNode,
+    GetBuffer,
+    GetBufferRange,
+    GetControlBus,
+    GetControlBusRange,
+    GetSynthControl,
+    GetSynthControlRange,
+    MapAudioBusToNode,
+    MapControlBusToNode,
+    MoveNodeAfter,
+    MoveNodeBefore,
+    MoveNodeToGroupHead,
+    MoveNodeToGroupTail,
+    NewGroup,
+    NewParallelGroup,
+    NewSynth,
+    NewSynths,
+    OrderNodes,
+    QueryBuffer,
+    QueryNode,
+    QueryStatus,
+    QueryTree,
+    QueryVersion,
+    Quit,
+    ReceiveSynthDefs,
+    ReleaseNode,
+    Request,
+    RequestBundle,
+    Requestable,
+    RunNode,
+    SetBuffer,
+    SetBufferRange,
+    SetControlBus,
+    SetControlBusRange,
+    SetNodeControl,
+    Sync,
+    TraceNode,
+    WriteBuffer,
+    ZeroBuffer,
+)
+from .trees import NodeTree
+
+if TYPE_CHECKING:
+    import numpy
+
+_ALLOCATE_BUFFER_REQUESTS = (
+    AllocateBuffer,
+    AllocateReadBuffer,
+    AllocateReadBufferChannel,
+)
+
+_MOVE_ADD_ACTIONS = {
+    MoveNodeAfter: AddAction.ADD_AFTER,
+    MoveNodeBefore: AddAction.ADD_BEFORE,
+    MoveNodeToGroupHead: AddAction.ADD_TO_HEAD,
+    MoveNodeToGroupTail: AddAction.ADD_TO_TAIL,
+}
+
+# Requests which only query or write out state, and which leave none behind
+_OUTPUT_REQUESTS = (
+    CloseBuffer,
+    DumpTree,
+    GetBuffer,
+    GetBufferRange,
+    GetControlBus,
+    GetControlBusRange,
+    GetSynthControl,
+    GetSynthControlRange,
+    QueryBuffer,
+    QueryNode,
+    QueryStatus,
+    QueryTree,
+    QueryVersion,
+    Quit,
+    Sync,
+    TraceNode,
+    WriteBuffer,
+)
+
+ControlValue = Union[SupportsFloat, str, Tuple[float, ...]]
+
+
+def _get_input_value(
+    input_: Any, controls: Mapping[Union[int, str], ControlValue]
+) -> Optional[float]:
+    if isinstance(input_, (int, float)):
+        return float(input_)
+    if not isinstance(input_, OutputProxy) or not isinstance(input_.source, Control):
+        return None
+    offset = input_.output_index
+    for parameter in input_.source.parameters:
+        if offset >= len(parameter):
+            offset -= len(parameter)
+            continue
+        value = controls.get(parameter.name, parameter.value)
+        if isinstance(value, tuple):
+            value = value[offset] if offset < len(value) else None
+        try:
+            return float(value)  # type: ignore
+        except (TypeError, ValueError):
+            # mapped to a bus, so unknowable from requests
+            return None
+    return None
+
+
+def _get_lifespan(
+    synthdef: SynthDef, controls: Mapping[Union[int, str], ControlValue]
+) -> Tuple[bool, Optional[float]]:
+    """
+    Get whether a synth frees itself via a done action, and when by, if known.
+
+    Done actions fired by releasing a gate are ignored, as releases are seen from
+    requests. Durations are only known for lines and non-sustaining envelopes.
+    """
+    frees_itself, durations = False, []
+    for ugen in synthdef.ugens:
+        if isinstance(ugen, (FreeSelf, FreeSelfWhenDone)):
+            frees_itself = True
+            continue
+        input_names = list(ugen._ordered_input_names)
+        if "done_action" not in input_names or isinstance(ugen, Linen):
+            continue
+        inputs = [_get_input_value(x, controls) for x in ugen.inputs]
+        done_action = inputs[input_names.index("done_action")]
+        if done_action is not None and done_action < 2:
+            continue
+        duration: Optional[float] = None
+        if isinstance(ugen, (Line, XLine)):
+            duration = inputs[input_names.index("duration")]
+        elif isinstance(ugen, EnvGen):
+            envelope = inputs[input_names.index("envelope") :]
+            # sustaining and looping envelopes wait on their gate
+            if envelope[2] != -99 or envelope[3] != -99:
+                continue
+            time_scale = inputs[input_names.index("time_scale")]
+            segment_durations = envelope[5::4]
+            if time_scale is not None and None not in segment_durations:
+                duration = time_scale * sum(segment_durations)  # type: ignore
+        frees_itself = True
+        if duration is not None:
+            durations.append(duration)
+    return frees_itself, min(durations, default=None)
+
+
+def _get_writes(request: Requestable) -> Set[Hashable]:
+    # Bus and buffer samples a request sets outright, so later sets can replace it
+    if isinstance(request, SetControlBus):
+        return {("bus", int(index)) for index, _ in request.items}
+    elif isinstance(request, SetControlBusRange):
+        return {
+            ("bus", int(index) + i)
+            for index, values in request.items
+            for i in range(len(values))
+        }
+    elif isinstance(request, FillControlBusRange):
+        return {
+            ("bus", int(index) + i)
+            for index, count, _ in request.items
+            for i in range(count)
+        }
+    elif isinstance(request, SetBuffer):
+        buffer_id = int(request.buffer_id)
+        return {("buffer", buffer_id, int(index)) for index, _ in request.items}
+    elif isinstance(request, SetBufferRange):
+        buffer_id = int(request.buffer_id)
+        return {
+            ("buffer", buffer_id, int(index) + i)
+            for index, values in request.items
+            for i in range(len(values))
+        }
+    elif isinstance(request, FillBuffer):
+        buffer_id = int(request.buffer_id)
+        return {
+            ("buffer", buffer_id, int(index) + i)
+            for index, count, _ in request.items
+            for i in range(count)
+        }
+    return set()
+
+
+@dataclasses.dataclass
+class SynthState:
+    """
+    A synth's state, as its requests left it.
+    """
+
+    synthdef: Union[SynthDef, str]
+    controls: Dict[Union[int, str], ControlValue]
+    started: float
+    frees_itself: bool = False
+    expires: Optional[float] = None
+
+
+class ScoreState:
+    """
+    The state a score's requests leave behind.
+
+    Groups and synths are tracked in a :py:class:`~supriya.contexts.trees.NodeTree`,
+    along with each synth's controls as last set. Other requests, e.g. for SynthDefs,
+    buffers and buses, are kept to replay in order, less any which leave no state
+    behind, such as queries and buffer writes to disk. Bus and buffer samples set
+    again later only keep their last set, and allocating, zeroing or freeing a
+    buffer drops the requests which filled it before.
+
+    Synths count as freed once freed or released, and released synths' tails are
+    left to a segment's pre-roll. Done actions can't be seen from requests, so
+    synths whose SynthDefs free them via a done action are flagged, and count as
+    freed once the lines or envelopes driving it have run their course, where
+    their durations are known.
+
+    ::
+
+        >>> from supriya import default
+        >>> from supriya.contexts.nonrealtime import Score
+        >>> from supriya.contexts.segments import ScoreState
+        >>> score = Score()
+        >>> with score.at(0):
+        ...     with score.add_synthdefs(default):
+        ...         group = score.add_group()
+        ...         synth = score.add_synth(default, target_node=group)
+        ...
+        >>> with score.at(1):
+        ...     synth.set(frequency=443)
+        ...
+        >>> state = ScoreState()
+        >>> for bundle in score.iterate_request_bundles():
+        ...     for request in bundle.contents:
+        ...         state.apply(request, bundle.timestamp)
+        ...
+        >>> for request in state.to_requests():
+        ...     request.to_osc()
+        ...
+        OscMessage('/d_recv', b'SCgf...')
+        OscMessage('/g_new', 1000, 1, 0)
+        OscMessage('/s_new', 'default', 1001, 1, 1000, 'frequency', 443.0)
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._expirations: List[Tuple[float, int]] = []
+        self._lifetimes: List[Tuple[float, float]] = []
+        self._node_requests: Dict[int, List[Request]] = {}
+        self._node_tree = NodeTree()
+        self._buffer_request_keys: Dict[int, List[int]] = {}
+        self._parallel_group_ids: Set[int] = set()
+        self._pinned_buffer_ids: Set[int] = set()
+        self._request_count = 0
+        self._request_writes: Dict[int, Set[Hashable]] = {}
+        self._requests: Dict[int, Requestable] = {}
+        self._synthdefs: Dict[str, SynthDef] = {}
+        self._synths: Dict[int, SynthState] = {}
+        self._writers: Dict[Hashable, int] = {}
+
+    ### PRIVATE METHODS ###
+
+    def _add_node(
+        self,
+        node_id: int,
+        add_action: AddActionLike,
+        target_node_id: int,
+        timestamp: float,
+        is_group: bool = False,
+    ) -> bool:
+        add_action_ = AddAction.from_expr(add_action)
+        if node_id in self._node_tree:
+            return False
+        if (location := self._node_tree.locate(add_action_, target_node_id)) is None:
+            return False
+        self._node_tree.add(node_id, *location, is_group=is_group)
+        if add_action_ == AddAction.REPLACE:
+            self._free_node(target_node_id, timestamp)
+        return True
+
+    def _free_node(self, node_id: int, timestamp: float) -> None:
+        if not node_id or node_id not in self._node_tree:
+            return
+        for child_id in list(self._node_tree.iterate_children(node_id)):
+            self._free_node(child_id, timestamp)
+        self._node_tree.remove(node_id)
+        self._node_requests.pop(node_id, None)
+        self._parallel_group_ids.discard(node_id)
+        if (synth := self._synths.pop(node_id, None)) is not None:
+            self._lifetimes.append((synth.started, timestamp))
+
+    def _forget_buffer(self, buffer_id: int, keep_allocation: bool = False) -> None:
+        keys = self._buffer_request_keys.pop(buffer_id, [])
+        if (
+            keep_allocation
+            and keys
+            and isinstance(self._requests.get(keys[0]), _ALLOCATE_BUFFER_REQUESTS)
+        ):
+            self._buffer_request_keys[buffer_id] = [keys.pop(0)]
+        for key in keys:
+            self._remove_request(key)
+
+    def _iterate_synth_ids(self, node_id: int) -> Iterator[int]:
+        if not self._node_tree.is_group(node_id):
+            if node_id in self._synths:
+                yield node_id
+            return
+        for child_id in self._node_tree.iterate_children(node_id):
+            yield from self._iterate_synth_ids(child_id)
+
+    def _move_node(
+        self, node_id: int, add_action: AddActionLike, target_node_id: int
+    ) -> None:
+        if node_id == target_node_id or node_id not in self._node_tree:
+            return
+        location = self._node_tree.locate(
+            AddAction.from_expr(add_action), target_node_id
+        )
+        # scsynth won't move a group inside itself
+        if location is None or node_id in self._node_tree.get_parentage(location[0]):
+            return
+        self._node_tree.move(node_id, *location)
+
+    def _remove_request(self, key: int) -> None:
+        self._requests.pop(key, None)
+        self._remove_writes(key)
+
+    def _remove_writes(self, key: int) -> None:
+        for write in self._request_writes.pop(key, ()):
+            if self._writers.get(write) == key:
+                del self._writers[write]
+
+    def _set_controls(
+        self,
+        node_id: int,
+        items: Sequence[Tuple[Union[int, str], Any]],
+        timestamp: float,
+    ) -> None:
+        for synth_id in list(self._iterate_synth_ids(node_id)):
+            controls = self._synths[synth_id].controls
+            for control, value in items:
+                if isinstance(value, (list, tuple)):
+                    value = tuple(float(x) for x in value)
+                elif control == "gate" and not isinstance(value, str):
+                    if float(value) <= 0:
+                        self._free_node(synth_id, timestamp)
+                        break
+                controls[control] = value
+
+    def _track_request(self, request: Requestable) -> None:
+        if isinstance(request, (DoNothing,) + _OUTPUT_REQUESTS):
+            return
+        buffer_id: Optional[int] = None
+        writes = _get_writes(request)
+        if isinstance(request, CopyBuffer):
+            # Copies depend on both buffers' histories, so keep those whole
+            self._pinned_buffer_ids.update(
+                (int(request.source_buffer_id), int(request.target_buffer_id))
+            )
+        elif (buffer_id_ := getattr(request, "buffer_id", None)) is not None:
+            if (buffer_id := int(buffer_id_)) in self._pinned_buffer_ids:
+                buffer_id, writes = None, set()
+            elif isinstance(request, _ALLOCATE_BUFFER_REQUESTS + (FreeBuffer,)):
+                self._forget_buffer(buffer_id)
+                if isinstance(request, FreeBuffer):
+                    return
+            elif isinstance(request, ZeroBuffer):
+                self._forget_buffer(buffer_id, keep_allocation=True)
+            elif not isinstance(request, (SetBuffer, SetBufferRange, FillBuffer)):
+                # Other buffer requests may read samples set so far, so keep those
+                for key in self._buffer_request_keys.get(buffer_id, []):
+                    self._remove_writes(key)
+        key = self._request_count
+        self._request_count += 1
+        self._requests[key] = request
+        if buffer_id is not None:
+            self._buffer_request_keys.setdefault(buffer_id, []).append(key)
+        for write in writes:
+            if (previous_key := self._writers.get(write)) is not None:
+                previous_writes = self._request_writes[previous_key]
+                previous_writes.discard(write)
+                if not previous_writes:
+                    self._remove_request(previous_key)
+            self._writers[write] = key
+        if writes:
+            self._request_writes[key] = writes
+
+    def _track_lifespan(self, synth_id: int, synth: SynthState) -> None:
+        synthdef = synth.synthdef
+        if isinstance(synthdef, str):
+            if (synthdef_ := self._synthdefs.get(synthdef)) is None:
+                return
+            synthdef = synthdef_
+        synth.frees_itself, duration = _get_lifespan(synthdef, synth.controls)
+        if duration is not None:
+            synth.expires = synth.started + max(duration, 0.0)
+            heapq.heappush(self._expirations, (synth.expires, synth_id))
+
+    ### PUBLIC METHODS ###
+
+    def apply(self, requestable: Requestable, timestamp: float = 0.0) -> None:
+        """
+        Apply a request.
+
+        :param requestable: The request, or request bundle, to apply.
+        :param timestamp: The timestamp the request executes at.
+        """
+        self.expire(timestamp)
+        if isinstance(requestable, ReceiveSynthDefs):
+            for synthdef in requestable.synthdefs:
+                self._synthdefs[synthdef.actual_name] = synthdef
+        if isinstance(requestable, RequestBundle):
+            for x in requestable.contents:
+                self.apply(x, timestamp)
+        elif isinstance(requestable, (NewSynth, NewSynths)):
+            if isinstance(requestable, NewSynth):
+                synth_ids = [requestable.synth_id]
+            else:
+                synth_ids = list(requestable.synth_ids)
+            for i, synth_id in enumerate(synth_ids):
+                if not self._add_node(
+                    int(synth_id),
+                    requestable.add_action,
+                    int(requestable.target_node_id),
+                    timestamp,
+                ):
+                    continue
+                synth = self._synths[int(synth_id)] = SynthState(
+                    synthdef=requestable.synthdef, controls={}, started=timestamp
+                )
+                self._set_controls(
+                    int(synth_id),
+                    [
+                        (key, value[i] if isinstance(value, list) else value)
+                        for key, value in (requestable.controls or {}).items()
+                    ],
+                    timestamp,
+                )
+                if self._synths.get(int(synth_id)) is synth:
+                    self._track_lifespan(int(synth_id), synth)
+        elif isinstance(requestable, (NewGroup, NewParallelGroup)):
+            for group_id, add_action, target_node_id in requestable.items:
+                if self._add_node(
+                    int(group_id), add_action, int(target_node_id), timestamp, True
+                ) and isinstance(requestable, NewParallelGroup):
+                    self._parallel_group_ids.add(int(group_id))
+        elif isinstance(requestable, FreeNode):
+            for node_id in requestable.node_ids:
+                self._free_node(int(node_id), timestamp)
+        elif isinstance(requestable, FreeGroupChildren):
+            for node_id in requestable.node_ids:
+                for child_id in list(self._node_tree.iterate_children(int(node_id))):
+                    self._free_node(child_id, timestamp)
+        elif isinstance(requestable, FreeGroupDeep):
+            for node_id in requestable.node_ids:
+                for synth_id in list(self._iterate_synth_ids(int(node_id))):
+                    self._free_node(synth_id, timestamp)
+        elif isinstance(requestable, ReleaseNode):
+            self._free_node(int(requestable.node_id), timestamp)
+        elif isinstance(requestable, SetNodeControl):
+            self._set_controls(int(requestable.node_id), requestable.items, timestamp)
+        elif isinstance(requestable, (MapAudioBusToNode, MapControlBusToNode)):
+            prefix = "a" if isinstance(requestable, MapAudioBusToNode) else "c"
+            self._set_controls(
+                int(requestable.node_id),
+                [
+                    (control, f"{prefix}{int(bus_index)}")
+                    for control, bus_index in requestable.items
+                ],
+                timestamp,
+            )
+        elif isinstance(requestable, NODE_CONTROL_RANGE_REQUESTS):
+            if (node_id := int(requestable.node_id)) in self._node_tree:
+                self._node_requests.setdefault(node_id, []).append(requestable)
+        elif isinstance(
+            requestable,
+            (MoveNodeAfter, MoveNodeBefore, MoveNodeToGroupHead, MoveNodeToGroupTail),
+        ):
+            for node_id, target_node_id in requestable.items:
+                self._move_node(
+                    int(node_id),
+                    _MOVE_ADD_ACTIONS[type(requestable)],
+                    int(target_node_id),
+                )
+        elif isinstance(requestable, OrderNodes):
+            add_action = requestable.add_action
+            target_node_id = int(requestable.target_node_id)
+            for node_id in requestable.node_ids:
+                self._move_node(int(node_id), add_action, target_node_id)
+                add_action, target_node_id = AddAction.ADD_AFTER, int(node_id)
+        elif isinstance(requestable, RunNode):
+            for node_id, flag in requestable.items:
+                self._node_tree.set_active(int(node_id), bool(flag))
+        elif (on_completion := getattr(requestable, "on_completion", None)) is not None:
+            # Completion requests run right after their request, so track them apart
+            self._track_request(new(requestable, on_completion=None))
+            self.apply(on_completion, timestamp)
+        else:
+            self._track_request(requestable)
+
+    def expire(self, timestamp: float) -> None:
+        """
+        Free synths whose done actions free them by a timestamp.
+
+        :param timestamp: The timestamp to expire synths until.
+        """
+        while self._expirations and self._expirations[0][0] <= timestamp:
+            expires, synth_id = heapq.heappop(self._expirations)
+            synth = self._synths.get(synth_id)
+            if synth is not None and synth.expires == expires:
+                self._free_node(synth_id, expires)
+
+    def to_requests(self) -> List[Requestable]:
+        """
+        Build requests which rebuild the state.
+
+        Requests kept for replay come first, in order, then groups and synths are
+        rebuilt depth-first, and finally any paused nodes are paused again.
+        """
+        requests = list(self._requests.values())
+        node_requests: List[Request] = []
+        paused_node_ids: List[int] = []
+        stack = [(0, node_id) for node_id in self._node_tree.iterate_children(0)]
+        stack.reverse()
+        while stack:
+            parent_id, node_id = stack.pop()
+            if self._node_tree.is_group(node_id):
+                if node_id in self._parallel_group_ids:
+                    requests.append(
+                        NewParallelGroup(
+                            items=[(node_id, AddAction.ADD_TO_TAIL, parent_id)]
+                        )
+                    )
+                else:
+                    requests.append(
+                        NewGroup(items=[(node_id, AddAction.ADD_TO_TAIL, parent_id)])
+                    )
+                children = list(self._node_tree.iterate_children(node_id))
+                stack.extend((node_id, child_id) for child_id in reversed(children))
+            else:
+                synth = self._synths[node_id]
+                requests.append(
+                    NewSynth(
+                        synthdef=synth.synthdef,
+                        synth_id=node_id,
+                        add_action=AddAction.ADD_TO_TAIL,
+                        target_node_id=parent_id,
+                        controls=dict(synth.controls) or None,
+                    )
+                )
+            node_requests.extend(self._node_requests.get(node_id, []))
+            if not self._node_tree.is_active(node_id):
+                paused_node_ids.append(node_id)
+        requests.extend(node_requests)
+        if paused_node_ids:
+            requests.append(RunNode(items=[(x, False) for x in paused_node_ids]))
+        return requests
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def lifetimes(self) -> List[Tuple[float, float]]:
+        """
+        Get the start and stop timestamps of every synth freed so far.
+        """
+        return list(self._lifetimes)
+
+    @property
+    def synths(self) -> Dict[int, SynthState]:
+        """
+        Get the synths still playing, by ID.
+        """
+        return dict(self._synths)
+
+
+def stitch_segments(
+    segments: Sequence[Tuple[int, "numpy.ndarray"]],
+    boundaries: Sequence[int],
+    crossfade: int,
+) -> "numpy.ndarray":
+    """
+    Stitch segments' renders together, crossfading linearly at each boundary.
+
+    Each segment's frames are used from its boundary up to the next, and faded
+    out over the ``crossfade`` frames past it as the next segment fades in, the
+    two gains always summing to one.
+
+    ::
+
+        >>> import numpy
+        >>> from supriya.contexts.segments import stitch_segments
+        >>> first, second = numpy.ones((7, 1)), numpy.zeros((8, 1))
+        >>> stitch_segments([(0, first), (2, second)], [4], 3)[:, 0].tolist()
+        [1.0, 1.0, 1.0, 1.0, 0.75, 0.5, 0.25, 0.0, 0.0, 0.0]
+
+    :param segments: Pairs of each segment's starting frame and frames, of shape
+        ``(frame_count, channel_count)``, in order.
+    :param boundaries: The frames each segment after the first takes over at.
+    :param crossfade: The number of frames to crossfade over.
+    """
+    import numpy
+
+    frame_count = max(start + len(frames) for start, frames in segments)
+    stitched = numpy.zeros((frame_count, segments[0][1].shape[1]), dtype=numpy.float32)
+    edges = [0, *boundaries, frame_count]
+    for i, (start, frames) in enumerate(segments):
+        is_last = i + 1 == len(segments)
+        lo = max(edges[i], start)
+        hi = min(edges[i + 1] + (0 if is_last else crossfade), start + len(frames))
+        if hi <= lo:
+            continue
+        positions = numpy.arange(lo, hi)
+        gains = numpy.ones(hi - lo)
+        if i:
+            fading = positions < edges[i] + crossfade
+            gains[fading] = (positions[fading] - edges[i] + 1) / (crossfade + 1)
+        if not is_last:
+            fading = positions >= edges[i + 1]
+            gains[fading] = (edges[i + 1] + crossfade - positions[fading]) / (
+                crossfade + 1
+            )
+        stitched[lo:hi] += frames[lo - start : hi - start] * gains[:, None]
+    return stitched
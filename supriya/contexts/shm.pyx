@@ -1,6 +1,8 @@
 # cython: language_level=3
 # distutils: language = c++
 
+from cpython.buffer cimport PyBUF_FORMAT, PyBUF_WRITABLE
+
 from .shm cimport server_shared_memory_client
 
 
@@ -10,6 +12,10 @@ cdef class ServerSHM:
 
     Currently supports reading control busses only.
 
+    Exposes the control bus region through the buffer protocol, as a read-only
+    one-dimensional array of C floats, so ``memoryview(shm)`` and
+    ``numpy.asarray(shm)`` view the server's control busses without copying.
+
     .. warning::
 
        Not supported on Windows.
@@ -17,22 +23,50 @@ cdef class ServerSHM:
     """
     cdef server_shared_memory_client* client
     cdef unsigned int bus_count
+    cdef Py_ssize_t shape[1]
+    cdef Py_ssize_t strides[1]
 
     def __cinit__(self, unsigned int port_number, unsigned int bus_count):
         self.client = new server_shared_memory_client(port_number)
         self.bus_count = bus_count
+        self.shape[0] = bus_count
+        self.strides[0] = sizeof(float)
 
     def __dealloc__(self):
         del self.client
 
+    def __getbuffer__(self, Py_buffer* buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("shared memory control busses are read-only")
+        buffer.buf = <void*> self.client.get_control_busses()
+        if flags & PyBUF_FORMAT:
+            buffer.format = b"f"
+        else:
+            buffer.format = NULL
+        buffer.internal = NULL
+        buffer.itemsize = sizeof(float)
+        buffer.len = self.bus_count * sizeof(float)
+        buffer.ndim = 1
+        buffer.obj = self
+        buffer.readonly = 1
+        buffer.shape = self.shape
+        buffer.strides = self.strides
+        buffer.suboffsets = NULL
+
+    def __releasebuffer__(self, Py_buffer* buffer):
+        pass
+
     def __getitem__(self, item):
+        cdef float* busses = self.client.get_control_busses()
+        cdef Py_ssize_t index, start, stop, step
         if isinstance(item, int):
             if item < 0 or item >= self.bus_count:
                 raise ValueError("index out of bounds")
-            return self.client.get_control_busses()[item]
+            return busses[item]
         elif isinstance(item, slice):
-            result = []
-            for index in range(*item.indices(self.bus_count)):
-                result.append(self.client.get_control_busses()[index])
-            return result
-        raise ValueError(item)
\ No newline at end of file
+            start, stop, step = item.indices(self.bus_count)
+            return [busses[index] for index in range(start, stop, step)]
+        raise ValueError(item)
+
+    def __len__(self):
+        return self.bus_count
@@ -0,0 +1,319 @@
+"""
+Tools for mirroring a server's node tree client-side.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..enums import AddAction
+
+
+class NodeLink:
+    """
+    A node's position in a :py:class:`NodeTree`.
+
+    Links are intrusive: each node holds its own parent and sibling pointers,
+    and each group its first and last child, so no per-group child list is
+    ever searched or shifted.
+    """
+
+    __slots__ = (
+        "active",
+        "head",
+        "id_",
+        "is_group",
+        "next",
+        "parent",
+        "previous",
+        "tail",
+    )
+
+    def __init__(self, id_: int, is_group: bool) -> None:
+        self.active = True
+        self.head: Optional["NodeLink"] = None
+        self.id_ = id_
+        self.is_group = is_group
+        self.next: Optional["NodeLink"] = None
+        self.parent: Optional["NodeLink"] = None
+        self.previous: Optional["NodeLink"] = None
+        self.tail: Optional["NodeLink"] = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.id_}>"
+
+
+class NodeTree:
+    """
+    A client-side mirror of a server's node tree.
+
+    Nodes are indexed by ID and linked into doubly linked child lists, so
+    adding, moving and removing nodes, as ``/n_go``, ``/n_move`` and
+    ``/n_end`` notifications require, take constant time regardless of how
+    many siblings a node has.
+
+    ::
+
+        >>> from supriya.contexts.trees import NodeTree
+        >>> tree = NodeTree()
+        >>> tree.add(1, 0, -1, -1, is_group=True)
+        >>> tree.add(1000, 1, -1, -1)
+        >>> tree.add(1001, 1, 1000, -1)
+        >>> tree.add(1002, 1, -1, 1000)
+        >>> list(tree.iterate_children(1))
+        [1002, 1000, 1001]
+
+    ::
+
+        >>> tree.move(1002, 1, 1001, -1)
+        >>> tree.remove(1000)
+        >>> list(tree.iterate_children(1))
+        [1001, 1002]
+
+    ::
+
+        >>> tree.get_parentage(1002)
+        [1002, 1, 0]
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._links: Dict[int, NodeLink] = {0: NodeLink(0, True)}
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self._links
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    ### PRIVATE METHODS ###
+
+    def _link(
+        self, link: NodeLink, parent_id: int, previous_id: int, next_id: int
+    ) -> None:
+        if (parent := self._links.get(parent_id)) is None:
+            return
+        previous: Optional[NodeLink] = None
+        if previous_id == -1:
+            pass
+        elif (
+            sibling := self._links.get(previous_id)
+        ) is not None and sibling.parent is parent:
+            previous = sibling
+        elif (
+            next_id != -1
+            and (sibling := self._links.get(next_id)) is not None
+            and sibling.parent is parent
+        ):
+            previous = sibling.previous
+        else:
+            previous = parent.tail
+        next_ = previous.next if previous is not None else parent.head
+        link.parent, link.previous, link.next = parent, previous, next_
+        if previous is None:
+            parent.head = link
+        else:
+            previous.next = link
+        if next_ is None:
+            parent.tail = link
+        else:
+            next_.previous = link
+
+    def _unlink(self, link: NodeLink) -> None:
+        if (parent := link.parent) is None:
+            return
+        if link.previous is None:
+            parent.head = link.next
+        else:
+            link.previous.next = link.next
+        if link.next is None:
+            parent.tail = link.previous
+        else:
+            link.next.previous = link.previous
+        link.parent = link.previous = link.next = None
+
+    ### PUBLIC METHODS ###
+
+    def add(
+        self,
+        node_id: int,
+        parent_id: int,
+        previous_id: int,
+        next_id: int,
+        is_group: bool = False,
+    ) -> None:
+        """
+        Add a node, as described by an ``/n_go`` notification.
+
+        :param node_id: The node's ID.
+        :param parent_id: The node's parent group's ID.
+        :param previous_id: The ID of the node's previous sibling, or ``-1``.
+        :param next_id: The ID of the node's next sibling, or ``-1``.
+        :param is_group: Flag for groups vs synths.
+        """
+        if (link := self._links.get(node_id)) is None:
+            link = self._links[node_id] = NodeLink(node_id, bool(is_group))
+        else:
+            self._unlink(link)
+            link.active, link.is_group = True, bool(is_group)
+        self._link(link, parent_id, previous_id, next_id)
+
+    def clear(self) -> None:
+        """
+        Remove all nodes but the root node.
+        """
+        self._links.clear()
+        self._links[0] = NodeLink(0, True)
+
+    def get_parent(self, node_id: int) -> Optional[int]:
+        """
+        Get a node's parent's ID, if the node is known and linked.
+
+        :param node_id: The node's ID.
+        """
+        if (link := self._links.get(node_id)) is None or link.parent is None:
+            return None
+        return link.parent.id_
+
+    def get_parentage(self, node_id: int) -> List[int]:
+        """
+        Get the IDs of a node and its ancestors, innermost first.
+
+        :param node_id: The node's ID.
+        """
+        parentage = [node_id]
+        link = self._links.get(node_id)
+        while link is not None and (link := link.parent) is not None:
+            parentage.append(link.id_)
+        return parentage
+
+    def is_active(self, node_id: int) -> bool:
+        """
+        Get a node's paused/unpaused status, defaulting to unpaused.
+
+        :param node_id: The node's ID.
+        """
+        if (link := self._links.get(node_id)) is None:
+            return True
+        return link.active
+
+    def is_group(self, node_id: int) -> bool:
+        """
+        Check whether a node is a known group.
+
+        :param node_id: The node's ID.
+        """
+        if (link := self._links.get(node_id)) is None:
+            return False
+        return link.is_group
+
+    def iterate_children(self, node_id: int) -> Iterator[int]:
+        """
+        Iterate over the IDs of a group's children, head to tail.
+
+        :param node_id: The group's ID.
+        """
+        link = self._links.get(node_id)
+        child = link.head if link is not None else None
+        while child is not None:
+            yield child.id_
+            child = child.next
+
+    def locate(
+        self, add_action: AddAction, target_node_id: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Locate where scsynth would place a node added relative to a target node.
+
+        ::
+
+            >>> from supriya.enums import AddAction
+            >>> from supriya.contexts.trees import NodeTree
+            >>> tree = NodeTree()
+            >>> tree.add(1, 0, -1, -1, is_group=True)
+            >>> tree.add(1000, 1, -1, -1)
+            >>> tree.locate(AddAction.ADD_BEFORE, 1000)
+            (1, -1, 1000)
+            >>> tree.locate(AddAction.ADD_TO_TAIL, 1)
+            (1, 1000, -1)
+
+        :param add_action: The add action.
+        :param target_node_id: The target node's ID.
+
+        :return: The parent, previous sibling and next sibling IDs to pass to
+            :py:meth:`add` or :py:meth:`move`, or ``None`` if scsynth would reject
+            the target. Replacing a target leaves removing it to the caller.
+        """
+        if (target := self._links.get(target_node_id)) is None:
+            return None
+        previous: Optional[NodeLink]
+        next_: Optional[NodeLink]
+        if add_action in (AddAction.ADD_TO_HEAD, AddAction.ADD_TO_TAIL):
+            if not target.is_group:
+                return None
+            parent = target
+            if add_action == AddAction.ADD_TO_HEAD:
+                previous, next_ = None, target.head
+            else:
+                previous, next_ = target.tail, None
+        elif target.parent is None:
+            return None
+        else:
+            parent = target.parent
+            if add_action == AddAction.ADD_BEFORE:
+                previous, next_ = target.previous, target
+            elif add_action == AddAction.ADD_AFTER:
+                previous, next_ = target, target.next
+            else:
+                previous, next_ = target.previous, target.next
+        return (
+            parent.id_,
+            previous.id_ if previous is not None else -1,
+            next_.id_ if next_ is not None else -1,
+        )
+
+    def move(
+        self, node_id: int, parent_id: int, previous_id: int, next_id: int
+    ) -> None:
+        """
+        Move a node, as described by an ``/n_move`` notification.
+
+        :param node_id: The node's ID.
+        :param parent_id: The node's new parent group's ID.
+        :param previous_id: The ID of the node's new previous sibling, or ``-1``.
+        :param next_id: The ID of the node's new next sibling, or ``-1``.
+        """
+        if (link := self._links.get(node_id)) is None:
+            return
+        self._unlink(link)
+        self._link(link, parent_id, previous_id, next_id)
+
+    def remove(self, node_id: int) -> None:
+        """
+        Remove a node, as described by an ``/n_end`` notification.
+
+        Any children still linked to a removed group are detached, pending their
+        own removal.
+
+        :param node_id: The node's ID.
+        """
+        if not node_id or (link := self._links.pop(node_id, None)) is None:
+            return
+        self._unlink(link)
+        child = link.head
+        while child is not None:
+            next_ = child.next
+            child.parent = child.previous = child.next = None
+            child = next_
+        link.head = link.tail = None
+
+    def set_active(self, node_id: int, active: bool) -> None:
+        """
+        Set a node's paused/unpaused status, as ``/n_off`` and ``/n_on`` do.
+
+        :param node_id: The node's ID.
+        :param active: Flag for unpaused vs paused.
+        """
+        if (link := self._links.get(node_id)) is not None:
+            link.active = active
@@ -4,6 +4,7 @@ import hashlib
 import logging
 import pathlib
 import pickle
+import shutil
 import textwrap
 import warnings
 from typing import Union
@@ -83,6 +84,11 @@ class PlayExtension(Extension):
                 **render_kwargs,
             )
         )
+        # Renders served from the render cache live outside the output directory
+        if path.parent != output_path:
+            if not (output_path / path.name).exists():
+                shutil.copy(path, output_path)
+            path = output_path / path.name
         return websafe_audio(path)
 
     @staticmethod
@@ -2,11 +2,27 @@ import asyncio
 import dataclasses
 import datetime
 import hashlib
+import os
 import platform
+import re
+import shutil
 import subprocess
+import time
+from functools import partial
 from os import PathLike
 from pathlib import Path
-from typing import Coroutine, Optional, Tuple, Union
+from tempfile import NamedTemporaryFile
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from uqbar.graphs import Grapher
 from uqbar.io import open_path
@@ -33,12 +49,20 @@ class PlayMemo:
         self,
         output_file_path: Optional[PathLike] = None,
         render_directory_path: Optional[PathLike] = None,
+        *,
+        cache: Union[bool, "RenderCache"] = True,
         **kwargs,
     ) -> Coroutine[None, None, Tuple[Optional[Path], int]]:
         async def render_function() -> Tuple[Path, int]:
             if output_file_path is None:
                 hexdigest = hashlib.sha256(self.contents).hexdigest()
                 file_name = f"audio-{hexdigest}{self.suffix}"
+                if render_directory_path is None and (
+                    render_cache_ := RenderCache.from_expr(cache)
+                ):
+                    if (cached_path := render_cache_.get(file_name)) is None:
+                        cached_path = render_cache_.publish(file_name, self.contents)
+                    return cached_path, 0
                 path = Path(render_directory_path or supriya.output_path) / file_name
             else:
                 path = Path(output_file_path)
@@ -52,6 +76,202 @@ class PlayMemo:
         return cls(contents=path.read_bytes(), suffix=path.suffix)
 
 
+class RenderCache:
+    """
+    A persistent cache of rendered files, addressed by their contents' digests.
+
+    Renders are named after a SHA-256 digest of everything that determines their
+    output, e.g. ``score-<digest>.aiff``, so a file already cached under a name needs
+    no rendering again. Entries are published atomically, so concurrent renders of
+    the same score never observe each other's partial output, and are evicted least
+    recently used first once they exceed ``maximum_size`` bytes in total, or once
+    they go unused for ``maximum_age`` seconds.
+
+    ::
+
+        >>> import tempfile
+        >>> from supriya.io import RenderCache
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     cache = RenderCache(directory, maximum_size=1024)
+        ...     file_name = f"score-{'0' * 64}.aiff"
+        ...     cache.get(file_name) is None
+        ...     cache.publish(file_name, b"...").read_bytes()
+        ...     cache.get(file_name).name == file_name
+        ...     cache.statistics
+        ...
+        True
+        b'...'
+        True
+        RenderCache.Statistics(hits=1, misses=1, evictions=0)
+
+    :param directory_path: The directory to cache files in, defaulting to
+        :py:data:`supriya.output_path`.
+    :param maximum_age: The number of seconds an entry may go unused before eviction.
+    :param maximum_size: The number of bytes all entries may occupy.
+    """
+
+    @dataclasses.dataclass
+    class Statistics:
+        hits: int = 0
+        misses: int = 0
+        evictions: int = 0
+
+        @property
+        def hit_rate(self) -> float:
+            if not (total := self.hits + self.misses):
+                return 0.0
+            return self.hits / total
+
+    ### CLASS VARIABLES ###
+
+    # Only content-addressed file names are entries: plots and other output sharing
+    # the directory are never evicted.
+    _entry_pattern = re.compile(r"^[\w-]+-[0-9a-f]{64}\.[^.]+$")
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        directory_path: Optional[PathLike] = None,
+        *,
+        maximum_age: Optional[float] = None,
+        maximum_size: Optional[int] = None,
+    ) -> None:
+        self._directory_path = Path(directory_path) if directory_path else None
+        self._maximum_age = maximum_age
+        self._maximum_size = maximum_size
+        self._statistics = self.Statistics()
+
+    ### CLASS METHODS ###
+
+    @classmethod
+    def from_expr(
+        cls, expr: Union[bool, "RenderCache", None]
+    ) -> Optional["RenderCache"]:
+        """
+        Resolve a render cache from an expression.
+
+        ``True`` resolves to the default :py:data:`render_cache`, and ``False`` or
+        ``None`` to no cache at all.
+
+        :param expr: The expression to resolve.
+        """
+        if isinstance(expr, cls):
+            return expr
+        return render_cache if expr else None
+
+    ### PUBLIC METHODS ###
+
+    def evict(self) -> List[Path]:
+        """
+        Evict expired entries, then least recently used entries until the cache fits
+        its size limit.
+
+        :return: The paths of evicted entries.
+        """
+        if self._maximum_age is None and self._maximum_size is None:
+            return []
+        entries: List[Tuple[float, int, Path]] = []
+        for path in self.directory_path.iterdir():
+            if not self._entry_pattern.match(path.name):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # evicted concurrently
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        oldest_mtime = time.time() - (self._maximum_age or float("inf"))
+        total_size = sum(size for _, size, _ in entries)
+        evicted: List[Path] = []
+        for mtime, size, path in entries:
+            if mtime >= oldest_mtime and (
+                self._maximum_size is None or total_size <= self._maximum_size
+            ):
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+            evicted.append(path)
+        self._statistics.evictions += len(evicted)
+        return evicted
+
+    def get(self, file_name: str) -> Optional[Path]:
+        """
+        Get a cached file's path, marking it as recently used.
+
+        :param file_name: The cached file's name.
+
+        :return: The cached file's path, or None on cache misses.
+        """
+        path = self.directory_path / file_name
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._statistics.misses += 1
+            return None
+        self._statistics.hits += 1
+        return path
+
+    def publish(self, file_name: str, contents: Union[bytes, PathLike]) -> Path:
+        """
+        Publish a file to the cache atomically, then evict entries as necessary.
+
+        :param file_name: The cached file's name.
+        :param contents: The cached file's contents, or the path to copy them from.
+
+        :return: The cached file's path.
+        """
+        path = self.directory_path / file_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Stage next to the entry so the final rename never crosses filesystems
+        with NamedTemporaryFile(
+            "wb", delete=False, dir=path.parent, prefix=".", suffix=".tmp"
+        ) as file_pointer:
+            try:
+                if isinstance(contents, bytes):
+                    file_pointer.write(contents)
+                else:
+                    with open(contents, "rb") as source_file_pointer:
+                        shutil.copyfileobj(source_file_pointer, file_pointer)
+            except BaseException:
+                file_pointer.close()
+                Path(file_pointer.name).unlink(missing_ok=True)
+                raise
+        os.replace(file_pointer.name, path)
+        self.evict()
+        return path
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self) -> Path:
+        """
+        Get the cache's directory path.
+        """
+        return self._directory_path or supriya.output_path
+
+    @property
+    def maximum_age(self) -> Optional[float]:
+        """
+        Get the number of seconds an entry may go unused before eviction.
+        """
+        return self._maximum_age
+
+    @property
+    def maximum_size(self) -> Optional[int]:
+        """
+        Get the number of bytes all entries may occupy.
+        """
+        return self._maximum_size
+
+    @property
+    def statistics(self) -> "RenderCache.Statistics":
+        """
+        Get the cache's hit, miss and eviction counts.
+        """
+        return self._statistics
+
+
 class Player:
     ### INITIALIZER ###
 
@@ -151,4 +371,108 @@ def render(
     )
 
 
-__all__ = ["Player", "Plotter", "graph", "play", "plot", "render"]
+def render_many(
+    renderables: Sequence[Union[SupportsRender, SupportsRenderMemo]],
+    max_workers: Optional[int] = None,
+    *,
+    on_progress: Optional[Callable[[int, float], None]] = None,
+    render_directory_path: Optional[PathLike] = None,
+    **kwargs,
+) -> List[Tuple[Optional[Path], int]]:
+    """
+    Render many renderables concurrently, in one event loop.
+
+    At most ``max_workers`` renders, e.g. non-realtime ``scsynth`` processes, run at
+    once. If any render raises, renders still queued are cancelled, renders in
+    progress are cancelled and their processes killed, and the exception is
+    re-raised.
+
+    :param renderables: The renderables to render.
+    :param max_workers: The maximum number of concurrent renders, defaulting to the
+        number of CPUs.
+    :param on_progress: An optional callback, called with a renderable's index and
+        the fraction of it rendered so far.
+    :param render_directory_path: The directory to render in.
+    :param kwargs: Keyword arguments for each renderable's render.
+
+    :return: A list of pairs of output path and exit code, in the order of
+        ``renderables``.
+    """
+    supports_renders = [
+        (
+            renderable.__render_memo__()
+            if isinstance(renderable, SupportsRenderMemo)
+            else renderable
+        )
+        for renderable in renderables
+    ]
+    return asyncio.run(
+        _render_many(
+            supports_renders,
+            max_workers or os.cpu_count() or 1,
+            on_progress,
+            render_directory_path,
+            kwargs,
+        )
+    )
+
+
+async def _render_many(
+    supports_renders: List[SupportsRender],
+    max_workers: int,
+    on_progress: Optional[Callable[[int, float], None]],
+    render_directory_path: Optional[PathLike],
+    kwargs: Dict[str, Any],
+) -> List[Tuple[Optional[Path], int]]:
+    failed = asyncio.Event()
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def render_one(
+        index: int, supports_render: SupportsRender
+    ) -> Tuple[Optional[Path], int]:
+        async with semaphore:
+            # Never start queued renders once any render has failed
+            if failed.is_set():
+                raise asyncio.CancelledError
+            render_kwargs = dict(kwargs)
+            if on_progress is not None:
+                render_kwargs.update(on_progress=partial(on_progress, index))
+            try:
+                result = await supports_render.__render__(
+                    render_directory_path=render_directory_path, **render_kwargs
+                )
+            except Exception:
+                failed.set()
+                raise
+        if on_progress is not None:
+            on_progress(index, 1.0)
+        return result
+
+    tasks = [
+        asyncio.create_task(render_one(index, supports_render))
+        for index, supports_render in enumerate(supports_renders)
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+#: The render cache used by default, keeping up to 1 GiB of renders used within
+#: the last 30 days.
+render_cache = RenderCache(maximum_age=30 * 24 * 60 * 60, maximum_size=2**30)
+
+__all__ = [
+    "Player",
+    "Plotter",
+    "RenderCache",
+    "graph",
+    "play",
+    "plot",
+    "render",
+    "render_cache",
+    "render_many",
+]
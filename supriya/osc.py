@@ -9,19 +9,31 @@ import contextlib
 import dataclasses
 import datetime
 import enum
+import functools
 import inspect
+import itertools
 import logging
+import mmap
+import os
+import pathlib
 import queue
+import re
+import select
 import socket
 import socketserver
 import struct
+import sys
 import threading
 import time
 from collections.abc import Sequence as SequenceABC
 from typing import (
     Any,
     Callable,
+    ContextManager,
+    Deque,
     Dict,
+    Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -49,6 +61,114 @@ SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
 NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
 
+_INT32 = struct.Struct(">i")
+_NATIVE_UINT32 = struct.Struct("=I")
+# Linux reports a socket's cumulative receive queue drops as ancillary data.
+_SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40 if sys.platform == "linux" else None)
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+_TRACE_MAGIC = b"OSCTRC\x00\x01"
+_TRACE_RECORD = struct.Struct(">QcI")
+_UINT64 = struct.Struct(">Q")
+_NUMERIC_TYPE_TAGS = frozenset("dfi")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_type_tags(type_tags: str) -> Tuple[Union[str, struct.Struct], ...]:
+    """
+    Compile OSC type tags into decoding steps.
+
+    Runs of fixed-width numeric type tags collapse into a single precompiled
+    ``struct.Struct``, so a long ``ffff...`` run unpacks in one call.
+    """
+    steps: List[Union[str, struct.Struct]] = []
+    run = ""
+    for type_tag in type_tags:
+        if type_tag in _NUMERIC_TYPE_TAGS:
+            run += type_tag
+            continue
+        if run:
+            steps.append(struct.Struct(">" + run))
+            run = ""
+        steps.append(type_tag)
+    if run:
+        steps.append(struct.Struct(">" + run))
+    return tuple(steps)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_encoder(type_tags: str, widths: Tuple[int, ...]) -> struct.Struct:
+    """
+    Compile an OSC message layout into a single ``struct.Struct``.
+
+    ``widths`` holds the padded byte width of the address (zero for integer
+    addresses), the type tag string, and then each string or blob argument in
+    order, so the address, type tags and every argument pack in one call.
+    """
+    address_width, type_tags_width, *argument_widths = widths
+    format_ = [f"{address_width}s" if address_width else "i", f"{type_tags_width}s"]
+    iterator = iter(argument_widths)
+    for type_tag, run in itertools.groupby(type_tags[1:]):
+        if type_tag in "fi":
+            format_.append(f"{len(list(run))}{type_tag}")
+        elif type_tag == "s":
+            format_.extend(f"{next(iterator)}s" for _ in run)
+        elif type_tag == "b":
+            format_.extend(f"I{next(iterator)}s" for _ in run)
+    return struct.Struct(">" + "".join(format_))
+
+
+def _decode_int(view, index, end):
+    if index + 4 > end:
+        raise struct.error("datagram truncated")
+    return _INT32.unpack_from(view, index)[0], index + 4
+
+
+def _decode_blob_contents(data, view, start, stop):
+    if data.startswith(BUNDLE_PREFIX, start, stop):
+        try:
+            return OscBundle._decode(data, view, start, stop)
+        except Exception:
+            pass
+    try:
+        return OscMessage._decode(data, view, start, stop)
+    except Exception:
+        pass
+    return data[start:stop]
+
+
+def _padded_width(length: int) -> int:
+    return -(-length // 4) * 4
+
+
+def _join_frames(datagrams: Sequence[bytes]) -> bytes:
+    """
+    Length-prefix and concatenate ``datagrams`` for a single stream write.
+    """
+    pieces = []
+    for datagram in datagrams:
+        pieces.append(_INT32.pack(len(datagram)))
+        pieces.append(datagram)
+    return b"".join(pieces)
+
+
+def _split_frames(buffer: bytearray) -> List[bytes]:
+    """
+    Pop every complete length-prefixed frame off the front of ``buffer``.
+
+    OSC over TCP prefixes each packet with its size as a big-endian int32.
+    Trailing partial frames stay in ``buffer`` until more data arrives.
+    """
+    frames = []
+    index, size = 0, len(buffer)
+    while index + 4 <= size:
+        (length,) = _INT32.unpack_from(buffer, index)
+        if index + 4 + length > size:
+            break
+        frames.append(bytes(buffer[index + 4 : index + 4 + length]))
+        index += 4 + length
+    del buffer[:index]
+    return frames
+
 
 class OscMessage:
     """
@@ -155,6 +275,7 @@ class OscMessage:
             raise ValueError(f"address must be int or str, got {address}")
         self.address = address
         self.contents = tuple(contents)
+        self._encoded: Optional[Tuple[Any, Tuple, bytes]] = None
 
     ### SPECIAL METHODS ###
 
@@ -178,133 +299,128 @@ class OscMessage:
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, data, view, index, end):
+        address, index = cls._decode_string(data, view, index, end)
+        type_tags, index = cls._decode_string(data, view, index, end)
+        contents: List[Any] = []
+        array_stack = [contents]
+        for step in _compile_type_tags(type_tags[1:]):
+            if isinstance(step, struct.Struct):
+                if index + step.size > end:
+                    raise struct.error("datagram truncated")
+                array_stack[-1].extend(step.unpack_from(view, index))
+                index += step.size
+            elif step == "s":
+                value, index = cls._decode_string(data, view, index, end)
+                array_stack[-1].append(value)
+            elif step == "b":
+                (start, stop), index = cls._decode_blob(data, view, index, end)
+                array_stack[-1].append(_decode_blob_contents(data, view, start, stop))
+            elif step == "T":
+                array_stack[-1].append(True)
+            elif step == "F":
+                array_stack[-1].append(False)
+            elif step == "N":
+                array_stack[-1].append(None)
+            elif step == "[":
+                array: List[Any] = []
+                array_stack[-1].append(array)
+                array_stack.append(array)
+            elif step == "]":
+                array_stack.pop()
+            else:
+                raise RuntimeError(f"Unable to parse type {step!r}")
+        return cls(address, *contents)
+
     @staticmethod
-    def _decode_blob(data):
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
+    def _decode_blob(data, view, index, end):
+        actual_length, index = _decode_int(view, index, end)
         padded_length = actual_length
         if actual_length % 4 != 0:
             padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
+        return (index, min(index + actual_length, end)), index + padded_length
 
     @staticmethod
-    def _decode_string(data):
-        actual_length = data.index(b"\x00")
+    def _decode_string(data, view, index, end):
+        actual_length = data.index(b"\x00", index, end) - index
         padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
-
-    @staticmethod
-    def _encode_string(value):
-        result = bytes(value + "\x00", "ascii")
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
-
-    @staticmethod
-    def _encode_blob(value):
-        result = bytes(struct.pack(">I", len(value)) + value)
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
+        return str(view[index : index + actual_length], "ascii"), index + padded_length
 
     @classmethod
-    def _encode_value(cls, value):
+    def _encode_value(cls, value, type_tags, widths, values):
         if hasattr(value, "to_datagram"):
-            value = bytearray(value.to_datagram())
+            value = value.to_datagram()
         elif isinstance(value, enum.Enum):
             value = value.value
-        type_tags, encoded_value = "", b""
         if isinstance(value, (bytearray, bytes)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(value)
+            type_tags.append("b")
+            widths.append(_padded_width(len(value)))
+            values.extend((len(value), value))
         elif isinstance(value, str):
-            type_tags += "s"
-            encoded_value = cls._encode_string(value)
+            value = bytes(value, "ascii")
+            type_tags.append("s")
+            widths.append(_padded_width(len(value) + 1))
+            values.append(value)
         elif isinstance(value, bool):
-            type_tags += "T" if value else "F"
+            type_tags.append("T" if value else "F")
         elif isinstance(value, float):
-            type_tags += "f"
-            encoded_value += struct.pack(">f", value)
+            type_tags.append("f")
+            values.append(value)
         elif isinstance(value, int):
-            type_tags += "i"
-            encoded_value += struct.pack(">i", value)
+            type_tags.append("i")
+            values.append(value)
         elif value is None:
-            type_tags += "N"
+            type_tags.append("N")
         elif isinstance(value, SequenceABC):
-            type_tags += "["
+            type_tags.append("[")
             for sub_value in value:
-                sub_type_tags, sub_encoded_value = cls._encode_value(sub_value)
-                type_tags += sub_type_tags
-                encoded_value += sub_encoded_value
-            type_tags += "]"
+                cls._encode_value(sub_value, type_tags, widths, values)
+            type_tags.append("]")
         else:
             message = "Cannot encode {!r}".format(value)
             raise TypeError(message)
-        return type_tags, encoded_value
 
     ### PUBLIC METHODS ###
 
     def to_datagram(self) -> bytes:
+        # messages built from a template carry their pre-encoded datagram
+        if self._encoded is not None:
+            encoded_address, encoded_contents, datagram = self._encoded
+            if encoded_address is self.address and encoded_contents is self.contents:
+                return datagram
+        type_tags: List[str] = [","]
+        widths: List[int] = []
+        values: List[Any] = []
+        address: Union[bytes, int]
         # address can be a string or (in SuperCollider) an int
         if isinstance(self.address, str):
-            encoded_address = self._encode_string(self.address)
+            address = bytes(self.address, "ascii")
+            widths.append(_padded_width(len(address) + 1))
         else:
-            encoded_address = struct.pack(">i", self.address)
-        encoded_type_tags = ","
-        encoded_contents = b""
+            address = self.address
+            widths.append(0)
+        values.extend((address, b""))
         for value in self.contents or ():
-            type_tags, encoded_value = self._encode_value(value)
-            encoded_type_tags += type_tags
-            encoded_contents += encoded_value
-        return (
-            encoded_address + self._encode_string(encoded_type_tags) + encoded_contents
-        )
+            # fast path for the common numeric case, skipping the dispatch chain
+            value_type = type(value)
+            if value_type is float:
+                type_tags.append("f")
+                values.append(value)
+            elif value_type is int:
+                type_tags.append("i")
+                values.append(value)
+            else:
+                self._encode_value(value, type_tags, widths, values)
+        encoded_type_tags = "".join(type_tags)
+        widths.insert(1, _padded_width(len(encoded_type_tags) + 1))
+        values[1] = bytes(encoded_type_tags, "ascii")
+        return _compile_encoder(encoded_type_tags, tuple(widths)).pack(*values)
 
     @classmethod
     def from_datagram(cls, datagram):
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
-        contents = []
-        array_stack = [contents]
-        for type_tag in type_tags[1:]:
-            if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
-            elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
-                array_stack[-1].append(value)
-            elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
-                for class_ in (OscBundle, OscMessage):
-                    try:
-                        value = class_.from_datagram(value)
-                        break
-                    except Exception:
-                        pass
-                array_stack[-1].append(value)
-            elif type_tag == "T":
-                array_stack[-1].append(True)
-            elif type_tag == "F":
-                array_stack[-1].append(False)
-            elif type_tag == "N":
-                array_stack[-1].append(None)
-            elif type_tag == "[":
-                array = []
-                array_stack[-1].append(array)
-                array_stack.append(array)
-            elif type_tag == "]":
-                array_stack.pop()
-            else:
-                raise RuntimeError(f"Unable to parse type {type_tag!r}")
-        return cls(address, *contents)
+        data = bytes(datagram) if isinstance(datagram, memoryview) else datagram
+        return cls._decode(data, memoryview(data), 0, len(data))
 
     def to_list(self):
         result = [self.address]
@@ -418,6 +534,7 @@ class OscBundle:
             if not isinstance(x, prototype):
                 raise ValueError(contents)
         self.contents = tuple(contents)
+        self._datagram: Optional[Tuple[Any, Tuple, bool, bytes]] = None
 
     ### SPECIAL METHODS ###
 
@@ -438,13 +555,83 @@ class OscBundle:
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, data, view, index, end):
+        if not data.startswith(BUNDLE_PREFIX, index, end):
+            raise ValueError("datagram is not a bundle")
+        timestamp, index = cls._decode_date(view, index + len(BUNDLE_PREFIX), end)
+        contents = []
+        while index < end:
+            length, index = _decode_int(view, index, end)
+            stop = min(index + length, end)
+            if data.startswith(BUNDLE_PREFIX, index, stop):
+                item = cls._decode(data, view, index, stop)
+            else:
+                item = OscMessage._decode(data, view, index, stop)
+            contents.append(item)
+            index += length
+        return cls(timestamp=timestamp, contents=tuple(contents))
+
     @staticmethod
-    def _decode_date(data):
-        data, remainder = data[:8], data[8:]
-        if data == IMMEDIATELY:
-            return None, remainder
-        date = (struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
-        return date, remainder
+    def _decode_date(view, index, end):
+        if index + 8 > end:
+            raise struct.error("datagram truncated")
+        (value,) = _UINT64.unpack_from(view, index)
+        if value == 1:  # IMMEDIATELY
+            return None, index + 8
+        return (value / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA, index + 8
+
+    @classmethod
+    def _pack(
+        cls, contents, capacity: int, realtime: bool
+    ) -> List[List[Tuple[Union["OscBundle", OscMessage], bytes]]]:
+        # Greedily group encoded contents, in order, into runs whose elements
+        # (each length-prefixed) fit within ``capacity`` bytes.
+        groups = []
+        group: List[Tuple[Union[OscBundle, OscMessage], bytes]] = []
+        size = 0
+        for content in contents:
+            if isinstance(content, OscBundle):
+                elements = content._split(capacity - 4, realtime)
+            else:
+                elements = [(content, content.to_datagram())]
+            for element in elements:
+                length = len(element[1]) + 4
+                if group and size + length > capacity:
+                    groups.append(group)
+                    group, size = [], 0
+                group.append(element)
+                size += length
+        if group:
+            groups.append(group)
+        return groups
+
+    def _split(
+        self, maximum_size: int, realtime: bool
+    ) -> List[Tuple["OscBundle", bytes]]:
+        header = BUNDLE_PREFIX + self._encode_date(self.timestamp, realtime=realtime)
+        groups = self._pack(self.contents, maximum_size - len(header), realtime) or [[]]
+        if len(groups) == 1 and all(
+            x is y for (x, _), y in zip(groups[0], self.contents)
+        ):
+            bundles = [self]
+        else:
+            bundles = [
+                type(self)(
+                    timestamp=self.timestamp, contents=[content for content, _ in group]
+                )
+                for group in groups
+            ]
+        result = []
+        for bundle, group in zip(bundles, groups):
+            pieces = [header]
+            for _, datagram in group:
+                pieces.append(_INT32.pack(len(datagram)))
+                pieces.append(datagram)
+            datagram = b"".join(pieces)
+            bundle._datagram = (bundle.timestamp, bundle.contents, realtime, datagram)
+            result.append((bundle, datagram))
+        return result
 
     @staticmethod
     def _encode_date(seconds, realtime=True):
@@ -460,50 +647,66 @@ class OscBundle:
 
     @classmethod
     def from_datagram(cls, datagram):
-        if not datagram.startswith(BUNDLE_PREFIX):
-            raise ValueError("datagram is not a bundle")
-        remainder = datagram[8:]
-        timestamp, remainder = cls._decode_date(remainder)
-        contents = []
-        while len(remainder):
-            length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-            if remainder.startswith(BUNDLE_PREFIX):
-                item = cls.from_datagram(remainder[:length])
-            else:
-                item = OscMessage.from_datagram(remainder[:length])
-            contents.append(item)
-            remainder = remainder[length:]
-        osc_bundle = cls(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+        data = bytes(datagram) if isinstance(datagram, memoryview) else datagram
+        return cls._decode(data, memoryview(data), 0, len(data))
+
+    def pack(
+        self, maximum_size: int = 8192, realtime: bool = True
+    ) -> List["OscBundle"]:
+        """
+        Split the bundle into bundles encoding to at most ``maximum_size`` bytes.
+
+        Each message is encoded once, and the returned bundles keep their
+        encoded datagrams for :py:meth:`to_datagram`. Every returned bundle
+        keeps this bundle's timestamp, and nested bundles too large to fit are
+        split in turn, keeping theirs. Returns ``[self]`` if the bundle already
+        fits. Messages too large to fit are packed into bundles of their own.
+
+        ::
+
+            >>> bundle = OscBundle(
+            ...     timestamp=1401557034.5,
+            ...     contents=[OscMessage("/n_set", 1000 + i, "amplitude", 0.5) for i in range(5)],
+            ... )
+            >>> bundles = bundle.pack(maximum_size=136)
+            >>> [len(bundle.contents) for bundle in bundles]
+            [3, 2]
+            >>> [len(bundle.to_datagram()) for bundle in bundles]
+            [136, 96]
+            >>> all(bundle.timestamp == 1401557034.5 for bundle in bundles)
+            True
+
+        :param maximum_size: The maximum datagram size in bytes.
+        :param realtime: Flag for encoding timestamps as realtime, not NRT.
+        """
+        return [bundle for bundle, _ in self._split(maximum_size, realtime)]
 
     @classmethod
-    def partition(cls, messages, timestamp=None):
-        bundles = []
-        contents = []
-        message = collections.deque(messages)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while messages:
-            message = messages.popleft()
-            datagram = message.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(message)
-            else:
-                bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [message]
-                remaining = maximum
-        if contents:
-            bundles.append(cls(timestamp=timestamp, contents=contents))
-        return bundles
+    def partition(
+        cls, messages, timestamp=None, maximum_size: int = 8192
+    ) -> List["OscBundle"]:
+        """
+        Partition ``messages`` into bundles at ``timestamp`` encoding to at most
+        ``maximum_size`` bytes.
+        """
+        if not messages:
+            return []
+        return cls(timestamp=timestamp, contents=messages).pack(maximum_size)
 
     def to_datagram(self, realtime=True) -> bytes:
-        datagram = BUNDLE_PREFIX
-        datagram += self._encode_date(self.timestamp, realtime=realtime)
+        if (
+            (cached := self._datagram) is not None
+            and cached[0] is self.timestamp
+            and cached[1] is self.contents
+            and cached[2] == realtime
+        ):
+            return cached[3]
+        pieces = [BUNDLE_PREFIX, self._encode_date(self.timestamp, realtime=realtime)]
         for content in self.contents:
             content_datagram = content.to_datagram()
-            datagram += struct.pack(">i", len(content_datagram))
-            datagram += content_datagram
-        return datagram
+            pieces.append(_INT32.pack(len(content_datagram)))
+            pieces.append(content_datagram)
+        return b"".join(pieces)
 
     def to_list(self):
         result = [self.timestamp]
@@ -511,6 +714,121 @@ class OscBundle:
         return result
 
 
+class OscMessageTemplate:
+    """
+    A pre-encoded OSC message template.
+
+    The address, type tags and constant arguments are encoded once. Top-level
+    arguments given as ``int`` or ``float`` (the types themselves) are slots,
+    patched in place each time a datagram is produced.
+
+    ::
+
+        >>> from supriya.osc import OscMessageTemplate
+        >>> template = OscMessageTemplate(
+        ...     "/n_set", int, "frequency", float, "amplitude", float
+        ... )
+        >>> template
+        OscMessageTemplate('/n_set', int, 'frequency', float, 'amplitude', float)
+
+    ::
+
+        >>> osc_message = template.to_osc_message(1000, 443, 0.5)
+        >>> osc_message
+        OscMessage('/n_set', 1000, 'frequency', 443.0, 'amplitude', 0.5)
+
+    ::
+
+        >>> template.to_datagram(1000, 443.0, 0.5) == osc_message.to_datagram()
+        True
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, address, *contents) -> None:
+        # encode once with zeroed slots
+        prototype = OscMessage(
+            address,
+            *(0 if _ is int else 0.0 if _ is float else _ for _ in contents),
+        )
+        self.address = prototype.address
+        self.contents = tuple(contents)
+        self._datagram = prototype.to_datagram()
+        self._types: Tuple[type, ...] = tuple(
+            _ for _ in contents if _ is int or _ is float
+        )
+        # locate each slot from the encoded size of every argument
+        sizes: List[int] = []
+        for value in prototype.contents:
+            type_tags: List[str] = []
+            widths: List[int] = []
+            OscMessage._encode_value(value, type_tags, widths, [])
+            sizes.append(sum(widths) + 4 * sum(_ in "bfi" for _ in type_tags))
+        offset = len(self._datagram) - sum(sizes)
+        # split the datagram into constant segments around each slot, so that
+        # segments and slot values alternate in a single precompiled struct
+        format_, segments, start = [">"], [], 0
+        self._slot_indices: List[int] = []
+        for index, (value, size) in enumerate(zip(contents, sizes)):
+            if value is int or value is float:
+                segments.append(self._datagram[start:offset])
+                format_.append(f"{offset - start}s{'i' if value is int else 'f'}")
+                self._slot_indices.append(index)
+                start = offset + size
+            offset += size
+        segments.append(self._datagram[start:])
+        format_.append(f"{len(self._datagram) - start}s")
+        self._struct = struct.Struct("".join(format_))
+        self._arguments: List[Any] = [None] * (2 * len(segments) - 1)
+        self._arguments[::2] = segments
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                _.__name__ if _ is int or _ is float else repr(_)
+                for _ in [self.address, *self.contents]
+            ),
+        )
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self, *values) -> bytes:
+        """
+        Encode a datagram, patching ``values`` into the template's slots.
+
+        Values are packed as-is, so ``int`` slots require integers.
+        """
+        arguments = self._arguments.copy()
+        try:
+            arguments[1::2] = values
+        except ValueError:
+            raise ValueError(f"expected {len(self._types)} values, got {len(values)}")
+        return self._struct.pack(*arguments)
+
+    def to_osc_message(self, *values) -> OscMessage:
+        """
+        Build an OSC message, patching ``values`` into the template's slots.
+
+        The message carries the patched datagram, so encoding it again is free.
+        """
+        if len(values) != len(self._types):
+            raise ValueError(f"expected {len(self._types)} values, got {len(values)}")
+        values = tuple([type_(value) for type_, value in zip(self._types, values)])
+        contents = list(self.contents)
+        for index, value in zip(self._slot_indices, values):
+            contents[index] = value
+        osc_message = OscMessage(self.address, *contents)
+        osc_message._encoded = (
+            osc_message.address,
+            osc_message.contents,
+            self.to_datagram(*values),
+        )
+        return osc_message
+
+
 class OscProtocolOffline(Exception):
     pass
 
@@ -539,66 +857,338 @@ class HealthCheck:
     max_attempts: int = 5
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_address_pattern(pattern: str) -> Optional["re.Pattern[str]"]:
+    """
+    Compile an OSC 1.0 address pattern into a regular expression.
+
+    Returns ``None`` when ``pattern`` holds no wildcards and so only matches
+    itself::
+
+        >>> from supriya.osc import _compile_address_pattern
+        >>> _compile_address_pattern("/n_go") is None
+        True
+        >>> _compile_address_pattern("/n_*").pattern
+        '/n_[^/]*'
+        >>> _compile_address_pattern("/{b,g}_[!a-m]?").pattern
+        '/(?:b|g)_[^/a-m][^/]'
+    """
+    if not any(character in pattern for character in "?*[{"):
+        return None
+    regex, index = [], 0
+    while index < len(pattern):
+        character = pattern[index]
+        if character == "?":
+            regex.append("[^/]")
+        elif character == "*":
+            regex.append("[^/]*")
+        elif character == "[" and (stop := pattern.find("]", index)) != -1:
+            members = pattern[index + 1 : stop].replace("\\", "\\\\")
+            if members.startswith("!"):
+                regex.append("[^/" + members[1:] + "]")
+            else:
+                regex.append("[" + members.replace("^", "\\^") + "]")
+            index = stop
+        elif character == "{" and (stop := pattern.find("}", index)) != -1:
+            alternatives = pattern[index + 1 : stop].split(",")
+            regex.append("(?:" + "|".join(map(re.escape, alternatives)) + ")")
+            index = stop
+        else:
+            regex.append(re.escape(character))
+        index += 1
+    return re.compile("".join(regex))
+
+
+class _CallbackNode:
+    __slots__ = ("callbacks", "children", "snapshot")
+
+    def __init__(self) -> None:
+        self.callbacks: Dict[int, OscCallback] = {}
+        self.children: Dict[Any, _CallbackNode] = {}
+        self.snapshot: Optional[Tuple[OscCallback, ...]] = ()
+
+
+class _CallbackTable:
+    """
+    An OSC callback dispatch table.
+
+    Callbacks are indexed first on their pattern's address, then on each
+    further pattern item in a trie. Addresses holding OSC wildcards (``/n_*``,
+    ``/{b,g}_info``) compile to regular expressions, and the wildcard addresses
+    matching each incoming address are cached until the wildcard set changes.
+    Each trie node keys its callbacks by identity, so unregistering is a dict
+    pop per pattern item rather than a list scan, and snapshots them into a
+    tuple lazily on the next match.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.match_cache: Dict[Any, Tuple[_CallbackNode, ...]] = {}
+        self.nodes: Dict[Any, _CallbackNode] = {}
+        self.registered: Dict[int, OscCallback] = {}
+        self.wildcards: Dict[str, "re.Pattern[str]"] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __iter__(self) -> Iterator[OscCallback]:
+        return iter(list(self.registered.values()))
+
+    def __len__(self) -> int:
+        return len(self.registered)
+
+    ### PRIVATE METHODS ###
+
+    def _get_wildcard_nodes(self, address) -> Tuple[_CallbackNode, ...]:
+        try:
+            return self.match_cache[address]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable address
+            return ()
+        nodes = tuple(
+            self.nodes[pattern]
+            for pattern, regex in self.wildcards.items()
+            if pattern != address
+            and isinstance(address, str)
+            and regex.fullmatch(address)
+        )
+        if len(self.match_cache) >= 1024:
+            self.match_cache.clear()
+        self.match_cache[address] = nodes
+        return nodes
+
+    ### PUBLIC METHODS ###
+
+    def add(self, callback: OscCallback) -> None:
+        self.registered[id(callback)] = callback
+        for pattern in (callback.pattern, callback.failure_pattern):
+            if not pattern:
+                continue
+            address = pattern[0]
+            if address not in self.nodes and isinstance(address, str):
+                if (regex := _compile_address_pattern(address)) is not None:
+                    self.wildcards[address] = regex
+                    self.match_cache.clear()
+            children = self.nodes
+            for item in pattern:
+                node = children.get(item) or children.setdefault(item, _CallbackNode())
+                children = node.children
+            node.callbacks[id(callback)] = callback
+            node.snapshot = None
+
+    def match(self, message) -> List[OscCallback]:
+        address, contents = message.address, message.contents
+        matching_callbacks: List[OscCallback] = []
+        roots = [node] if (node := self.nodes.get(address)) is not None else []
+        if self.wildcards:
+            roots.extend(self._get_wildcard_nodes(address))
+        for node in roots:
+            index = 0
+            while True:
+                if (snapshot := node.snapshot) is None:
+                    snapshot = node.snapshot = tuple(node.callbacks.values())
+                if snapshot:
+                    matching_callbacks.extend(snapshot)
+                if not node.children or index == len(contents):
+                    break
+                try:
+                    node = node.children[contents[index]]
+                except (KeyError, TypeError):
+                    break
+                index += 1
+        return matching_callbacks
+
+    def remove(self, callback: OscCallback) -> None:
+        if self.registered.pop(id(callback), None) is None:
+            return
+        for pattern in (callback.pattern, callback.failure_pattern):
+            if not pattern:
+                continue
+            path: List[Tuple[Dict[Any, _CallbackNode], Any]] = []
+            children = self.nodes
+            for item in pattern:
+                if (node := children.get(item)) is None:
+                    break
+                path.append((children, item))
+                children = node.children
+            else:
+                children, item = path[-1]
+                node = children[item]
+                if node.callbacks.pop(id(callback), None) is not None:
+                    node.snapshot = None
+                # Prune emptied nodes from the leaf upward.
+                for children, item in reversed(path):
+                    node = children[item]
+                    if node.callbacks or node.children:
+                        break
+                    del children[item]
+                    if children is self.nodes and item in self.wildcards:
+                        del self.wildcards[item]
+                        self.match_cache.clear()
+
+
+class OscMetrics:
+    """
+    OSC traffic metrics.
+
+    Counts messages and bytes sent and received per address (bundles count
+    under ``#bundle``), keeps log2-bucketed histograms of request-to-reply
+    latencies per response pattern, and totals callback dispatch time per
+    procedure. Each update takes one uncontended lock.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self.callbacks: Dict[str, List[int]] = {}
+        self.latencies: Dict[str, List[int]] = {}
+        self.lock = threading.Lock()
+        self.received: Dict[Any, List[int]] = {}
+        self.sent: Dict[Any, List[int]] = {}
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_latency_key(pattern: Sequence[Union[float, str]]) -> str:
+        # Keep the pattern's leading strings, e.g. "/done /b_alloc", not IDs.
+        return " ".join(
+            str(x) for x in itertools.takewhile(lambda x: isinstance(x, str), pattern)
+        )
+
+    def _record_callback(self, procedure: Callable, nanoseconds: int) -> None:
+        name = getattr(procedure, "__qualname__", None) or repr(procedure)
+        with self.lock:
+            if (totals := self.callbacks.get(name)) is None:
+                totals = self.callbacks[name] = [0, 0, 0]
+            totals[0] += 1
+            totals[1] += nanoseconds
+            totals[2] = max(totals[2], nanoseconds)
+
+    def _record_traffic(
+        self,
+        table: Dict[Any, List[int]],
+        messages: Sequence[Union[OscBundle, OscMessage]],
+        datagrams: Sequence[bytes],
+    ) -> None:
+        with self.lock:
+            for message, datagram in zip(messages, datagrams):
+                address = (
+                    message.address if isinstance(message, OscMessage) else "#bundle"
+                )
+                if (totals := table.get(address)) is None:
+                    totals = table[address] = [0, 0]
+                totals[0] += 1
+                totals[1] += len(datagram)
+
+    ### PUBLIC METHODS ###
+
+    def as_dict(self) -> Dict[str, Dict]:
+        """
+        Export the metrics as plain data.
+
+        Latency histogram buckets are keyed by their exclusive upper bound in
+        microseconds.
+        """
+        with self.lock:
+            latencies = {}
+            for key, totals in self.latencies.items():
+                count, timeouts, total, minimum, maximum, *buckets = totals
+                latencies[key] = {
+                    "count": count,
+                    "timeouts": timeouts,
+                    "total_ns": total,
+                    "minimum_ns": minimum if count else None,
+                    "maximum_ns": maximum if count else None,
+                    "buckets_us": {
+                        2**i: bucket for i, bucket in enumerate(buckets) if bucket
+                    },
+                }
+            return {
+                "sent": {
+                    address: {"count": count, "bytes": bytes_}
+                    for address, (count, bytes_) in self.sent.items()
+                },
+                "received": {
+                    address: {"count": count, "bytes": bytes_}
+                    for address, (count, bytes_) in self.received.items()
+                },
+                "latencies": latencies,
+                "callbacks": {
+                    name: {"count": count, "total_ns": total, "maximum_ns": maximum}
+                    for name, (count, total, maximum) in self.callbacks.items()
+                },
+            }
+
+    def record_latency(
+        self, pattern: Sequence[Union[float, str]], nanoseconds: Optional[int]
+    ) -> None:
+        """
+        Record a request's round trip.
+
+        :param pattern: The request's response pattern.
+        :param nanoseconds: The time from sending to the reply, or ``None`` on
+            timing out.
+        """
+        key = self._get_latency_key(pattern)
+        with self.lock:
+            if (totals := self.latencies.get(key)) is None:
+                # count, timeouts, total, minimum, maximum, *buckets
+                totals = self.latencies[key] = [0, 0, 0, 0, 0]
+            if nanoseconds is None:
+                totals[1] += 1
+                return
+            totals[3] = min(totals[3], nanoseconds) if totals[0] else nanoseconds
+            totals[0] += 1
+            totals[2] += nanoseconds
+            totals[4] = max(totals[4], nanoseconds)
+            index = 5 + (nanoseconds // 1000).bit_length()
+            if index >= len(totals):
+                totals.extend([0] * (index + 1 - len(totals)))
+            totals[index] += 1
+
+    def reset(self) -> None:
+        with self.lock:
+            self.callbacks.clear()
+            self.latencies.clear()
+            self.received.clear()
+            self.sent.clear()
+
+
 class OscProtocol(metaclass=abc.ABCMeta):
     ### INITIALIZER ###
 
     def __init__(self) -> None:
-        self.callbacks: Dict[Any, Any] = {}
+        self.callbacks = _CallbackTable()
         self.captures: Set[Capture] = set()
+        self.ring_captures: Set[RingCapture] = set()
         self.healthcheck: Optional[HealthCheck] = None
         self.healthcheck_osc_callback: Optional[OscCallback] = None
         self.attempts = 0
+        # The largest datagram the transport accepts, or None for no limit.
+        self.maximum_datagram_size: Optional[int] = 8192
         self.ip_address = "127.0.0.1"
         self.is_running: bool = False
+        self.metrics: Optional[OscMetrics] = None
         self.port = 57551
 
     ### PRIVATE METHODS ###
 
     def _add_callback(self, callback: OscCallback) -> None:
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
+        self.callbacks.add(callback)
 
     def _disconnect(self) -> None:
         raise NotImplementedError
 
     def _match_callbacks(self, message) -> List[OscCallback]:
-        items = (message.address,) + message.contents
-        matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
-                break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
+        matching_callbacks = self.callbacks.match(message)
         for callback in matching_callbacks:
             if callback.once:
                 self.unregister(callback)
         return matching_callbacks
 
     def _remove_callback(self, callback: OscCallback) -> None:
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
-
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+        self.callbacks.remove(callback)
 
     def _pass_healthcheck(self, message) -> None:
         osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] healthcheck: passed")
@@ -649,6 +1239,10 @@ class OscProtocol(metaclass=abc.ABCMeta):
 
     def _validate_receive(self, datagram):
         udp_in_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
+        if self.ring_captures:
+            timestamp = time.monotonic_ns()
+            for ring_capture in self.ring_captures:
+                ring_capture._record(timestamp, "R", (datagram,))
         try:
             message = OscMessage.from_datagram(datagram)
         except Exception:
@@ -658,8 +1252,18 @@ class OscProtocol(metaclass=abc.ABCMeta):
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="R", message=message)
             )
+        if (metrics := self.metrics) is None:
+            for callback in self._match_callbacks(message):
+                yield callback, message
+            return
+        metrics._record_traffic(metrics.received, (message,), (datagram,))
         for callback in self._match_callbacks(message):
+            # The caller runs the callback between yielding and resuming.
+            started = time.perf_counter_ns()
             yield callback, message
+            metrics._record_callback(
+                callback.procedure, time.perf_counter_ns() - started
+            )
 
     def _validate_send(self, message):
         if not self.is_running:
@@ -677,8 +1281,51 @@ class OscProtocol(metaclass=abc.ABCMeta):
             )
         datagram = message.to_datagram()
         udp_out_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
+        if self.metrics is not None:
+            self.metrics._record_traffic(self.metrics.sent, (message,), (datagram,))
+        if self.ring_captures:
+            timestamp = time.monotonic_ns()
+            for ring_capture in self.ring_captures:
+                ring_capture._record(timestamp, "S", (datagram,))
         return datagram
 
+    def _validate_send_many(self, messages) -> List[bytes]:
+        if not self.is_running:
+            raise OscProtocolOffline
+        osc_messages = []
+        for message in messages:
+            if isinstance(message, str):
+                message = OscMessage(message)
+            elif isinstance(message, (OscBundle, OscMessage)):
+                pass
+            elif isinstance(message, SequenceABC):
+                message = OscMessage(*message)
+            else:
+                raise ValueError(message)
+            osc_messages.append(message)
+        datagrams = [message.to_datagram() for message in osc_messages]
+        if osc_out_logger.isEnabledFor(logging.DEBUG):
+            for message in osc_messages:
+                osc_out_logger.debug(f"[{self.ip_address}:{self.port}] {message!r}")
+        if udp_out_logger.isEnabledFor(logging.DEBUG):
+            for datagram in datagrams:
+                udp_out_logger.debug(f"[{self.ip_address}:{self.port}] {datagram}")
+        if self.captures:
+            timestamp = time.time()
+            entries = [
+                CaptureEntry(timestamp=timestamp, label="S", message=message)
+                for message in osc_messages
+            ]
+            for capture in self.captures:
+                capture.messages.extend(entries)
+        if self.metrics is not None:
+            self.metrics._record_traffic(self.metrics.sent, osc_messages, datagrams)
+        if self.ring_captures:
+            timestamp_ns = time.monotonic_ns()
+            for ring_capture in self.ring_captures:
+                ring_capture._record(timestamp_ns, "S", datagrams)
+        return datagrams
+
     ### PUBLIC METHODS ###
 
     @abc.abstractmethod
@@ -688,11 +1335,22 @@ class OscProtocol(metaclass=abc.ABCMeta):
     def capture(self) -> "Capture":
         return Capture(self)
 
+    def disable_metrics(self) -> None:
+        self.metrics = None
+
     def disconnect(self) -> None:
         osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] disconnecting")
         self._disconnect()
         osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] ...disconnected")
 
+    def enable_metrics(self) -> OscMetrics:
+        """
+        Enable collecting traffic metrics, if not already enabled.
+        """
+        if self.metrics is None:
+            self.metrics = OscMetrics()
+        return self.metrics
+
     @abc.abstractmethod
     def register(
         self,
@@ -706,10 +1364,21 @@ class OscProtocol(metaclass=abc.ABCMeta):
     ) -> OscCallback:
         raise NotImplementedError
 
+    def ring_capture(
+        self,
+        maximum_length: int = 4096,
+        path: Optional[Union[str, os.PathLike]] = None,
+    ) -> "RingCapture":
+        return RingCapture(self, maximum_length=maximum_length, path=path)
+
     @abc.abstractmethod
     def send(self, message) -> None:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def send_many(self, messages) -> None:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def unregister(self, callback: OscCallback):
         raise NotImplementedError
@@ -726,6 +1395,11 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
 
     ### PRIVATE METHODS ###
 
+    async def _create_transport(self, loop, ip_address: str, port: int) -> None:
+        await loop.create_datagram_endpoint(
+            lambda: self, remote_addr=(ip_address, port)
+        )
+
     def _disconnect(self) -> None:
         if not self.is_running:
             osc_protocol_logger.info(
@@ -783,9 +1457,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         self._setup(ip_address, port, healthcheck)
         loop = asyncio.get_running_loop()
         self.exit_future = loop.create_future()
-        _, protocol = await loop.create_datagram_endpoint(
-            lambda: self, remote_addr=(ip_address, port)
-        )
+        await self._create_transport(loop, ip_address, port)
         if self.healthcheck and self.healthcheck.active:
             self.healthcheck_task = asyncio.get_running_loop().create_task(
                 self._run_healthcheck()
@@ -846,10 +1518,70 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         datagram = self._validate_send(message)
         return self.transport.sendto(datagram)
 
+    def send_many(self, messages):
+        datagrams = self._validate_send_many(messages)
+        osc_protocol_logger.debug(
+            f"[{self.ip_address}:{self.port}] sending {len(datagrams)} datagrams"
+        )
+        sendto = self.transport.sendto
+        for datagram in datagrams:
+            sendto(datagram)
+
     def unregister(self, callback: OscCallback):
         self._remove_callback(callback)
 
 
+class AsyncTcpOscProtocol(asyncio.Protocol, AsyncOscProtocol):
+    """
+    An :py:mod:`asyncio`-based OSC protocol over TCP.
+
+    Packets are framed with a 4-byte big-endian length prefix, as expected by
+    ``scsynth -t``.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        AsyncOscProtocol.__init__(self)
+        self.buffer = bytearray()
+        self.maximum_datagram_size = None
+
+    ### PRIVATE METHODS ###
+
+    async def _create_transport(self, loop, ip_address: str, port: int) -> None:
+        self.buffer.clear()
+        await loop.create_connection(lambda: self, ip_address, port)
+
+    ### PUBLIC METHODS ###
+
+    def connection_lost(self, exc):
+        if self.is_running and self.healthcheck is not None:
+            osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] connection lost")
+            # Fail the next healthcheck immediately, which handles the shutdown.
+            self.attempts = self.healthcheck.max_attempts
+            return
+        AsyncOscProtocol.connection_lost(self, exc)
+
+    def data_received(self, data):
+        self.buffer.extend(data)
+        for datagram in _split_frames(self.buffer):
+            self.datagram_received(datagram, (self.ip_address, self.port))
+
+    def send(self, message):
+        osc_protocol_logger.debug(
+            f"[{self.ip_address}:{self.port}] sending: {message!r}"
+        )
+        datagram = self._validate_send(message)
+        return self.transport.write(_INT32.pack(len(datagram)) + datagram)
+
+    def send_many(self, messages):
+        datagrams = self._validate_send_many(messages)
+        osc_protocol_logger.debug(
+            f"[{self.ip_address}:{self.port}] sending {len(datagrams)} datagrams"
+        )
+        self.transport.write(_join_frames(datagrams))
+
+
 class ThreadedOscServer(socketserver.UDPServer):
     osc_protocol: "ThreadedOscProtocol"
 
@@ -858,7 +1590,8 @@ class ThreadedOscServer(socketserver.UDPServer):
         return True
 
     def service_actions(self):
-        if self.osc_protocol.healthcheck.active:
+        healthcheck = self.osc_protocol.healthcheck
+        if healthcheck is not None and healthcheck.active:
             self.osc_protocol._run_healthcheck()
 
 
@@ -891,7 +1624,10 @@ class ThreadedOscProtocol(OscProtocol):
                 )
                 return
             self._teardown()
-            if not self.osc_server._BaseServer__shutdown_request:
+            if threading.current_thread() is self.osc_server_thread:
+                # Shutting down from the serving thread, e.g. on healthcheck failure.
+                self.osc_server._BaseServer__shutdown_request = True
+            elif not self.osc_server._BaseServer__shutdown_request:
                 self.osc_server.shutdown()
             self.osc_server = None
             self.osc_server_thread = None
@@ -932,7 +1668,6 @@ class ThreadedOscProtocol(OscProtocol):
         osc_protocol_logger.info(
             f"[{self.ip_address}:{self.port}] healthcheck: failure limit exceeded"
         )
-        self.osc_server._BaseServer__shutdown_request = True
         self.disconnect()
         self.healthcheck.callback()
 
@@ -1003,6 +1738,14 @@ class ThreadedOscProtocol(OscProtocol):
             # print(message)
             raise
 
+    def send_many(self, messages) -> None:
+        datagrams = self._validate_send_many(messages)
+        address = (self.ip_address, self.port)
+        with self.lock:
+            sendto = self.osc_server.socket.sendto
+            for datagram in datagrams:
+                sendto(datagram, address)
+
     def unregister(self, callback: OscCallback) -> None:
         """
         Unregister a callback.
@@ -1011,6 +1754,282 @@ class ThreadedOscProtocol(OscProtocol):
         self.command_queue.put(("remove", callback))
 
 
+class ThreadedTcpOscProtocol(ThreadedOscProtocol):
+    """
+    A :py:mod:`threading`-based OSC protocol over TCP.
+
+    Packets are framed with a 4-byte big-endian length prefix, as expected by
+    ``scsynth -t``.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        ThreadedOscProtocol.__init__(self)
+        self.maximum_datagram_size = None
+        self.socket = None
+
+    ### PRIVATE METHODS ###
+
+    def _disconnect(self) -> None:
+        with self.lock:
+            if not self.is_running:
+                osc_protocol_logger.info(
+                    f"{self.ip_address}:{self.port} already disconnected!"
+                )
+                return
+            self._teardown()
+            socket_, self.socket = self.socket, None
+            thread, self.osc_server_thread = self.osc_server_thread, None
+            with contextlib.suppress(OSError):
+                socket_.shutdown(socket.SHUT_RDWR)
+        # Join outside the lock: the serving thread may be mid-callback and sending.
+        if threading.current_thread() is not thread:
+            thread.join()
+        socket_.close()
+
+    def _serve_forever(self, socket_, poll_interval=0.5):
+        buffer = bytearray()
+        readable = [socket_]
+        while self.is_running:
+            self._process_command_queue()
+            if self.healthcheck is not None and self.healthcheck.active:
+                self._run_healthcheck()
+                if not self.is_running:
+                    break
+            if not readable:
+                time.sleep(poll_interval)
+                continue
+            if not select.select(readable, [], [], poll_interval)[0]:
+                continue
+            try:
+                data = socket_.recv(65536)
+            except OSError:
+                data = b""
+            if not data:
+                if not self.is_running:
+                    break
+                osc_protocol_logger.info(
+                    f"[{self.ip_address}:{self.port}] connection lost"
+                )
+                readable.clear()
+                if self.healthcheck is None:
+                    self.disconnect()
+                else:
+                    # Fail the next healthcheck immediately.
+                    self.attempts = self.healthcheck.max_attempts
+                continue
+            buffer.extend(data)
+            self._process_command_queue()
+            for datagram in _split_frames(buffer):
+                for callback, message in self._validate_receive(datagram):
+                    callback.procedure(
+                        message, *(callback.args or ()), **(callback.kwargs or {})
+                    )
+
+    ### PUBLIC METHODS ###
+
+    def connect(
+        self, ip_address: str, port: int, *, healthcheck: Optional[HealthCheck] = None
+    ):
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] connecting...")
+        if self.is_running:
+            osc_protocol_logger.info(
+                f"[{self.ip_address}:{self.port}] already connected!"
+            )
+            raise OscProtocolAlreadyConnected
+        self._setup(ip_address, port, healthcheck)
+        self.healthcheck_deadline = time.time()
+        self.socket = socket.create_connection((ip_address, port))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.osc_server_thread = threading.Thread(
+            target=self._serve_forever, args=(self.socket,)
+        )
+        self.osc_server_thread.daemon = True
+        self.is_running = True
+        self.osc_server_thread.start()
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] ...connected")
+
+    def send(self, message) -> None:
+        datagram = self._validate_send(message)
+        with self.lock:
+            self.socket.sendall(_INT32.pack(len(datagram)) + datagram)
+
+    def send_many(self, messages) -> None:
+        data = _join_frames(self._validate_send_many(messages))
+        with self.lock:
+            self.socket.sendall(data)
+
+
+class ThreadedBatchOscProtocol(ThreadedOscProtocol):
+    """
+    A :py:mod:`threading`-based OSC protocol draining its socket in batches.
+
+    A receive thread only moves raw datagrams out of the kernel buffer, reading
+    until the socket would block. A dispatch thread decodes them and delivers
+    their callbacks up to ``batch_size`` datagrams at a time, acquiring
+    ``delivery_lock``, if any, once per batch rather than once per callback.
+
+    Where the platform reports it (Linux), ``dropped_count`` holds the number
+    of datagrams the kernel dropped because the receive buffer was full.
+
+    :param receive_buffer_size: The socket's ``SO_RCVBUF`` size in bytes.
+    :param batch_size: The maximum number of datagrams per batch.
+    :param delivery_lock: A lock to hold while delivering each batch.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        receive_buffer_size: Optional[int] = None,
+        batch_size: int = 256,
+        delivery_lock: Optional[ContextManager] = None,
+    ):
+        ThreadedOscProtocol.__init__(self)
+        if batch_size < 1:
+            raise ValueError(batch_size)
+        self.backlog: Deque[bytes] = collections.deque()
+        self.backlog_condition = threading.Condition(threading.Lock())
+        self.batch_size = batch_size
+        self.delivery_lock = delivery_lock
+        self.dispatch_thread: Optional[threading.Thread] = None
+        self.dropped_count = 0
+        self.receive_buffer_size = receive_buffer_size
+        self.socket: Any = None
+
+    ### PRIVATE METHODS ###
+
+    def _disconnect(self) -> None:
+        with self.lock:
+            if not self.is_running:
+                osc_protocol_logger.info(
+                    f"{self.ip_address}:{self.port} already disconnected!"
+                )
+                return
+            self._teardown()
+            socket_, self.socket = self.socket, None
+            threads = [self.osc_server_thread, self.dispatch_thread]
+            self.osc_server_thread = self.dispatch_thread = None
+        with self.backlog_condition:
+            self.backlog_condition.notify()
+        # Join outside the lock: the dispatch thread may be mid-callback and sending.
+        for thread in threads:
+            if thread is not None and thread is not threading.current_thread():
+                thread.join()
+        socket_.close()
+        self.backlog.clear()
+
+    def _dispatch_forever(self, poll_interval=0.5):
+        while self.is_running:
+            self._process_command_queue()
+            if self.healthcheck is not None and self.healthcheck.active:
+                self._run_healthcheck()
+                if not self.is_running:
+                    break
+            with self.backlog_condition:
+                if not self.backlog:
+                    self.backlog_condition.wait(poll_interval)
+                backlog = self.backlog
+                batch = [
+                    backlog.popleft() for _ in range(min(len(backlog), self.batch_size))
+                ]
+            if not batch:
+                continue
+            self._process_command_queue()
+            with self.delivery_lock or contextlib.nullcontext():
+                for datagram in batch:
+                    try:
+                        for callback, message in self._validate_receive(datagram):
+                            callback.procedure(
+                                message,
+                                *(callback.args or ()),
+                                **(callback.kwargs or {}),
+                            )
+                    except Exception:
+                        osc_protocol_logger.exception(
+                            f"[{self.ip_address}:{self.port}] failed to handle {datagram!r}"
+                        )
+
+    def _receive_forever(self, socket_, track_drops: bool, poll_interval=0.5):
+        readable = [socket_]
+        ancillary_size = socket.CMSG_SPACE(_NATIVE_UINT32.size) if track_drops else 0
+        while self.is_running:
+            if not select.select(readable, [], [], poll_interval)[0]:
+                continue
+            datagrams = []
+            while True:
+                try:
+                    if track_drops:
+                        datagram, ancillary_data, _, _ = socket_.recvmsg(
+                            65536, ancillary_size, _MSG_DONTWAIT
+                        )
+                        for level, type_, data in ancillary_data:
+                            if level == socket.SOL_SOCKET and type_ == _SO_RXQ_OVFL:
+                                self.dropped_count = _NATIVE_UINT32.unpack(data)[0]
+                    else:
+                        datagram = socket_.recv(65536, _MSG_DONTWAIT)
+                except OSError:  # Would block, or disconnected.
+                    break
+                datagrams.append(datagram)
+                if not _MSG_DONTWAIT:
+                    break
+            if datagrams:
+                with self.backlog_condition:
+                    self.backlog.extend(datagrams)
+                    self.backlog_condition.notify()
+
+    ### PUBLIC METHODS ###
+
+    def connect(
+        self, ip_address: str, port: int, *, healthcheck: Optional[HealthCheck] = None
+    ):
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] connecting...")
+        if self.is_running:
+            osc_protocol_logger.info(
+                f"[{self.ip_address}:{self.port}] already connected!"
+            )
+            raise OscProtocolAlreadyConnected
+        self._setup(ip_address, port, healthcheck)
+        self.healthcheck_deadline = time.time()
+        self.dropped_count = 0
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if self.receive_buffer_size is not None:
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+            )
+        track_drops = False
+        if _SO_RXQ_OVFL is not None and hasattr(self.socket, "recvmsg"):
+            with contextlib.suppress(OSError):
+                self.socket.setsockopt(socket.SOL_SOCKET, _SO_RXQ_OVFL, 1)
+                track_drops = True
+        self.socket.bind(("", 0))
+        self.osc_server_thread = threading.Thread(
+            target=self._receive_forever, args=(self.socket, track_drops)
+        )
+        self.osc_server_thread.daemon = True
+        self.dispatch_thread = threading.Thread(target=self._dispatch_forever)
+        self.dispatch_thread.daemon = True
+        self.is_running = True
+        self.osc_server_thread.start()
+        self.dispatch_thread.start()
+        osc_protocol_logger.info(f"[{self.ip_address}:{self.port}] ...connected")
+
+    def send(self, message) -> None:
+        datagram = self._validate_send(message)
+        with self.lock:
+            self.socket.sendto(datagram, (self.ip_address, self.port))
+
+    def send_many(self, messages) -> None:
+        datagrams = self._validate_send_many(messages)
+        address = (self.ip_address, self.port)
+        with self.lock:
+            sendto = self.socket.sendto
+            for datagram in datagrams:
+                sendto(datagram, address)
+
+
 class CaptureEntry(NamedTuple):
     timestamp: float
     label: str
@@ -1079,6 +2098,285 @@ class Capture:
         ]
 
 
+def _decode_datagram(datagram: bytes) -> Union[OscBundle, OscMessage]:
+    if datagram.startswith(BUNDLE_PREFIX):
+        return OscBundle.from_datagram(datagram)
+    return OscMessage.from_datagram(datagram)
+
+
+def _iterate_addresses(data, start: int, stop: int) -> Iterator[bytes]:
+    """
+    Yield the raw address of every message in ``data[start:stop]``.
+
+    Only walks bundle element sizes and address strings, leaving type tags and
+    arguments untouched.
+    """
+    if data[start : start + len(BUNDLE_PREFIX)] == BUNDLE_PREFIX:
+        index = start + len(BUNDLE_PREFIX) + 8
+        while index + 4 <= stop:
+            size = _INT32.unpack_from(data, index)[0]
+            index += 4
+            # Stop at corrupt sizes, which would otherwise walk backwards forever.
+            if size < 0 or index + size > stop:
+                return
+            yield from _iterate_addresses(data, index, index + size)
+            index += size
+    else:
+        end = data.find(b"\x00", start, stop)
+        yield data[start : end if end != -1 else stop]
+
+
+def _compile_address_matcher(address: str) -> Callable[[bytes], bool]:
+    if (regex := _compile_address_pattern(address)) is None:
+        return address.encode().__eq__
+    return lambda raw_address: bool(
+        regex.fullmatch(raw_address.decode(errors="replace"))
+    )
+
+
+class RingCaptureEntry(NamedTuple):
+    timestamp: int
+    label: str
+    datagram: bytes
+
+    @property
+    def message(self) -> Union[OscBundle, OscMessage]:
+        return _decode_datagram(self.datagram)
+
+
+class RingCapture:
+    """
+    A bounded OSC capture.
+
+    Keeps only the most recent ``maximum_length`` datagrams sent or received,
+    stamped with :func:`time.monotonic_ns`, and decodes them only when read.
+    When ``path`` is given, every datagram is also appended to a binary trace
+    file, readable via :py:class:`OscTraceReader`.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        osc_protocol,
+        maximum_length: int = 4096,
+        path: Optional[Union[str, os.PathLike]] = None,
+    ):
+        if maximum_length < 1:
+            raise ValueError(maximum_length)
+        self.osc_protocol = osc_protocol
+        self.entries: Deque[RingCaptureEntry] = collections.deque(maxlen=maximum_length)
+        self.path = pathlib.Path(path) if path is not None else None
+        self.writer: Optional[OscTraceWriter] = None
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        self.entries.clear()
+        if self.path is not None:
+            self.writer = OscTraceWriter(self.path)
+        self.osc_protocol.ring_captures.add(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.osc_protocol.ring_captures.discard(self)
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def __iter__(self) -> Iterator[RingCaptureEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    ### PRIVATE METHODS ###
+
+    def _record(self, timestamp: int, label: str, datagrams: Sequence[bytes]) -> None:
+        entries = [
+            RingCaptureEntry(timestamp, label, datagram) for datagram in datagrams
+        ]
+        self.entries.extend(entries)
+        if self.writer is not None:
+            self.writer.write(entries)
+
+    ### PUBLIC METHODS ###
+
+    def filtered(
+        self,
+        sent: bool = True,
+        received: bool = True,
+        status: bool = True,
+        address: Optional[str] = None,
+    ) -> List[Union[OscBundle, OscMessage]]:
+        """
+        Decode the captured messages passing the filters.
+
+        :param address: An address or OSC address pattern, e.g. ``/n_*``, at
+            least one message in each datagram must match.
+        """
+        matches = None if address is None else _compile_address_matcher(address)
+        messages = []
+        for _, label, datagram in tuple(self.entries):
+            if label == "R" and not received:
+                continue
+            if label == "S" and not sent:
+                continue
+            if not status and datagram.startswith(
+                (b"/status\x00", b"/status.reply\x00")
+            ):
+                continue
+            if matches is not None and not any(
+                map(matches, _iterate_addresses(datagram, 0, len(datagram)))
+            ):
+                continue
+            messages.append(_decode_datagram(datagram))
+        return messages
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def received_messages(self) -> List[Tuple[int, Union[OscBundle, OscMessage]]]:
+        return [
+            (timestamp, _decode_datagram(datagram))
+            for timestamp, label, datagram in tuple(self.entries)
+            if label == "R"
+        ]
+
+    @property
+    def sent_messages(self) -> List[Tuple[int, Union[OscBundle, OscMessage]]]:
+        return [
+            (timestamp, _decode_datagram(datagram))
+            for timestamp, label, datagram in tuple(self.entries)
+            if label == "S"
+        ]
+
+
+class OscTraceWriter:
+    """
+    An append-only binary OSC trace file writer.
+
+    A trace is an 8-byte magic header followed by records, each a big-endian
+    ``uint64`` monotonic-ns timestamp, a one-byte ``S``/``R`` label and a
+    ``uint32`` datagram length, followed by the datagram itself.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = pathlib.Path(path)
+        self.lock = threading.Lock()
+        self.file = open(self.path, "ab+")
+        self.file.seek(0)
+        header = self.file.read(len(_TRACE_MAGIC))
+        if not header:
+            self.file.write(_TRACE_MAGIC)
+        elif header != _TRACE_MAGIC:
+            self.file.close()
+            raise ValueError(f"not an OSC trace: {self.path}")
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "OscTraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        with self.lock:
+            self.file.close()
+
+    def flush(self) -> None:
+        with self.lock:
+            self.file.flush()
+
+    def write(self, entries: Iterable[RingCaptureEntry]) -> None:
+        pieces = []
+        for timestamp, label, datagram in entries:
+            pieces.append(_TRACE_RECORD.pack(timestamp, label.encode(), len(datagram)))
+            pieces.append(datagram)
+        with self.lock:
+            self.file.write(b"".join(pieces))
+
+
+class OscTraceReader:
+    """
+    A memory-mapped binary OSC trace file reader.
+
+    Filtering by address inspects only the address strings inside each
+    record, so only matching datagrams are copied out of the map and decoded.
+    A trailing record truncated mid-write is ignored.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        self.path = pathlib.Path(path)
+        with open(self.path, "rb") as file_:
+            if file_.read(len(_TRACE_MAGIC)) != _TRACE_MAGIC:
+                raise ValueError(f"not an OSC trace: {self.path}")
+            self.mmap = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "OscTraceReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[RingCaptureEntry]:
+        return self.filtered()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._iterate_records())
+
+    ### PRIVATE METHODS ###
+
+    def _iterate_records(self) -> Iterator[Tuple[int, bytes, int, int]]:
+        data, index, size = self.mmap, len(_TRACE_MAGIC), len(self.mmap)
+        while index + _TRACE_RECORD.size <= size:
+            timestamp, label, length = _TRACE_RECORD.unpack_from(data, index)
+            index += _TRACE_RECORD.size
+            if index + length > size:
+                return
+            yield timestamp, label, index, index + length
+            index += length
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        self.mmap.close()
+
+    def filtered(
+        self,
+        sent: bool = True,
+        received: bool = True,
+        address: Optional[str] = None,
+    ) -> Iterator[RingCaptureEntry]:
+        """
+        Iterate over the trace's records passing the filters.
+
+        :param address: An address or OSC address pattern, e.g. ``/n_*``, at
+            least one message in each datagram must match.
+        """
+        data = self.mmap
+        matches = None if address is None else _compile_address_matcher(address)
+        for timestamp, label, start, stop in self._iterate_records():
+            if label == b"R" and not received:
+                continue
+            if label == b"S" and not sent:
+                continue
+            if matches is not None and not any(
+                map(matches, _iterate_addresses(data, start, stop))
+            ):
+                continue
+            yield RingCaptureEntry(timestamp, label.decode(), data[start:stop])
+
+
 def find_free_port():
     with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as s:
         s.bind(("", 0))
@@ -1121,13 +2419,22 @@ def format_datagram(datagram):
 
 __all__ = [
     "AsyncOscProtocol",
+    "AsyncTcpOscProtocol",
     "Capture",
     "CaptureEntry",
     "HealthCheck",
     "OscBundle",
     "OscCallback",
     "OscMessage",
+    "OscMessageTemplate",
+    "OscMetrics",
     "OscProtocol",
+    "OscTraceReader",
+    "OscTraceWriter",
+    "RingCapture",
+    "RingCaptureEntry",
+    "ThreadedBatchOscProtocol",
     "ThreadedOscProtocol",
+    "ThreadedTcpOscProtocol",
     "find_free_port",
 ]
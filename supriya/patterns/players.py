@@ -27,7 +27,7 @@ from ..clocks import (
 )
 from ..contexts import Bus, Context, ContextObject, Node
 from .eventpatterns import Pattern
-from .events import Event, Priority, StartEvent, StopEvent
+from .events import Event, NodeEvent, Priority, StartEvent, StopEvent
 from .structure import PinPattern
 
 
@@ -81,20 +81,32 @@ class PatternPlayer:
     def _clock_callback(
         self, clock_context: ClockContext, *args, **kwargs
     ) -> Optional[float]:
-        for clock_context, seconds, offset, events in self._find_events(clock_context):
-            if self._initial_seconds is None:
-                self._initial_seconds = seconds
-            with self._context.at(seconds):
-                for event, priority in events:
-                    event.perform(
-                        self._context,
-                        self._proxies_by_uuid,
-                        current_offset=offset,
-                        notes_mapping=self._notes_by_uuid,
-                        priority=priority,
-                    )
-                    if self._callback is not None:
-                        self._callback(self, clock_context, event, priority)
+        # Flush every moment performed in this tick in one batch.
+        with self._context.batch_messages():
+            for clock_context, seconds, offset, events in self._find_events(
+                clock_context
+            ):
+                if self._initial_seconds is None:
+                    self._initial_seconds = seconds
+                # Reserve node IDs for the whole moment up front.
+                node_count = sum(
+                    isinstance(event, NodeEvent)
+                    and priority == Priority.START
+                    and event.id_ not in self._proxies_by_uuid
+                    for event, priority in events
+                )
+                with self._context.at(seconds):
+                    with self._context.reserve_node_ids(node_count):
+                        for event, priority in events:
+                            event.perform(
+                                self._context,
+                                self._proxies_by_uuid,
+                                current_offset=offset,
+                                notes_mapping=self._notes_by_uuid,
+                                priority=priority,
+                            )
+                            if self._callback is not None:
+                                self._callback(self, clock_context, event, priority)
         return self._next_delta
 
     def _find_events(
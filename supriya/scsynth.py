@@ -9,7 +9,7 @@ import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import uqbar.io
 import uqbar.objects
@@ -402,9 +402,25 @@ class AsyncProcessProtocol(asyncio.SubprocessProtocol, ProcessProtocol):
 
 
 class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol):
-    def __init__(self, exit_future: asyncio.Future) -> None:
+    """
+    A process protocol for non-realtime ``scsynth`` renders.
+
+    ``scsynth`` announces each OSC packet it reaches with a ``nextOSCPacket <time>``
+    line, reported to ``on_progress`` as that packet's time in seconds.
+
+    :param exit_future: The future to resolve with the process' exit code.
+    :param on_progress: An optional callback to report progress to.
+    """
+
+    def __init__(
+        self,
+        exit_future: asyncio.Future,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ) -> None:
         self.buffer_ = ""
         self.exit_future = exit_future
+        self.on_progress = on_progress
+        self.transport: Optional[asyncio.SubprocessTransport] = None
 
     async def run(self, command: List[str], render_directory_path: Path) -> None:
         logger.info(f"Running: {' '.join(command)}")
@@ -419,11 +435,28 @@ class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol):
 
     def handle_line(self, line: str) -> None:
         logger.debug(f"Received: {line}")
+        if self.on_progress is None or not line.startswith("nextOSCPacket "):
+            return
+        try:
+            timestamp = float(line.split()[1])
+        except (IndexError, ValueError):
+            return
+        self.on_progress(timestamp)
 
     def connection_made(self, transport):
         logger.debug("Connecting")
         self.transport = transport
 
+    def kill(self) -> None:
+        """
+        Kill the process, e.g. when its render is cancelled.
+        """
+        if self.transport is None:
+            return
+        logger.debug("Killing")
+        # Closing the transport kills the process if it's still running
+        self.transport.close()
+
     def pipe_data_received(self, fd, data):
         logger.debug(f"Data: {data}")
         # *nix and OSX return full lines,
@@ -439,4 +472,5 @@ class AsyncNonrealtimeProcessProtocol(asyncio.SubprocessProtocol):
 
     def process_exited(self):
         logger.debug(f"Exiting with {self.transport.get_returncode()}")
-        self.exit_future.set_result(self.transport.get_returncode())
+        if not self.exit_future.done():  # e.g. cancelled
+            self.exit_future.set_result(self.transport.get_returncode())
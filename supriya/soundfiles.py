@@ -6,15 +6,19 @@ import asyncio
 import dataclasses
 import hashlib
 import shlex
+import struct
 from os import PathLike
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from uqbar.io import find_executable
 from uqbar.strings import to_dash_case
 
 from . import output_path
 
+if TYPE_CHECKING:
+    import numpy
+
 
 @dataclasses.dataclass(frozen=True)
 class Say:
@@ -140,3 +144,100 @@ class Say:
             render_directory_path = Path(output_path).resolve()
             output_file_path = render_directory_path / self._build_file_path()
         return output_file_path
+
+
+def read_float_wav(file_path: PathLike) -> "numpy.ndarray":
+    """
+    Read a 32-bit float WAV file's samples, memory-mapping its data chunk.
+
+    Returns a read-only array of shape ``(frame_count, channel_count)``, valid for as
+    long as the file exists.
+
+    ::
+
+        >>> import numpy, tempfile
+        >>> from pathlib import Path
+        >>> from supriya.soundfiles import read_float_wav, write_float_wav
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = Path(directory) / "samples.wav"
+        ...     write_float_wav(path, numpy.array([[0.0, 0.5], [1.0, -1.0]]), 44100)
+        ...     read_float_wav(path).tolist()
+        ...
+        [[0.0, 0.5], [1.0, -1.0]]
+
+    :param file_path: The file path to read from.
+    """
+    import numpy
+
+    with open(file_path, "rb") as file_pointer:
+        riff, _, wave = struct.unpack("<4sI4s", file_pointer.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError(f"not a WAV file: {file_path}")
+        channel_count = 0
+        while True:
+            header = file_pointer.read(8)
+            if len(header) < 8:
+                raise ValueError(f"no data chunk: {file_path}")
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                chunk = file_pointer.read(chunk_size + chunk_size % 2)
+                format_tag, channel_count = struct.unpack("<HH", chunk[:4])
+                (bits_per_sample,) = struct.unpack("<H", chunk[14:16])
+                if format_tag == 0xFFFE:  # WAVE_FORMAT_EXTENSIBLE
+                    (format_tag,) = struct.unpack("<H", chunk[24:26])
+                if format_tag != 3 or bits_per_sample != 32:
+                    raise ValueError(f"not a 32-bit float WAV file: {file_path}")
+            elif chunk_id == b"data":
+                offset = file_pointer.tell()
+                break
+            else:
+                file_pointer.seek(chunk_size + chunk_size % 2, 1)
+    if not channel_count:
+        raise ValueError(f"no format chunk: {file_path}")
+    frame_count = chunk_size // (4 * channel_count)
+    if not frame_count:
+        return numpy.zeros((0, channel_count), dtype=numpy.float32)
+    return numpy.memmap(
+        file_path,
+        dtype="<f4",
+        mode="r",
+        offset=offset,
+        shape=(frame_count, channel_count),
+    )
+
+
+def write_float_wav(
+    file_path: PathLike, array: "numpy.ndarray", sample_rate: float
+) -> None:
+    """
+    Write samples to a 32-bit float WAV file.
+
+    :param file_path: The file path to write into.
+    :param array: The samples to write, of shape ``(frame_count, channel_count)``.
+    :param sample_rate: The sample rate to record in the file's header.
+    """
+    import numpy
+
+    array = numpy.asarray(array, dtype="<f4")
+    frame_count, channel_count = array.shape
+    data_size = array.nbytes
+    with open(file_path, "wb") as file_pointer:
+        file_pointer.write(
+            struct.pack(
+                "<4sI4s4sIHHIIHH4sI",
+                b"RIFF",
+                36 + data_size,
+                b"WAVE",
+                b"fmt ",
+                16,
+                3,  # WAVE_FORMAT_IEEE_FLOAT
+                channel_count,
+                int(sample_rate),
+                int(sample_rate) * channel_count * 4,
+                channel_count * 4,
+                32,
+                b"data",
+                data_size,
+            )
+        )
+        numpy.ascontiguousarray(array).tofile(file_pointer)
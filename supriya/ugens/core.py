@@ -4025,7 +4025,7 @@ class UGen(UGenOperable):
             antecedent_bundle = sort_bundles.get(antecedent, None)
             if not antecedent_bundle:
                 continue
-            antecedent_bundle.descendants.remove(self)
+            del antecedent_bundle.descendants[self]
             antecedent._optimize_graph(sort_bundles)
 
     def _postprocess_kwargs(
@@ -4595,7 +4595,9 @@ class SynthDef:
             ugens_ = self._optimize_ugen_graph(ugens_)
         ugens_ = self._sort_ugens_topologically(ugens_)
         self._ugens = tuple(ugens_)
+        self._ugen_indices = {ugen: i for i, ugen in enumerate(self._ugens)}
         self._constants = self._collect_constants(self._ugens)
+        self._constant_indices = {x: i for i, x in enumerate(self._constants)}
         self._control_ugens = self._collect_control_ugens(self._ugens)
         self._indexed_parameters = self._collect_indexed_parameters(self._control_ugens)
         self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
@@ -4896,12 +4898,15 @@ class SynthDef:
 
         local_bufs = []
         processed_ugens = []
+        index = 0
         for ugen in ugens:
             if isinstance(ugen, OutputProxy):
                 ugen = ugen.source
             if isinstance(ugen, MaxLocalBufs):
                 continue
             if isinstance(ugen, LocalBuf):
+                if not local_bufs:
+                    index = len(processed_ugens)
                 local_bufs.append(ugen)
             processed_ugens.append(ugen)
         if local_bufs:
@@ -4910,7 +4915,6 @@ class SynthDef:
                 inputs = list(local_buf.inputs[:2])
                 inputs.append(max_local_bufs)
                 local_buf._inputs = tuple(inputs)
-            index = processed_ugens.index(local_bufs[0])
             processed_ugens[index:index] = [max_local_bufs.source]
         return tuple(processed_ugens)
 
@@ -4919,6 +4923,9 @@ class SynthDef:
         from . import LocalBuf, PV_Copy
 
         input_mapping = SynthDef._build_input_mapping(ugens)
+        # Collect the UGens to insert before each descendant, then splice
+        # them all in with a single pass over the graph.
+        insertions: Dict[UGen, List[UGenOperable]] = {}
         for antecedent, descendants in input_mapping.items():
             if len(descendants) == 1:
                 continue
@@ -4929,23 +4936,26 @@ class SynthDef:
                 inputs = list(descendant._inputs)
                 inputs[input_index] = pv_copy
                 descendant._inputs = tuple(inputs)
-                index = ugens.index(descendant)
-                replacement = []
+                replacement = insertions.setdefault(descendant, [])
                 if isinstance(fft_size, UGenOperable):
                     replacement.append(fft_size)
                 replacement.extend([new_buffer.source, pv_copy.source])
-                ugens[index:index] = replacement
-        return ugens
+        if not insertions:
+            return ugens
+        processed_ugens = []
+        for ugen in ugens:
+            if ugen in insertions:
+                processed_ugens.extend(insertions.pop(ugen))
+            processed_ugens.append(ugen)
+        return processed_ugens
 
     @staticmethod
     def _collect_constants(ugens) -> Tuple[float, ...]:
-        constants = []
+        constants: Dict[float, None] = {}
         for ugen in ugens:
             for input_ in ugen._inputs:
-                if not isinstance(input_, float):
-                    continue
-                if input_ not in constants:
-                    constants.append(input_)
+                if isinstance(input_, float):
+                    constants.setdefault(input_, None)
         return tuple(constants)
 
     @staticmethod
@@ -4978,25 +4988,26 @@ class SynthDef:
 
     @staticmethod
     def _initialize_topological_sort(ugens):
-        ugens = list(ugens)
         sort_bundles = collections.OrderedDict()
-        width_first_antecedents = []
+        width_first_antecedents: Tuple[UGen, ...] = ()
         # The UGens are in the order they were added to the SynthDef
         # and that order already mostly places inputs before outputs.
         # In sclang, the per-UGen width-first antecedents list is
         # updated at the moment the UGen is added to the SynthDef.
         # Because we don't store that state on UGens in supriya, we'll
         # do it here.
+        #
+        # Each width-first UGen already depends on every width-first UGen
+        # before it, so depending on only the most recent one schedules
+        # identically, without an edge per preceding width-first UGen.
         for ugen in ugens:
             sort_bundles[ugen] = UGenSortBundle(ugen, width_first_antecedents)
             if ugen._is_width_first:
-                width_first_antecedents.append(ugen)
+                width_first_antecedents = (ugen,)
+        # Visiting UGens in order appends each to its antecedents'
+        # descendants in order too, as sclang's sort by synth index would.
         for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
+            sort_bundles[ugen]._initialize_topological_sort(sort_bundles)
         return sort_bundles
 
     @staticmethod
@@ -5288,8 +5299,10 @@ class UGenSortBundle:
     ### INITIALIZER ###
 
     def __init__(self, ugen, width_first_antecedents):
-        self.antecedents = []
-        self.descendants = []
+        # Dicts act as insertion-ordered sets.
+        self.antecedents: Dict[UGen, None] = {}
+        self.descendants: Dict[UGen, None] = {}
+        self.is_available = False
         self.ugen = ugen
         self.width_first_antecedents = tuple(width_first_antecedents)
 
@@ -5301,36 +5314,30 @@ class UGenSortBundle:
                 input_ = input_.source
             elif not isinstance(input_, UGen):
                 continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+            self.antecedents.setdefault(input_, None)
+            sort_bundles[input_].descendants.setdefault(self.ugen, None)
         for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
+            self.antecedents.setdefault(input_, None)
+            sort_bundles[input_].descendants.setdefault(self.ugen, None)
 
     def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
+        if not self.antecedents and not self.is_available:
+            self.is_available = True
+            available_ugens.append(self.ugen)
 
     def _schedule(self, available_ugens, out_stack, sort_bundles):
         for ugen in reversed(self.descendants):
             sort_bundle = sort_bundles[ugen]
-            sort_bundle.antecedents.remove(self.ugen)
+            del sort_bundle.antecedents[self.ugen]
             sort_bundle._make_available(available_ugens)
         out_stack.append(self.ugen)
 
     ### PUBLIC METHODS ###
 
     def clear(self) -> None:
-        self.antecedents[:] = []
-        self.descendants[:] = []
-        self.width_first_antecedents[:] = []
+        self.antecedents.clear()
+        self.descendants.clear()
+        self.width_first_antecedents = ()
 
 
 class SuperColliderSynthDef:
@@ -6022,12 +6029,12 @@ class SynthDefCompiler:
         result = []
         if isinstance(input_, float):
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xFFFFFFFF))
-            constant_index = synthdef._constants.index(input_)
+            constant_index = synthdef._constant_indices[input_]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(constant_index))
         elif isinstance(input_, OutputProxy):
             ugen = input_.source
             output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
+            ugen_index = synthdef._ugen_indices[ugen]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
         else:
@@ -0,0 +1,115 @@
+import io
+import random
+
+import pytest
+
+from supriya.contexts.nonrealtime import Score
+from supriya.contexts.requests import DoNothing, RequestBundle
+from supriya.osc import OscBundle
+
+
+def reference_request_bundles(context, start=None, until=None):
+    """
+    Iterate request bundles by sorting the whole timeline.
+    """
+    for timestamp, requests in sorted(context._requests.items()):
+        if start is not None and timestamp < start:
+            continue
+        if until:
+            if timestamp == until:
+                yield RequestBundle(timestamp=until, contents=requests + [DoNothing()])
+                return
+            elif timestamp > until:
+                break
+        if requests:
+            yield RequestBundle(timestamp=timestamp, contents=requests)
+    if until:
+        yield RequestBundle(timestamp=until, contents=[DoNothing()])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_iterate_request_bundles(seed):
+    random_ = random.Random(seed)
+    context = Score()
+    timestamps = [random_.randrange(100) / 4 for _ in range(200)]
+    for timestamp in timestamps:
+        with context.at(timestamp):
+            context.add_group()
+    assert context._timestamps == sorted(set(timestamps))
+    for _ in range(50):
+        start = random_.choice([None, *timestamps, random_.random() * 25])
+        until = random_.choice([None, *timestamps, random_.random() * 30])
+        expected = list(reference_request_bundles(context, start=start, until=until))
+        assert list(context.iterate_request_bundles(start=start, until=until)) == (
+            expected
+        )
+        assert list(context.iterate_datagrams(start=start, until=until)) == [
+            bundle.to_osc().to_datagram(realtime=False) for bundle in expected
+        ]
+
+
+def test_iterate_datagrams_cache():
+    context = Score()
+    for timestamp in [0.0, 1.0, 2.0]:
+        with context.at(timestamp):
+            context.add_group()
+    # datagrams aren't kept unless asked for, e.g. when writing them out
+    context.write_datagrams(io.BytesIO(), memory_budget=64)
+    assert not context._datagrams
+    datagrams = list(context.iterate_datagrams(cache=True))
+    assert datagrams == [
+        bundle.to_osc().to_datagram(realtime=False)
+        for bundle in context.iterate_request_bundles()
+    ]
+    assert all(
+        x is y for x, y in zip(context.iterate_datagrams(), datagrams)
+    ), "datagrams are cached between iterations"
+    # only datagrams at timestamps added to are re-encoded
+    with context.at(1.0):
+        context.add_group()
+    new_datagrams = list(context.iterate_datagrams(cache=True))
+    assert new_datagrams[0] is datagrams[0]
+    assert new_datagrams[1] != datagrams[1]
+    assert len(OscBundle.from_datagram(new_datagrams[1]).contents) == 2
+    assert new_datagrams[2] is datagrams[2]
+    # datagrams ending at until aren't cached, and leave cached datagrams alone
+    *_, last = context.iterate_datagrams(until=2.0, cache=True)
+    *_, last_bundle = context.iterate_request_bundles(until=2.0)
+    assert last == last_bundle.to_osc().to_datagram(realtime=False)
+    assert len(OscBundle.from_datagram(last).contents) == 2
+    assert list(context.iterate_datagrams())[2] is datagrams[2]
+    # request bundles aren't shared between callers
+    bundles = list(context.iterate_request_bundles())
+    bundles[0].contents.append(DoNothing())
+    assert list(context.iterate_request_bundles())[0].contents != bundles[0].contents
+
+
+def test_iterate_request_bundles_empty():
+    context = Score()
+    assert list(context.iterate_request_bundles()) == []
+    assert list(context.iterate_request_bundles(until=1.0)) == [
+        RequestBundle(timestamp=1.0, contents=[DoNothing()])
+    ]
+
+
+def test_batch_messages():
+    context = Score()
+    with context.batch_messages():
+        with context.at(0.0):
+            context.add_group()
+        with context.batch_messages():
+            with context.at(1.0):
+                context.add_group()
+        # nothing is sent until the outermost block exits
+        assert context._timestamps == []
+    assert context._timestamps == [0.0, 1.0]
+    # messages batched in a block that raises are discarded
+    with pytest.raises(RuntimeError):
+        with context.batch_messages():
+            with context.at(2.0):
+                context.add_group()
+            raise RuntimeError
+    assert context._timestamps == [0.0, 1.0]
+    with context.at(3.0):
+        context.add_group()
+    assert context._timestamps == [0.0, 1.0, 3.0]
@@ -121,6 +121,148 @@ def test_add_synth(context):
             synth.add_synth(default, add_action="ADD_TO_TAIL")
 
 
+def test_add_synths(context):
+    with context.at(0):
+        group = context.add_group()
+        synths = context.add_synths(
+            default,
+            3,
+            target_node=group,
+            frequency=[110, 220, 330],
+            amplitude=0.25,
+            out=0,
+        )
+        context.add_synths(
+            test_two_voice, 2, frequencies=[(1, 2), (3, 4)], amplitude=["c0", 0.5]
+        )
+        context.add_synths(test_two_voice, 2, frequencies=(5, 6))
+        with pytest.raises(ValueError):
+            context.add_synths(default, 3, frequency=[110, 220])
+    with context.at(1.23):
+        synths.free()
+        context.free_synth_group(synths, force=True)
+    assert (len(synths), int(synths), int(synths[-1])) == (3, 1001, 1003)
+    assert [int(synth) for synth in synths] == [1001, 1002, 1003]
+    assert [int(synth) for synth in synths[1:]] == [1002, 1003]
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 0),
+                *(
+                    OscMessage(
+                        "/s_new",
+                        "default",
+                        1001 + i,
+                        0,
+                        1000,
+                        "amplitude",
+                        0.25,
+                        "frequency",
+                        frequency,
+                    )
+                    for i, frequency in enumerate([110.0, 220.0, 330.0])
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test_two_voice",
+                    1004,
+                    0,
+                    0,
+                    "amplitude",
+                    "c0",
+                    "frequencies",
+                    (1.0, 2.0),
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test_two_voice",
+                    1005,
+                    0,
+                    0,
+                    "amplitude",
+                    0.5,
+                    "frequencies",
+                    (3.0, 4.0),
+                ),
+                OscMessage(
+                    "/s_new", "test_two_voice", 1006, 0, 0, "frequencies", (5.0, 6.0)
+                ),
+                OscMessage(
+                    "/s_new", "test_two_voice", 1007, 0, 0, "frequencies", (5.0, 6.0)
+                ),
+            ),
+            timestamp=0.0,
+        ),
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", 1001, "gate", 0),
+                OscMessage("/n_set", 1002, "gate", 0),
+                OscMessage("/n_set", 1003, "gate", 0),
+                OscMessage("/n_free", 1001, 1002, 1003),
+            ),
+            timestamp=1.23,
+        ),
+    ]
+
+
+def test_add_synths_wraparound(context, mocker):
+    context._node_id_allocator._temp = 0x03FFFFFE
+    with context.at(0):
+        synths = context.add_synths(default, 4)
+    # IDs are kept contiguous, skipping those which wrapped around
+    assert [int(synth) for synth in synths] == [1003, 1004, 1005, 1006]
+    mocker.patch.object(
+        context._node_id_allocator,
+        "allocate_node_ids",
+        return_value=[0x03FFFFFF, 1000],
+    )
+    with context.at(1), pytest.raises(ValueError):
+        context.add_synths(default, 2)
+
+
+def test_add_synths_numpy(context):
+    numpy = pytest.importorskip("numpy")
+    with context.at(0):
+        context.add_synths(
+            test_two_voice,
+            2,
+            frequencies=numpy.array([[1, 2], [3, 4]]),
+            amplitude=numpy.float32(0.5),
+        )
+        context.add_synths(default, 2, frequency=numpy.linspace(100, 200, 2))
+    assert list(context.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage(
+                    "/s_new",
+                    "test_two_voice",
+                    1000,
+                    0,
+                    0,
+                    "amplitude",
+                    0.5,
+                    "frequencies",
+                    (1.0, 2.0),
+                ),
+                OscMessage(
+                    "/s_new",
+                    "test_two_voice",
+                    1001,
+                    0,
+                    0,
+                    "amplitude",
+                    0.5,
+                    "frequencies",
+                    (3.0, 4.0),
+                ),
+                OscMessage("/s_new", "default", 1002, 0, 0, "frequency", 100.0),
+                OscMessage("/s_new", "default", 1003, 0, 0, "frequency", 200.0),
+            ),
+            timestamp=0.0,
+        ),
+    ]
+
+
 def test_free_group_children(context):
     with context.at(0):
         grandparent = context.add_group()
@@ -1,11 +1,22 @@
 import aifc
+import asyncio
+import hashlib
+import io
 import logging
 import platform
+import struct
+import sys
+import time
 
 import pytest
 
-from supriya import default, output_path, render
+from supriya import default, output_path, render, render_many
+from supriya.contexts import nonrealtime
 from supriya.contexts.nonrealtime import Score
+from supriya.exceptions import NonrealtimeRenderError
+from supriya.io import RenderCache
+from supriya.osc import OscBundle
+from supriya.soundfiles import read_float_wav, write_float_wav
 
 
 @pytest.fixture(autouse=True)
@@ -166,3 +177,336 @@ def test___render__(context):
         assert actual_channel_count == 8
         assert actual_sample_rate == 44100
         assert round(actual_frame_count / actual_sample_rate, 2) == 3.0
+
+
+class FakeNonrealtimeProcessProtocol:
+    commands = []
+    exit_code = 0
+
+    def __init__(self, exit_future, on_progress=None):
+        self.exit_future = exit_future
+
+    async def run(self, command, render_directory_path):
+        self.commands.append((command, sorted(render_directory_path.iterdir())))
+        if (render_file_name := command[-4]) != "/dev/null":
+            (render_directory_path / render_file_name).write_bytes(b"FORM")
+        self.exit_future.set_result(self.exit_code)
+
+
+@pytest.fixture
+def fake_scsynth(monkeypatch):
+    monkeypatch.setattr(
+        nonrealtime, "AsyncNonrealtimeProcessProtocol", FakeNonrealtimeProcessProtocol
+    )
+    monkeypatch.setenv("SUPRIYA_SERVER_EXECUTABLE", sys.executable)
+    monkeypatch.setattr(FakeNonrealtimeProcessProtocol, "commands", [])
+
+
+@pytest.mark.asyncio
+async def test_render_streams_datagrams(context, fake_scsynth, tmp_path):
+    datagram = b"".join(
+        struct.pack(">i", len(x)) + x for x in context.iterate_datagrams()
+    )
+    # streaming in small pieces hashes the same as hashing the whole datagram
+    for memory_budget in [1, 64, 2**20]:
+        actual_path, exit_code = await context.render(
+            memory_budget=memory_budget,
+            render_directory_path=tmp_path,
+            suppress_output=True,
+        )
+        assert (actual_path, exit_code) == (None, 0)
+    osc_path = (
+        tmp_path
+        / "score-e6beae761b2c8f192cfcd48948f0b51239699355b4450e640ffc97ec7243c4a4.osc"
+    )
+    assert len(FakeNonrealtimeProcessProtocol.commands) == 3
+    for command, render_directory_contents in FakeNonrealtimeProcessProtocol.commands:
+        # the .osc file is published under its digest before scsynth runs
+        assert command[-7:-5] == ["-N", osc_path.name]
+        assert render_directory_contents == [osc_path]
+    assert sorted(tmp_path.iterdir()) == [osc_path]
+    assert osc_path.read_bytes() == datagram
+
+
+@pytest.mark.asyncio
+async def test_render_cache(context, fake_scsynth, tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    render_file_name = (
+        "score-e6beae761b2c8f192cfcd48948f0b51239699355b4450e640ffc97ec7243c4a4.aiff"
+    )
+    # misses render and publish the output
+    assert await context.render(cache=cache) == (
+        tmp_path / "cache" / render_file_name,
+        0,
+    )
+    assert len(FakeNonrealtimeProcessProtocol.commands) == 1
+    # hits skip scsynth entirely
+    assert await context.render(cache=cache) == (
+        tmp_path / "cache" / render_file_name,
+        0,
+    )
+    assert await context.render(
+        tmp_path / "foo.aiff", cache=cache, render_directory_path=tmp_path
+    ) == (tmp_path / "foo.aiff", 0)
+    assert (tmp_path / "foo.aiff").read_bytes() == b"FORM"
+    assert len(FakeNonrealtimeProcessProtocol.commands) == 1
+    assert cache.statistics == RenderCache.Statistics(hits=2, misses=1)
+    # different scores, or uncached renders, still render
+    await context.render(cache=cache, duration=1.5)
+    await context.render(tmp_path / "bar.aiff", cache=False)
+    assert len(FakeNonrealtimeProcessProtocol.commands) == 3
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+@pytest.mark.asyncio
+async def test_render_cache_failure(context, fake_scsynth, monkeypatch, tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    monkeypatch.setattr(FakeNonrealtimeProcessProtocol, "exit_code", 1)
+    # failed renders never reach the cache
+    assert await context.render(cache=cache) == (None, 1)
+    assert await context.render(tmp_path / "foo.aiff", cache=cache) == (
+        tmp_path / "foo.aiff",
+        1,
+    )
+    assert not (tmp_path / "cache").exists()
+    monkeypatch.setattr(FakeNonrealtimeProcessProtocol, "exit_code", 0)
+    path, exit_code = await context.render(cache=cache)
+    assert (path.parent, exit_code) == (tmp_path / "cache", 0)
+    assert len(FakeNonrealtimeProcessProtocol.commands) == 3
+
+
+@pytest.mark.asyncio
+async def test_render_cache_input_files(fake_scsynth, tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    (tmp_path / "input.aiff").write_bytes(b"FORM")
+    (tmp_path / "sample.aiff").write_bytes(b"FORM")
+    context = Score()
+    with context.at(0):
+        context.add_buffer(file_path="sample.aiff")
+    with context.at(1):
+        context.do_nothing()
+    render_kwargs = dict(
+        cache=cache,
+        input_file_path=tmp_path / "input.aiff",
+        render_directory_path=tmp_path,
+    )
+    path, _ = await context.render(**render_kwargs)
+    assert await context.render(**render_kwargs) == (path, 0)
+    # changing a soundfile read by the score, or its input file, renders again
+    (tmp_path / "sample.aiff").write_bytes(b"FORM" * 2)
+    path_2, _ = await context.render(**render_kwargs)
+    (tmp_path / "input.aiff").write_bytes(b"FORM" * 2)
+    path_3, _ = await context.render(**render_kwargs)
+    assert len({path, path_2, path_3}) == 3
+    assert len(FakeNonrealtimeProcessProtocol.commands) == 3
+
+
+@pytest.mark.parametrize("memory_budget", [1, 100, 2**20])
+def test_write_datagrams(context, memory_budget):
+    class File(io.BytesIO):
+        chunk_sizes = []
+
+        def write(self, chunk):
+            self.chunk_sizes.append(len(chunk))
+            return super().write(chunk)
+
+    datagrams = list(context.iterate_datagrams(until=2.5))
+    hasher, file_pointer = hashlib.sha256(), File()
+    assert context.write_datagrams(
+        file_pointer, hasher=hasher, memory_budget=memory_budget, until=2.5
+    ) == sum(len(x) + 4 for x in datagrams)
+    expected = b"".join(struct.pack(">i", len(x)) + x for x in datagrams)
+    assert file_pointer.getvalue() == expected
+    assert hasher.hexdigest() == hashlib.sha256(expected).hexdigest()
+    # pending bytes never exceed the budget by more than one datagram
+    largest = max(len(x) + 4 for x in datagrams)
+    assert max(File.chunk_sizes) < memory_budget + largest
+    if memory_budget == 1:
+        assert len(File.chunk_sizes) == len(datagrams)
+
+
+FAKE_SCSYNTH = """
+import os, pathlib, sys, time
+
+arguments = sys.argv[sys.argv.index("-N") + 1 :]
+for timestamp in [0.0, 1.0, 2.0, 3.0]:
+    print(f"nextOSCPacket {timestamp}", flush=True)
+    time.sleep(float(os.environ.get("FAKE_SCSYNTH_DELAY", 0)))
+if arguments[2] != "/dev/null":
+    pathlib.Path(arguments[2]).write_bytes(b"FORM")
+"""
+
+
+@pytest.fixture
+def fake_scsynth_executable(monkeypatch, tmp_path):
+    if platform.system() == "Windows":
+        pytest.skip("requires executable scripts")
+    path = tmp_path / "scsynth"
+    path.write_text(f"#!{sys.executable}\n{FAKE_SCSYNTH}")
+    path.chmod(0o755)
+    monkeypatch.setenv("SUPRIYA_SERVER_EXECUTABLE", str(path))
+
+
+def test_render_many(context, fake_scsynth_executable, tmp_path):
+    progress = []
+    results = render_many(
+        [context, context, context],
+        max_workers=2,
+        cache=False,
+        duration=2.0,
+        on_progress=lambda *args: progress.append(args),
+        render_directory_path=tmp_path,
+    )
+    assert results == [(results[0][0], 0)] * 3
+    assert results[0][0].parent == output_path
+    assert results[0][0].read_bytes() == b"FORM"
+    # packets are reported as fractions of the score's duration
+    for index in range(3):
+        assert [x for i, x in progress if i == index] == [0.0, 0.5, 1.0, 1.0, 1.0]
+
+
+def test_render_many_failure(context, fake_scsynth_executable, monkeypatch):
+    class Failure:
+        async def __render__(self, **kwargs):
+            await asyncio.sleep(0.5)
+            raise RuntimeError
+
+    monkeypatch.setenv("FAKE_SCSYNTH_DELAY", "30")
+    started = time.monotonic()
+    with pytest.raises(RuntimeError):
+        render_many([context, Failure(), context], cache=False, max_workers=2)
+    # the running render's scsynth is killed rather than awaited
+    assert time.monotonic() - started < 10
+
+
+class MixingNonrealtimeProcessProtocol:
+    """
+    Renders each synth as a constant of its amplitude, plus its age times drift.
+    """
+
+    commands = []
+    drift = 0.0
+
+    def __init__(self, exit_future, on_progress=None):
+        self.exit_future = exit_future
+        self.on_progress = on_progress
+
+    async def run(self, command, render_directory_path):
+        numpy = pytest.importorskip("numpy")
+        self.commands.append(command)
+        osc_file_name, _, render_file_name, sample_rate = command[-6:-2]
+        sample_rate = float(sample_rate)
+        datagram = (render_directory_path / osc_file_name).read_bytes()
+        events = []
+        while datagram:
+            (size,) = struct.unpack(">i", datagram[:4])
+            osc_bundle = OscBundle.from_datagram(datagram[4 : 4 + size])
+            datagram = datagram[4 + size :]
+            frame = round((osc_bundle.timestamp + 2208988800) * sample_rate)
+            messages = list(osc_bundle.contents)
+            while messages:
+                message = messages.pop(0)
+                if isinstance(message, OscBundle):
+                    messages[:0] = message.contents
+                    continue
+                if message.address == "/d_recv":
+                    messages[:0] = message.contents[1:]
+                events.append((frame, message))
+        array = numpy.zeros(events[-1][0], dtype=numpy.float32)
+        synths = {}
+        for (frame, message), (next_frame, _) in zip(events, events[1:] + events[-1:]):
+            if message.address == "/s_new":
+                _, synth_id, _, _, *pairs = message.contents
+                synths[synth_id] = [0.1, frame]
+            elif message.address == "/n_set":
+                synth_id, *pairs = message.contents
+            elif message.address == "/n_free":
+                for synth_id in message.contents:
+                    synths.pop(synth_id, None)
+                pairs = []
+            else:
+                pairs = []
+            for key, value in zip(pairs[::2], pairs[1::2]):
+                if key == "amplitude":
+                    synths[synth_id][0] = value
+                elif key == "gate" and not value:
+                    synths.pop(synth_id)
+            for amplitude, starting_frame in synths.values():
+                ages = numpy.arange(frame, next_frame) - starting_frame
+                array[frame:next_frame] += amplitude + ages / sample_rate * self.drift
+        write_float_wav(render_directory_path / render_file_name, array[:, None], 1000)
+        self.exit_future.set_result(0)
+
+
+@pytest.fixture
+def mixing_scsynth(monkeypatch):
+    monkeypatch.setattr(
+        nonrealtime, "AsyncNonrealtimeProcessProtocol", MixingNonrealtimeProcessProtocol
+    )
+    monkeypatch.setenv("SUPRIYA_SERVER_EXECUTABLE", sys.executable)
+    monkeypatch.setattr(MixingNonrealtimeProcessProtocol, "commands", [])
+
+
+@pytest.fixture
+def long_context():
+    context = Score()
+    with context.at(0):
+        with context.add_synthdefs(default):
+            effect = context.add_synth(default, amplitude=0.2)
+    for i in range(8):
+        with context.at(i * 2):
+            synth = context.add_synth(default, amplitude=0.5 + i / 10)
+        with context.at(i * 2 + 1.5):
+            synth.free()
+    with context.at(9.25):
+        effect.set(amplitude=0.3)
+    with context.at(17):
+        context.do_nothing()
+    return context
+
+
+@pytest.mark.asyncio
+async def test_render_segmented(long_context, mixing_scsynth, tmp_path):
+    pytest.importorskip("numpy")
+    progress = []
+    path, exit_code = await long_context.render_segmented(
+        tmp_path / "output.wav",
+        cache=RenderCache(tmp_path / "cache"),
+        max_workers=4,
+        on_progress=progress.append,
+        render_directory_path=tmp_path,
+        sample_rate=1000,
+        verify=True,
+    )
+    assert (path, exit_code) == (tmp_path / "output.wav", 0)
+    # four segments split at quiet points, plus the whole score to verify against
+    assert len(MixingNonrealtimeProcessProtocol.commands) == 5
+    assert progress[-1] == 1.0
+    array = read_float_wav(path)[:, 0]
+    assert len(array) == 17000
+    assert array[[1000, 1750, 4250, 9750, 16000]].tolist() == pytest.approx(
+        [0.7, 0.2, 0.9, 0.3, 0.3]
+    )
+    # cached segments only re-render where the score changed
+    with long_context.at(15):
+        long_context.add_synth(default, amplitude=0.25)
+    path, exit_code = await long_context.render_segmented(
+        boundaries=[4.0, 8.0, 12.0],
+        cache=RenderCache(tmp_path / "cache"),
+        render_directory_path=tmp_path,
+        sample_rate=1000,
+    )
+    assert exit_code == 0
+    assert len(MixingNonrealtimeProcessProtocol.commands) == 6
+    assert read_float_wav(path)[16000, 0] == pytest.approx(0.55)
+
+
+@pytest.mark.asyncio
+async def test_render_segmented_verify(long_context, mixing_scsynth, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(MixingNonrealtimeProcessProtocol, "drift", 0.01)
+    # rebuilt synths restart, so segments split while synths play drift apart
+    with pytest.raises(NonrealtimeRenderError):
+        await long_context.render_segmented(
+            boundaries=[5.0], cache=False, sample_rate=1000, verify=True
+        )
@@ -1,7 +1,19 @@
+import asyncio
 import platform
+from multiprocessing import shared_memory
 
 import pytest
 
+from supriya.contexts import AsyncServer, Bus, Server
+from supriya.enums import CalculationRate
+from supriya.exceptions import ServerOffline
+
+
+async def get(x):
+    if asyncio.iscoroutine(x):
+        return await x
+    return x
+
 
 @pytest.mark.skipif(
     platform.system() == "Windows", reason="SHM not built under Windows"
@@ -18,3 +30,66 @@ def test_shared_memory(server):
         bus.set(value)
         assert bus.get() == shared_memory[int(bus)] == value
     assert shared_memory[:2] == [0.5, 0]
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="SHM not built under Windows"
+)
+def test_shared_memory_buffer(server):
+    numpy = pytest.importorskip("numpy")
+    from supriya.contexts import shm
+
+    shared_memory = shm.ServerSHM(
+        server.options.port, server.options.control_bus_channel_count
+    )
+    view = memoryview(shared_memory)
+    array = numpy.asarray(shared_memory)
+    assert len(shared_memory) == len(view) == server.options.control_bus_channel_count
+    assert view.readonly and not array.flags.writeable
+    bus_group = server.add_bus_group(count=4)
+    bus_group.set(0.25, 0.5, 0.75, 1.0)
+    server.sync()
+    # The view tracks the server's busses without being re-read.
+    assert array[int(bus_group[0]) : int(bus_group[0]) + 4].tolist() == [
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+    ]
+    assert server.get_bus_range(bus_group[0], 4) == (0.25, 0.5, 0.75, 1.0)
+
+
+@pytest.fixture
+def control_buses():
+    # A stand-in for scsynth's shared control bus memory: a buffer of C floats.
+    memory = shared_memory.SharedMemory(create=True, size=16 * 4)
+    buses = memory.buf.cast("f")
+    yield buses
+    buses.release()
+    memory.close()
+    memory.unlink()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("server_class", [AsyncServer, Server])
+async def test_get_bus_range_shared_memory(control_buses, server_class):
+    server = server_class()
+    buses = [
+        Bus(context=server, calculation_rate=CalculationRate.CONTROL, id_=i)
+        for i in range(16)
+    ]
+    with control_buses.toreadonly() as server._shm:
+        for i in range(16):
+            control_buses[i] = i / 2
+        values = await get(server.get_bus_range(buses[4], 3))
+        assert values == (2.0, 2.5, 3.0)
+        control_buses[5] = 0.25
+        assert await get(server.get_bus_range(buses[4], 3)) == (2.0, 0.25, 3.0)
+        # Values read earlier are a snapshot, like /c_getn replies.
+        assert values == (2.0, 2.5, 3.0)
+        assert await get(server.get_bus_range(buses[12], 4)) == (6.0, 6.5, 7.0, 7.5)
+        # Ranges past shared memory, and unsynced requests, fall back to /c_getn.
+        with pytest.raises(ServerOffline):
+            await get(server.get_bus_range(buses[14], 4))
+        with pytest.raises(ServerOffline):
+            await get(server.get_bus_range(buses[0], 1, sync=False))
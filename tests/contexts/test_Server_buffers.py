@@ -431,6 +431,21 @@ async def test_set_buffer(context):
     ]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["file", "osc"])
+async def test_set_buffer_array(context, method):
+    numpy = pytest.importorskip("numpy")
+    buffer = context.add_buffer(channel_count=2, frame_count=20000)
+    await get(context.sync())
+    array = numpy.random.default_rng(0).uniform(-1, 1, (10000, 2)).astype("float32")
+    await get(buffer.from_numpy(array, starting_frame=5000, method=method))
+    result = await get(buffer.to_numpy(method=method))
+    assert result.shape == (20000, 2)
+    assert not result[:5000].any() and not result[15000:].any()
+    assert numpy.array_equal(result[5000:15000], array)
+    assert await get(buffer.get_range(10000, 2)) == tuple(array[2500].tolist())
+
+
 @pytest.mark.asyncio
 async def test_set_buffer_range(context):
     buffer = context.add_buffer(channel_count=1, frame_count=32)
@@ -10,7 +10,8 @@ from uqbar.strings import normalize
 from supriya import default, scsynth
 from supriya.contexts.entities import Group
 from supriya.contexts.realtime import AsyncServer, Server
-from supriya.contexts.responses import StatusInfo, VersionInfo
+from supriya.contexts.responses import QueryTreeDiff, StatusInfo, VersionInfo
+from supriya.enums import NodeAction
 from supriya.exceptions import ServerOffline
 from supriya.osc import OscMessage
 
@@ -98,6 +99,67 @@ async def test_query_tree(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_query_tree_local(context):
+    with context.at():
+        group = context.add_group()
+        synth = group.add_synth(default)
+        group.add_group(add_action="ADD_TO_TAIL")
+        synth.add_group(add_action="ADD_BEFORE")
+    await get(context.sync())
+    old_tree = await get(context.query_tree(include_controls=False))
+    with context.osc_protocol.capture() as transcript:
+        tree = await get(context.query_tree(source="local"))
+    assert not transcript.filtered(received=False, status=False)
+    assert not QueryTreeDiff.from_query_tree_groups(old_tree, tree)
+    assert str(tree) == normalize(
+        """
+        NODE TREE 0 group
+            1 group
+                1000 group
+                    1003 group
+                    1001 None
+                    1002 group
+        """
+    )
+    synth.move(group, "ADD_TO_HEAD")
+    with context.at():
+        group.add_synth(default, add_action="ADD_TO_TAIL")
+        context.free_node(Group(context=context, id_=1003))
+    await get(context.sync())
+    new_tree = await get(context.query_tree(include_controls=False))
+    assert QueryTreeDiff.from_query_tree_groups(old_tree, new_tree) == QueryTreeDiff(
+        items=[
+            QueryTreeDiff.Item(
+                action=NodeAction.NODE_MOVED,
+                node_id=1001,
+                parent_id=1000,
+                previous_id=-1,
+                is_group=False,
+                synthdef_name="default",
+            ),
+            QueryTreeDiff.Item(
+                action=NodeAction.NODE_CREATED,
+                node_id=1004,
+                parent_id=1000,
+                previous_id=1002,
+                is_group=False,
+                synthdef_name="default",
+            ),
+            QueryTreeDiff.Item(
+                action=NodeAction.NODE_REMOVED,
+                node_id=1003,
+                parent_id=1000,
+                previous_id=-1,
+                is_group=True,
+            ),
+        ]
+    )
+    assert not QueryTreeDiff.from_query_tree_groups(
+        new_tree, await get(context.query_tree(source="local"))
+    )
+
+
 @pytest.mark.asyncio
 async def test_query_version(context):
     completed_subprocess = subprocess.run(
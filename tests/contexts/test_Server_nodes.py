@@ -414,6 +414,29 @@ async def test_query_node(context):
     ]
 
 
+@pytest.mark.asyncio
+async def test_query_nodes(context):
+    groups = [context.add_group() for _ in range(3)]
+    await asyncio.sleep(0.1)
+    assert await get(context.query_nodes(groups)) == [
+        NodeInfo(
+            action=NodeAction.NODE_QUERIED,
+            head_id=-1,
+            is_group=True,
+            next_id=next_id,
+            node_id=node_id,
+            parent_id=1,
+            previous_id=previous_id,
+            tail_id=-1,
+        )
+        for node_id, previous_id, next_id in [
+            (1000, 1001, -1),
+            (1001, 1002, 1000),
+            (1002, -1, 1001),
+        ]
+    ]
+
+
 @pytest.mark.asyncio
 async def test_set_node(context):
     group = context.add_group()
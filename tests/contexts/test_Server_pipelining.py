@@ -0,0 +1,290 @@
+import asyncio
+import concurrent.futures
+import socketserver
+import threading
+
+import pytest
+
+from supriya import default
+from supriya.contexts import AsyncServer, Buffer, Group, Server
+from supriya.contexts.requests import (
+    NewGroup,
+    QueryNode,
+    QueryStatus,
+    Requestable,
+    Sync,
+)
+from supriya.contexts.responses import NodeInfo, StatusInfo, SyncedInfo
+from supriya.enums import NodeAction
+from supriya.osc import OscBundle, OscMessage
+from supriya.soundfiles import read_float_wav, write_float_wav
+
+
+class FakeScsynthHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, socket_ = self.request
+        if data.startswith(b"#bundle"):
+            messages = list(OscBundle.from_datagram(data).contents)
+        else:
+            messages = [OscMessage.from_datagram(data)]
+        while messages:
+            message = messages.pop(0)
+            if isinstance(message, OscBundle):
+                messages[:0] = message.contents
+                continue
+            for reply in self.reply(message):
+                socket_.sendto(reply.to_datagram(), self.client_address)
+
+    def reply(self, message):
+        if message.address == "/notify":
+            yield OscMessage("/done", "/notify", 0, 1)
+        elif message.address == "/status":
+            yield OscMessage("/status.reply", 1, 0, 0, 0, 0, 0.0, 0.0, 44100.0, 44100.0)
+        elif message.address == "/sync":
+            yield OscMessage("/synced", *message.contents)
+        elif message.address == "/n_query":
+            # Never reply for negative node IDs, to exercise timeouts.
+            for node_id in message.contents:
+                if node_id >= 0:
+                    yield OscMessage("/n_info", node_id, 1, -1, -1, 0)
+        elif message.address in ("/d_recv", "/quit"):
+            yield OscMessage("/done", message.address)
+        elif message.address.startswith("/b_"):
+            yield from self.reply_buffer(message, self.server.buffers)
+
+    def reply_buffer(self, message, buffers):
+        # Buffers are numpy arrays of shape (frame_count, channel_count).
+        buffer_id, *contents = message.contents
+        if message.address == "/b_query":
+            for buffer_id in message.contents:
+                frame_count, channel_count = buffers[buffer_id].shape
+                yield OscMessage("/b_info", buffer_id, frame_count, channel_count, 0.0)
+        elif message.address == "/b_getn":
+            samples = buffers[buffer_id].reshape(-1)
+            for index, count in zip(contents[::2], contents[1::2]):
+                values = samples[index : index + count].tolist()
+                yield OscMessage("/b_setn", buffer_id, index, count, *values)
+        elif message.address == "/b_setn":
+            samples = buffers[buffer_id].reshape(-1)
+            while contents:
+                index, count, *contents = contents
+                samples[index : index + count] = contents[:count]
+                contents = contents[count:]
+        elif message.address == "/b_write":
+            write_float_wav(contents[0], buffers[buffer_id], 44100)
+            yield OscMessage("/done", "/b_write", buffer_id)
+        elif message.address == "/b_read":
+            array = read_float_wav(contents[0])
+            starting_frame = contents[3]
+            buffers[buffer_id][starting_frame : starting_frame + len(array)] = array
+            yield OscMessage("/done", "/b_read", buffer_id)
+
+
+@pytest.fixture
+def buffers():
+    return {}
+
+
+@pytest.fixture
+def fake_scsynth(buffers):
+    server = socketserver.UDPServer(("127.0.0.1", 0), FakeScsynthHandler)
+    server.buffers = buffers
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def node_info(node_id):
+    return NodeInfo(
+        action=NodeAction.NODE_QUERIED,
+        node_id=node_id,
+        parent_id=1,
+        previous_id=-1,
+        next_id=-1,
+        is_group=False,
+    )
+
+
+@pytest.mark.parametrize("batched_receive", [False, True])
+def test_Server_query_nodes(batched_receive, fake_scsynth):
+    server = Server(batched_receive=batched_receive).connect(port=fake_scsynth)
+    try:
+        groups = [Group(context=server, id_=1000 + i) for i in range(1000)]
+        assert server.query_nodes(groups) == [node_info(1000 + i) for i in range(1000)]
+        assert not len(server._response_multiplexer)
+        assert not server._response_multiplexer.callbacks
+        with pytest.raises(concurrent.futures.TimeoutError):
+            server.query_nodes([groups[0], Group(context=server, id_=-1)], timeout=0.1)
+        assert not len(server._response_multiplexer)
+        assert server.query_node(groups[0]) == node_info(1000)
+    finally:
+        server.disconnect()
+
+
+def test_Server_communicate_many(fake_scsynth):
+    server = Server().connect(port=fake_scsynth)
+    try:
+        responses = Requestable.communicate_many(
+            [
+                QueryStatus(),
+                NewGroup(items=[(1000, "add_to_head", 1)]),
+                Sync(sync_id=23),
+                QueryNode(node_ids=[1000]),
+                QueryStatus(),
+            ],
+            server=server,
+            window=2,
+        )
+        assert [type(response) for response in responses] == [
+            StatusInfo,
+            type(None),
+            SyncedInfo,
+            NodeInfo,
+            StatusInfo,
+        ]
+        assert responses[2] == SyncedInfo(sync_id=23)
+        assert not len(server._response_multiplexer)
+    finally:
+        server.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_AsyncServer_query_nodes(fake_scsynth):
+    server = await AsyncServer().connect(port=fake_scsynth)
+    try:
+        groups = [Group(context=server, id_=1000 + i) for i in range(1000)]
+        assert await server.query_nodes(groups) == [
+            node_info(1000 + i) for i in range(1000)
+        ]
+        assert not len(server._response_multiplexer)
+        with pytest.raises(asyncio.TimeoutError):
+            await server.query_nodes(
+                [groups[0], Group(context=server, id_=-1)], timeout=0.1
+            )
+        assert not len(server._response_multiplexer)
+        assert await server.query_node(groups[0]) == node_info(1000)
+    finally:
+        await server.disconnect()
+
+
+def test_Server_metrics(fake_scsynth):
+    server = Server()
+    # Metrics survive swapping protocols on connecting.
+    metrics = server.osc_protocol.enable_metrics()
+    server.connect(port=fake_scsynth)
+    try:
+        groups = [Group(context=server, id_=1000 + i) for i in range(10)]
+        server.query_node(groups[0])
+        server.query_nodes(groups)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            QueryNode(node_ids=[-1]).communicate(server=server, timeout=0.1)
+    finally:
+        server.disconnect()
+    assert server.osc_protocol.metrics is metrics
+    data = metrics.as_dict()
+    assert data["sent"]["/n_query"]["count"] == 12
+    assert data["received"]["/n_info"]["count"] == 11
+    assert data["latencies"]["/n_info"]["count"] == 11
+    assert data["latencies"]["/n_info"]["timeouts"] == 1
+    assert data["latencies"]["/synced"]["count"] >= 1
+
+
+def test_Server_send_splits_bundles(fake_scsynth):
+    server = Server().connect(port=fake_scsynth)
+    try:
+        with server.osc_protocol.capture() as transcript:
+            group = server.add_group()
+            with server.at(1234.5):
+                for i in range(1000):
+                    group.set(frequency=i)
+            server.sync()
+    finally:
+        server.disconnect()
+    bundles = [
+        message
+        for _, message in transcript.sent_messages
+        if isinstance(message, OscBundle)
+    ]
+    assert len(bundles) > 1
+    assert {bundle.timestamp for bundle in bundles} == {bundles[0].timestamp}
+    assert bundles[0].timestamp == pytest.approx(1234.5 + server.latency)
+    assert all(len(bundle.to_datagram()) <= 8192 for bundle in bundles)
+    assert [message for bundle in bundles for message in bundle.contents] == [
+        OscMessage("/n_set", group.id_, "frequency", float(i)) for i in range(1000)
+    ]
+
+
+def test_Server_add_synths(fake_scsynth):
+    server = Server().connect(port=fake_scsynth)
+    try:
+        with server.osc_protocol.capture() as transcript:
+            with server.at(1234.5):
+                synths = server.add_synths(
+                    default, 500, frequency=[float(i) for i in range(500)]
+                )
+            server.sync()
+    finally:
+        server.disconnect()
+    bundles = [
+        message
+        for _, message in transcript.sent_messages
+        if isinstance(message, OscBundle)
+    ]
+    assert len(bundles) > 1
+    assert all(len(bundle.to_datagram()) <= 8192 for bundle in bundles)
+    assert [message for bundle in bundles for message in bundle.contents] == [
+        OscMessage("/s_new", "default", synth.id_, 0, 1, "frequency", float(i))
+        for i, synth in enumerate(synths)
+    ]
+
+
+@pytest.mark.parametrize("method", ["file", "osc"])
+def test_Server_buffer_array(buffers, fake_scsynth, method):
+    numpy = pytest.importorskip("numpy")
+    buffers[0] = numpy.zeros((3000, 2), dtype=numpy.float32)
+    array = numpy.random.default_rng(0).uniform(-1, 1, (2000, 2)).astype("float32")
+    expected = buffers[0].copy()
+    expected[500:2500] = array
+    server = Server().connect(port=fake_scsynth)
+    try:
+        buffer = Buffer(context=server, id_=0)
+        buffer.from_numpy(array, starting_frame=500, method=method)
+        assert numpy.array_equal(buffers[0], expected)
+        assert numpy.array_equal(buffer.to_numpy(method=method), expected)
+        # one-dimensional arrays are interleaved
+        server.set_buffer_array(buffer, [0.25, 0.5, 0.75, 1.0], method=method)
+        assert buffers[0][:2].tolist() == [[0.25, 0.5], [0.75, 1.0]]
+        with pytest.raises(ValueError):
+            buffer.from_numpy(numpy.zeros((10, 3)))
+        with pytest.raises(ValueError):
+            buffer.from_numpy(numpy.zeros((10, 2)), starting_frame=2995)
+        with pytest.raises(ValueError):
+            buffer.from_numpy(numpy.zeros((10, 2)), method="smoke-signals")
+    finally:
+        server.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["file", "osc"])
+async def test_AsyncServer_buffer_array(buffers, fake_scsynth, method):
+    numpy = pytest.importorskip("numpy")
+    buffers[0] = numpy.zeros((3000, 1), dtype=numpy.float32)
+    array = numpy.random.default_rng(0).uniform(-1, 1, (3000, 1)).astype("float32")
+    server = await AsyncServer().connect(port=fake_scsynth)
+    try:
+        buffer = Buffer(context=server, id_=0)
+        await buffer.from_numpy(array, method=method)
+        assert numpy.array_equal(buffers[0], array)
+        assert numpy.array_equal(await buffer.to_numpy(method=method), array)
+    finally:
+        await server.disconnect()
+
+
+def test_BaseServer_buffer_transfer_method():
+    local, remote = Server(), Server(ip_address="192.168.0.1")
+    assert local._get_buffer_transfer_method(16384, None) == "file"
+    assert local._get_buffer_transfer_method(16383, None) == "osc"
+    assert remote._get_buffer_transfer_method(16384, None) == "osc"
+    assert remote._get_buffer_transfer_method(0, "file") == "file"
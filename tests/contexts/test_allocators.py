@@ -1,8 +1,19 @@
-from supriya.contexts.allocators import BlockAllocator
+import random
 
+import pytest
 
-def test_allocate():
-    allocator = BlockAllocator(heap_minimum=0, heap_maximum=16)
+from supriya.assets.synthdefs import default
+from supriya.contexts import Score
+from supriya.contexts.allocators import (
+    BestFitBlockAllocator,
+    BlockAllocator,
+    NodeIdAllocator,
+)
+
+
+@pytest.mark.parametrize("allocator_class", [BlockAllocator, BestFitBlockAllocator])
+def test_allocate(allocator_class):
+    allocator = allocator_class(heap_minimum=0, heap_maximum=16)
     assert allocator.allocate(4) == 0
     assert allocator.allocate(4) == 4
     assert allocator.allocate(4) == 8
@@ -21,8 +32,9 @@ def test_allocate():
     assert allocator.allocate(1) == 5
 
 
-def test_allocate_block_within_block():
-    allocator = BlockAllocator()
+@pytest.mark.parametrize("allocator_class", [BlockAllocator, BestFitBlockAllocator])
+def test_allocate_block_within_block(allocator_class):
+    allocator = allocator_class()
     assert allocator.allocate_at(0, 3) == 0
     assert allocator.allocate_at(0, 2) is None
     assert allocator.allocate_at(1, 2) is None
@@ -33,3 +45,106 @@ def test_allocate_block_within_block():
     assert allocator.allocate_at(0, 9) is None
     assert allocator.allocate_at(3, 3) == 3
     assert allocator.free(99) is None
+
+
+def test_NodeIdAllocator_allocate_node_ids():
+    allocator = NodeIdAllocator(client_id=1)
+    assert allocator.allocate_node_ids(3) == [67109864, 67109865, 67109866]
+    assert allocator.allocate_node_id() == 67109867
+    # Only the most recently allocated IDs are reclaimed.
+    node_ids = allocator.allocate_node_ids(4)
+    allocator.free_node_ids(node_ids[:2])
+    assert allocator.allocate_node_id() == 67109872
+    node_ids = allocator.allocate_node_ids(4)
+    allocator.free_node_ids(node_ids[1:])
+    assert allocator.allocate_node_id() == 67109874
+    # Wrapping around skips the permanent IDs.
+    allocator._temp = 0x03FFFFFE
+    assert [node_id & 0x03FFFFFF for node_id in allocator.allocate_node_ids(4)] == [
+        0x03FFFFFE,
+        0x03FFFFFF,
+        1001,
+        1002,
+    ]
+
+
+def test_Context_reserve_node_ids():
+    score = Score()
+    with score.at(0):
+        with score.reserve_node_ids(3) as node_ids:
+            group = score.add_group()
+            with score.reserve_node_ids(1):
+                synth = score.add_synth(default)
+            permanent_group = score.add_group(permanent=True)
+            synths = [score.add_synth(default) for _ in range(3)]
+        last_group = score.add_group()
+    assert node_ids == [1000, 1001, 1002]
+    assert [int(group), int(synth), int(permanent_group)] == [1000, 1003, 1]
+    assert [int(synth) for synth in synths] == [1001, 1002, 1004]
+    assert int(last_group) == 1005
+    with score.reserve_node_ids(10):
+        pass
+    with score.at(1):
+        assert int(score.add_group()) == 1006
+
+
+def test_BestFitBlockAllocator_churn():
+    random_ = random.Random(0)
+    allocator = BestFitBlockAllocator(heap_minimum=16, heap_maximum=1024)
+    used = {}  # start -> size
+    for _ in range(5000):
+        action = random_.random()
+        if action < 0.4:
+            size = random_.choice([1, 1, 2, 3, 8, 17, 64])
+            fitting_extents = sorted(
+                (stop - start, start)
+                for start, stop in allocator._free_by_start.items()
+                if size <= stop - start
+            )
+            start = allocator.allocate(size)
+            if start is None:
+                assert not fitting_extents
+                continue
+            # The smallest fitting extent, lowest offset first.
+            assert start == fitting_extents[0][1]
+            used[start] = size
+        elif action < 0.6:
+            index, size = random_.randrange(0, 1100), random_.choice([1, 4, 32])
+            occupied = any(
+                start < index + size and index < start + used_size
+                for start, used_size in used.items()
+            )
+            out_of_bounds = index < 16 or 1024 < index + size
+            result = allocator.allocate_at(index, size)
+            assert (result is None) == (occupied or out_of_bounds)
+            if result is not None:
+                used[index] = size
+        elif used:
+            start = random_.choice(list(used))
+            # Freeing by any ID within a block frees the whole block.
+            allocator.free(start + random_.randrange(used.pop(start)))
+        # Used and free extents tile the heap, and free extents are coalesced.
+        extents = sorted(
+            [(start, start + size, True) for start, size in used.items()]
+            + [(start, stop, False) for start, stop in allocator._free_by_start.items()]
+        )
+        offset = 16
+        for (start, stop, is_used), next_extent in zip(extents, extents[1:] + [None]):
+            assert start == offset
+            if not is_used and next_extent is not None:
+                assert next_extent[2]
+            offset = stop
+        assert offset == 1024
+
+
+def test_Context_block_allocator_class():
+    score = Score(block_allocator_class=BestFitBlockAllocator)
+    assert isinstance(score._audio_bus_allocator, BestFitBlockAllocator)
+    assert isinstance(score._buffer_allocator, BestFitBlockAllocator)
+    assert isinstance(score._control_bus_allocator, BestFitBlockAllocator)
+    with score.at(0):
+        buffers = [score.add_buffer(channel_count=1, frame_count=1) for _ in range(3)]
+        buses = score.add_bus_group(count=4)
+    assert [int(buffer_) for buffer_ in buffers] == [0, 1, 2]
+    assert int(buses) == 0
+    assert type(Score()._buffer_allocator) is BlockAllocator
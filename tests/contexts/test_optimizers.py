@@ -0,0 +1,440 @@
+import random
+
+import pytest
+
+from supriya import default
+from supriya.contexts import Group, Score
+from supriya.contexts.optimizers import optimize_requests
+from supriya.contexts.requests import (
+    FillBuffer,
+    FreeNode,
+    MoveNodeToGroupHead,
+    NewGroup,
+    NewSynth,
+    QueryTree,
+    SetBuffer,
+    SetControlBus,
+    SetNodeControl,
+)
+from supriya.osc import OscBundle, OscMessage
+
+
+class ModelServer:
+    """
+    A model of scsynth's node tree, node controls and control buses.
+    """
+
+    def __init__(self):
+        self.buffers = {}
+        self.buses = {}
+        self.children = {0: []}
+        self.controls = {}
+        self.mappings = {}
+        self.parents = {}
+        self.running = {0: True}
+
+    def __call__(self, osc_bundle):
+        for osc_message in osc_bundle.contents:
+            address, *contents = osc_message.address, *osc_message.contents
+            getattr(self, "handle_" + address[1:], self.handle_other)(*contents)
+        return self.state
+
+    def add(self, node_id, add_action, target_id, is_group):
+        if node_id in self.parents or target_id not in self.running:
+            return False
+        if add_action in (0, 1):
+            if target_id not in self.children:
+                return False
+            parent_id, siblings = target_id, self.children[target_id]
+            index = 0 if add_action == 0 else len(siblings)
+        else:
+            if target_id == 0:
+                return False
+            parent_id = self.parents[target_id]
+            siblings = self.children[parent_id]
+            index = siblings.index(target_id) + (add_action == 3)
+        siblings.insert(index, node_id)
+        self.parents[node_id] = parent_id
+        self.running[node_id] = True
+        if is_group:
+            self.children[node_id] = []
+        else:
+            self.controls[node_id] = {}
+            self.mappings[node_id] = {}
+        if add_action == 4:
+            self.free(target_id)
+        return True
+
+    def free(self, node_id):
+        if node_id not in self.parents:
+            return
+        for child_id in list(self.children.get(node_id, [])):
+            self.free(child_id)
+        self.children[self.parents.pop(node_id)].remove(node_id)
+        for mapping in (self.children, self.controls, self.mappings, self.running):
+            mapping.pop(node_id, None)
+
+    def move(self, node_id, add_action, target_id):
+        if node_id not in self.parents or target_id not in self.running:
+            return
+        if node_id == target_id or (add_action in (2, 3) and target_id == 0):
+            return
+        is_group = node_id in self.children
+        children = self.children.get(node_id)
+        controls, mappings = self.controls.get(node_id), self.mappings.get(node_id)
+        self.children[self.parents.pop(node_id)].remove(node_id)
+        running = self.running.pop(node_id)
+        self.add(node_id, add_action, target_id, is_group)
+        self.running[node_id] = running
+        if is_group:
+            self.children[node_id] = children
+        else:
+            self.controls[node_id], self.mappings[node_id] = controls, mappings
+
+    def set_control(self, node_id, control, value):
+        if node_id in self.children:
+            for child_id in self.children[node_id]:
+                self.set_control(child_id, control, value)
+        elif node_id in self.controls:
+            self.controls[node_id][control] = value
+            self.mappings[node_id].pop(control, None)
+
+    def handle_b_fill(self, buffer_id, *contents):
+        for i in range(0, len(contents), 3):
+            index, count, value = contents[i : i + 3]
+            for j in range(count):
+                self.buffers[buffer_id, index + j] = value
+
+    def handle_b_set(self, buffer_id, *contents):
+        for i in range(0, len(contents), 2):
+            self.buffers[buffer_id, contents[i]] = contents[i + 1]
+
+    def handle_b_setn(self, buffer_id, *contents):
+        i = 0
+        while i < len(contents):
+            index, count = contents[i : i + 2]
+            for j in range(count):
+                self.buffers[buffer_id, index + j] = contents[i + 2 + j]
+            i += 2 + count
+
+    def handle_c_fill(self, *contents):
+        for i in range(0, len(contents), 3):
+            index, count, value = contents[i : i + 3]
+            for j in range(count):
+                self.buses[index + j] = value
+
+    def handle_c_set(self, *contents):
+        for i in range(0, len(contents), 2):
+            self.buses[contents[i]] = contents[i + 1]
+
+    def handle_g_freeAll(self, *node_ids):
+        for node_id in node_ids:
+            for child_id in list(self.children.get(node_id, [])):
+                self.free(child_id)
+
+    def handle_g_head(self, *contents):
+        for i in range(0, len(contents), 2):
+            self.move(contents[i + 1], 0, contents[i])
+
+    def handle_g_new(self, *contents):
+        for i in range(0, len(contents), 3):
+            self.add(contents[i], contents[i + 1], contents[i + 2], True)
+
+    def handle_n_after(self, *contents):
+        for i in range(0, len(contents), 2):
+            self.move(contents[i], 3, contents[i + 1])
+
+    def handle_n_free(self, *node_ids):
+        for node_id in node_ids:
+            self.free(node_id)
+
+    def handle_n_map(self, node_id, *contents):
+        if node_id in self.mappings:
+            for i in range(0, len(contents), 2):
+                self.mappings[node_id][contents[i]] = contents[i + 1]
+
+    def handle_n_run(self, *contents):
+        for i in range(0, len(contents), 2):
+            if contents[i] in self.running:
+                self.running[contents[i]] = bool(contents[i + 1])
+
+    def handle_n_set(self, node_id, *contents):
+        for i in range(0, len(contents), 2):
+            self.set_control(node_id, contents[i], contents[i + 1])
+
+    def handle_other(self, *contents):
+        pass
+
+    def handle_s_new(self, name, node_id, add_action, target_id, *contents):
+        if self.add(node_id, add_action, target_id, False):
+            for i in range(0, len(contents), 2):
+                self.controls[node_id][contents[i]] = contents[i + 1]
+
+    @property
+    def state(self):
+        return (
+            dict(self.buffers),
+            dict(self.buses),
+            {key: list(value) for key, value in self.children.items()},
+            {key: dict(value) for key, value in self.controls.items()},
+            {key: dict(value) for key, value in self.mappings.items()},
+            dict(self.running),
+        )
+
+
+def perform_random_moments(score, seed, moment_count=40):
+    random_ = random.Random(seed)
+    groups, synths = [score.root_node], []
+    with score.at(0):
+        buses = score.add_bus_group(count=4)
+        buffers = [score.add_buffer(channel_count=1, frame_count=8) for _ in range(3)]
+    for i in range(moment_count):
+        with score.at(i + 1):
+            for _ in range(random_.randrange(1, 16)):
+                if random_.random() < 0.2:
+                    buffer_ = random_.choice(buffers)
+                    index = random_.randrange(6)
+                    action = random_.random()
+                    if action < 0.33:
+                        score.set_buffer(buffer_, index, random_.random())
+                    elif action < 0.66:
+                        score.fill_buffer(buffer_, index, 2, random_.random())
+                    else:
+                        score.set_buffer_range(buffer_, index, [random_.random()] * 2)
+                    continue
+                nodes = groups + synths
+                action = random_.random()
+                target_node = random_.choice(nodes)
+                add_action = random_.choice(sorted(target_node._valid_add_actions))
+                if action < 0.15:
+                    groups.append(
+                        score.add_group(add_action=add_action, target_node=target_node)
+                    )
+                elif action < 0.3:
+                    synths.append(
+                        score.add_synth(
+                            default,
+                            add_action=add_action,
+                            target_node=target_node,
+                            frequency=random_.choice([110, 220, 440]),
+                        )
+                    )
+                elif action < 0.55:
+                    score.set_node(
+                        random_.choice(nodes),
+                        **{
+                            control: random_.choice([0.0, 0.5, 1.0])
+                            for control in random_.sample(
+                                ["amplitude", "frequency", "pan"], 2
+                            )
+                        },
+                    )
+                elif action < 0.65:
+                    score.set_bus(random_.choice(buses), random_.random())
+                elif action < 0.7:
+                    score.fill_bus_range(buses[0], 2, random_.random())
+                elif action < 0.8 and len(nodes) > 1:
+                    score.free_node(random_.choice(nodes[1:]), force=True)
+                elif action < 0.85:
+                    score.map_node(random_.choice(synths or nodes), pan=buses[1])
+                elif action < 0.9 and synths:
+                    score.move_node(
+                        random_.choice(synths), "ADD_AFTER", random_.choice(nodes[1:])
+                    )
+                elif action < 0.95:
+                    if random_.random() < 0.5:
+                        score.pause_node(random_.choice(nodes))
+                    else:
+                        score.unpause_node(random_.choice(nodes))
+                elif len(groups) > 1:
+                    score.free_group_children(random_.choice(groups[1:]))
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_optimize_moments_conformance(seed):
+    """
+    Optimized moments leave a model server in the same state after every moment.
+    """
+    scores = [Score(), Score(optimize_moments=True)]
+    for score in scores:
+        perform_random_moments(score, seed)
+    bundles = [list(score.iterate_osc_bundles()) for score in scores]
+    assert [bundle.timestamp for bundle in bundles[0]] == [
+        bundle.timestamp for bundle in bundles[1]
+    ]
+    models = [ModelServer(), ModelServer()]
+    for bundle, optimized_bundle in zip(*bundles):
+        assert models[0](bundle) == models[1](optimized_bundle)
+    assert sum(len(bundle.contents) for bundle in bundles[1]) < sum(
+        len(bundle.contents) for bundle in bundles[0]
+    )
+
+
+def test_optimize_requests_merges_across_moment():
+    assert optimize_requests(
+        [
+            SetNodeControl(node_id=1000, items=[("frequency", 440.0)]),
+            SetControlBus(items=[(0, 0.5)]),
+            SetNodeControl(node_id=1000, items=[("amplitude", 0.5)]),
+            SetControlBus(items=[(1, 0.25)]),
+        ]
+    ) == [
+        SetNodeControl(node_id=1000, items=[("frequency", 440.0), ("amplitude", 0.5)]),
+        SetControlBus(items=[(0, 0.5), (1, 0.25)]),
+    ]
+
+
+def test_optimize_requests_merges_per_buffer():
+    assert optimize_requests(
+        [
+            FillBuffer(buffer_id=1, items=[(0, 4, 0.5)]),
+            SetBuffer(buffer_id=2, items=[(0, 0.5)]),
+            FillBuffer(buffer_id=2, items=[(0, 4, 0.25)]),
+            FillBuffer(buffer_id=1, items=[(4, 4, 0.75)]),
+            SetBuffer(buffer_id=2, items=[(1, 0.75)]),
+        ]
+    ) == [
+        SetBuffer(buffer_id=2, items=[(0, 0.5)]),
+        FillBuffer(buffer_id=2, items=[(0, 4, 0.25)]),
+        FillBuffer(buffer_id=1, items=[(0, 4, 0.5), (4, 4, 0.75)]),
+        SetBuffer(buffer_id=2, items=[(1, 0.75)]),
+    ]
+
+
+def test_optimize_requests_keeps_last_writes():
+    assert optimize_requests(
+        [
+            SetNodeControl(node_id=1000, items=[("frequency", 440.0), ("pan", 0.0)]),
+            SetControlBus(items=[(0, 0.5), (1, 0.5)]),
+            SetNodeControl(node_id=1001, items=[("frequency", 220.0)]),
+            SetNodeControl(node_id=1000, items=[("frequency", 880.0)]),
+            SetControlBus(items=[(0, 0.25)]),
+        ]
+    ) == [
+        SetNodeControl(node_id=1001, items=[("frequency", 220.0)]),
+        SetNodeControl(node_id=1000, items=[("pan", 0.0), ("frequency", 880.0)]),
+        SetControlBus(items=[(1, 0.5), (0, 0.25)]),
+    ]
+
+
+def test_optimize_requests_new_synths_read_buses_and_buffers():
+    # New synths read the buses mapped to their controls, and buffers, as they're
+    # created, so writes to them stay where they are around the synths.
+    new_synth = NewSynth(
+        synthdef=default,
+        synth_id=1000,
+        add_action="ADD_TO_HEAD",
+        target_node_id=1,
+        controls={"frequency": "c0"},
+    )
+    requests = [
+        SetControlBus(items=[(0, 0.5)]),
+        new_synth,
+        SetControlBus(items=[(0, 0.25)]),
+    ]
+    assert optimize_requests(requests) == requests
+    requests = [
+        SetControlBus(items=[(0, 0.5)]),
+        FillBuffer(buffer_id=1, items=[(0, 4, 0.5)]),
+        new_synth,
+        SetControlBus(items=[(1, 0.25)]),
+        FillBuffer(buffer_id=1, items=[(4, 4, 0.25)]),
+    ]
+    assert optimize_requests(requests) == requests
+
+
+def test_optimize_requests_respects_node_order():
+    # A write to a group may reach the same control on any node, so writes to
+    # the same control on different nodes don't commute.
+    requests = [
+        SetNodeControl(node_id=1000, items=[("frequency", 440.0)]),
+        SetNodeControl(node_id=1, items=[("frequency", 220.0)]),
+        SetNodeControl(node_id=1000, items=[("amplitude", 0.5)]),
+    ]
+    assert optimize_requests(requests) == requests
+    # Moving nodes changes which nodes a write to a group reaches.
+    requests = [
+        SetNodeControl(node_id=1, items=[("frequency", 440.0)]),
+        NewGroup(items=[(1000, 0, 0)]),
+        SetNodeControl(node_id=1, items=[("frequency", 220.0)]),
+    ]
+    assert optimize_requests(requests) == requests
+    # A node moved out of a group keeps the group's earlier write.
+    requests = [
+        SetNodeControl(node_id=1000, items=[("frequency", 440.0)]),
+        MoveNodeToGroupHead(items=[(1, 1001)]),
+        SetNodeControl(node_id=1000, items=[("frequency", 220.0)]),
+    ]
+    assert optimize_requests(requests) == requests
+
+
+def test_optimize_requests_eliminates_created_and_freed_nodes():
+    new_synth = NewSynth(
+        synthdef=default, synth_id=1001, add_action=0, target_node_id=1000
+    )
+    assert (
+        optimize_requests(
+            [
+                NewGroup(items=[(1000, 0, 1)]),
+                new_synth,
+                SetNodeControl(node_id=1001, items=[("frequency", 440.0)]),
+                FreeNode(node_ids=[1001, 1000]),
+            ]
+        )
+        == []
+    )
+    # A group with children stays.
+    assert optimize_requests(
+        [
+            NewGroup(items=[(1000, 0, 1)]),
+            new_synth,
+            FreeNode(node_ids=[1000]),
+        ]
+    ) == [NewGroup(items=[(1000, 0, 1)]), new_synth, FreeNode(node_ids=[1000])]
+    # Nothing is moved or dropped across requests which aren't understood.
+    requests = [
+        new_synth,
+        SetNodeControl(node_id=1001, items=[("frequency", 440.0)]),
+        QueryTree(items=[(1000, False)]),
+        SetNodeControl(node_id=1001, items=[("frequency", 220.0)]),
+        FreeNode(node_ids=[1001]),
+    ]
+    assert optimize_requests(requests) == requests
+
+
+def test_Score_optimize_moments():
+    score = Score(optimize_moments=True)
+    with score.at(0):
+        group = score.add_group()
+        synth = score.add_synth(default, target_node=group)
+        bus = score.add_bus()
+        synth.set(frequency=440)
+        bus.set(0.5)
+        synth.set(amplitude=0.25)
+        synth.set(frequency=220)
+        score.add_synth(default, target_node=group).free(force=True)
+    score.set_optimize_moments(False)
+    with score.at(1):
+        synth.set(frequency=440)
+        bus.set(0.5)
+        synth.set(frequency=220)
+    assert isinstance(group, Group)
+    assert list(score.iterate_osc_bundles()) == [
+        OscBundle(
+            contents=(
+                OscMessage("/g_new", 1000, 0, 0),
+                OscMessage("/s_new", "default", 1001, 0, 1000),
+                OscMessage("/c_set", 0, 0.5),
+                OscMessage("/n_set", 1001, "amplitude", 0.25, "frequency", 220.0),
+            ),
+            timestamp=0.0,
+        ),
+        OscBundle(
+            contents=(
+                OscMessage("/n_set", 1001, "frequency", 440.0),
+                OscMessage("/c_set", 0, 0.5),
+                OscMessage("/n_set", 1001, "frequency", 220.0),
+            ),
+            timestamp=1.0,
+        ),
+    ]
@@ -0,0 +1,286 @@
+import pytest
+
+from supriya import default
+from supriya.contexts.nonrealtime import Score
+from supriya.contexts.requests import (
+    AllocateBuffer,
+    CloseBuffer,
+    CopyBuffer,
+    FillControlBusRange,
+    FreeBuffer,
+    NewSynths,
+    NormalizeBuffer,
+    QueryTree,
+    SetBuffer,
+    SetBufferRange,
+    SetControlBus,
+    SetControlBusRange,
+    SetNodeControl,
+    WriteBuffer,
+    ZeroBuffer,
+)
+from supriya.contexts.segments import ScoreState, stitch_segments
+from supriya.enums import AddAction
+from supriya.osc import OscMessage
+from supriya.ugens import (
+    EnvGen,
+    Envelope,
+    Line,
+    Out,
+    PlayBuf,
+    SinOsc,
+    SynthDefBuilder,
+)
+
+
+def test_ScoreState():
+    score = Score()
+    with score.at(0):
+        with score.add_synthdefs(default):
+            group_a = score.add_group()
+            group_b = score.add_group(parallel=True)
+            synth_a = group_a.add_synth(default, frequency=111)
+            synth_b = group_a.add_synth(default, add_action="ADD_TO_TAIL")
+            synth_b.add_synth(default, add_action="REPLACE", amplitude=0.1)
+            group_c = group_b.add_group()
+            synth_d = group_c.add_synth(default)
+            score.add_buffer(channel_count=1, frame_count=512)
+    with score.at(1):
+        synth_a.set(frequency=222, pan=-0.5)
+        group_a.set(amplitude=0.2)
+        group_c.move(group_a, "ADD_AFTER")
+        synth_d.map(frequency=score.add_bus("control"))
+        synth_d.pause()
+    with score.at(2):
+        group_b.free()
+        synth_a.free()
+        score._add_requests(
+            NewSynths(
+                synthdef=default,
+                synth_ids=[2000, 2001],
+                add_action=AddAction.ADD_TO_HEAD,
+                target_node_id=int(group_c),
+                controls={"frequency": [333, 444]},
+            ),
+            SetNodeControl(node_id=2001, items=[("gate", 0)]),
+        )
+    state = ScoreState()
+    for bundle in score.iterate_request_bundles():
+        for request in bundle.contents:
+            state.apply(request, bundle.timestamp)
+    assert sorted(state.synths) == [1004, 1006, 2000]
+    assert state.lifetimes == [(0.0, 0.0), (0.0, 2.0), (2.0, 2.0)]
+    requests = state.to_requests()
+    # the SynthDefs' completion requests are tracked, not replayed verbatim
+    assert requests[0].on_completion is None
+    assert [request.to_osc() for request in requests[1:]] == [
+        OscMessage("/b_alloc", 0, 512, 1),
+        OscMessage("/g_new", 1000, 1, 0),
+        OscMessage("/s_new", "default", 1004, 1, 1000, "amplitude", 0.2),
+        OscMessage("/g_new", 1005, 1, 0),
+        OscMessage("/s_new", "default", 2000, 1, 1005, "frequency", 333.0),
+        OscMessage("/s_new", "default", 1006, 1, 1005, "frequency", "c0"),
+        OscMessage("/n_run", 1006, 0),
+    ]
+
+
+def test_ScoreState_buses_and_buffers():
+    state = ScoreState()
+    for request in [
+        SetControlBus(items=[(2, 0.0), (3, 0.0)]),
+        SetControlBus(items=[(0, 0.1), (1, 0.2)]),
+        FillControlBusRange(items=[(1, 3, 0.3)]),
+        SetControlBusRange(items=[(2, [0.4, 0.5])]),
+        AllocateBuffer(buffer_id=0, frame_count=8),
+        SetBuffer(buffer_id=0, items=[(0, 0.1)]),
+        ZeroBuffer(buffer_id=0),
+        SetBufferRange(buffer_id=0, items=[(0, [0.2, 0.3])]),
+        SetBuffer(buffer_id=0, items=[(1, 0.4)]),
+        NormalizeBuffer(buffer_id=0),
+        SetBuffer(buffer_id=0, items=[(0, 0.5)]),
+        WriteBuffer(
+            buffer_id=0,
+            path="out.aiff",
+            header_format="AIFF",
+            sample_format="INT24",
+            leave_open=True,
+        ),
+        CloseBuffer(buffer_id=0),
+        QueryTree(items=[(0, False)]),
+        AllocateBuffer(buffer_id=1, frame_count=8),
+        SetBuffer(buffer_id=1, items=[(0, 0.6)]),
+        FreeBuffer(buffer_id=1),
+        AllocateBuffer(buffer_id=1, frame_count=4),
+        AllocateBuffer(buffer_id=2, frame_count=8),
+        SetBuffer(buffer_id=2, items=[(0, 0.7)]),
+        CopyBuffer(source_buffer_id=2, target_buffer_id=1),
+        FreeBuffer(buffer_id=2),
+    ]:
+        state.apply(request)
+    assert [request.to_osc() for request in state.to_requests()] == [
+        OscMessage("/c_set", 0, 0.1, 1, 0.2),
+        OscMessage("/c_fill", 1, 3, 0.3),
+        OscMessage("/c_setn", 2, 2, 0.4, 0.5),
+        OscMessage("/b_alloc", 0, 8, 1),
+        OscMessage("/b_zero", 0),
+        OscMessage("/b_setn", 0, 0, 2, 0.2, 0.3),
+        OscMessage("/b_set", 0, 1, 0.4),
+        OscMessage("/b_gen", 0, "normalize", 1.0),
+        OscMessage("/b_set", 0, 0, 0.5),
+        OscMessage("/b_alloc", 1, 4, 1),
+        OscMessage("/b_alloc", 2, 8, 1),
+        OscMessage("/b_set", 2, 0, 0.7),
+        OscMessage("/b_gen", 1, "copy", 0, 2, 0, -1),
+        OscMessage("/b_free", 2),
+    ]
+
+
+@pytest.fixture
+def score():
+    score = Score()
+    with score.at(0):
+        with score.add_synthdefs(default):
+            effect = score.add_synth(default, amplitude=0.2)
+    for i in range(4):
+        with score.at(i * 2):
+            synth = score.add_synth(default, frequency=110 * (i + 1))
+        with score.at(i * 2 + 1.5):
+            synth.free()
+    with score.at(4.5):
+        effect.set(amplitude=0.3)
+    with score.at(9):
+        score.do_nothing()
+    return score
+
+
+def test_Score_find_quiet_points(score):
+    # the effect synth never ends, so doesn't count
+    assert score.find_quiet_points() == [1.5, 2.0, 3.5, 4.0, 5.5, 6.0, 7.5]
+    assert score.find_quiet_points(until=4.0) == [1.5, 2.0, 3.5]
+
+
+def test_Score_split(score):
+    segments = score.split([4.0, 6.0], crossfade=0.5, preroll=1.0, sample_rate=1000)
+    assert [starting_frame for starting_frame, _ in segments] == [0, 2944, 4992]
+    # state left behind before each segment is rebuilt at its start
+    _, segment = segments[1]
+    assert [request.to_osc() for request in segment._requests[0.0][1:]] == [
+        OscMessage("/s_new", "default", 1002, 1, 0, "frequency", 220.0),
+        OscMessage("/s_new", "default", 1000, 1, 0, "amplitude", 0.2),
+    ]
+    # later requests are shifted, up to the end of the next segment's crossfade
+    assert [
+        (round(bundle.timestamp, 3), bundle.to_osc().contents)
+        for bundle in segment.iterate_request_bundles()
+    ][1:] == [
+        (0.556, (OscMessage("/n_set", 1002, "gate", 0.0),)),
+        (1.056, (OscMessage("/s_new", "default", 1003, 0, 0, "frequency", 330.0),)),
+        (1.556, (OscMessage("/n_set", 1000, "amplitude", 0.3),)),
+        (2.556, (OscMessage("/n_set", 1003, "gate", 0.0),)),
+        (3.056, (OscMessage("/s_new", "default", 1004, 0, 0),)),
+        (3.556, (OscMessage(0),)),
+    ]
+    # the last segment runs to the end of the score
+    assert max(segments[2][1]._requests) == pytest.approx(9 - 4.992)
+    with pytest.raises(ValueError):
+        score.split([4.0, 4.25], crossfade=0.5)
+    with pytest.raises(ValueError):
+        score.split([10.0])
+
+
+@pytest.fixture
+def one_shots():
+    with SynthDefBuilder(duration=1.0) as builder:
+        Out.ar(
+            bus=0,
+            source=SinOsc.ar()
+            * Line.kr(duration=builder["duration"], done_action=2)
+            * EnvGen.kr(envelope=Envelope.percussive(release_time=2.0), done_action=2),
+        )
+    line = builder.build(name="line")
+    with SynthDefBuilder(buffer_id=0) as builder:
+        Out.ar(bus=0, source=PlayBuf.ar(buffer_id=builder["buffer_id"], done_action=2))
+    play_buf = builder.build(name="play_buf")
+    return line, play_buf
+
+
+def test_ScoreState_done_actions(one_shots):
+    line, play_buf = one_shots
+    score = Score()
+    with score.at(0):
+        with score.add_synthdefs(line, play_buf):
+            score.add_synth(line, duration=0.5)
+            score.add_synth(line, duration=3.0)
+            score.add_synth(play_buf)
+            score.add_synth(default)
+    with score.at(1):
+        # referenced by name, resolved via the received SynthDefs
+        score._add_requests(
+            NewSynths(
+                synthdef="line",
+                synth_ids=[2000],
+                add_action=AddAction.ADD_TO_HEAD,
+                target_node_id=0,
+            )
+        )
+    with score.at(2):
+        score.do_nothing()
+    state = ScoreState()
+    for bundle in score.iterate_request_bundles():
+        for request in bundle.contents:
+            state.apply(request, bundle.timestamp)
+    # the shorter of the line and the envelope frees each synth
+    assert state.lifetimes == [(0.0, 0.5), (1.0, 2.0)]
+    synths = state.synths
+    assert [(x, y.frees_itself, y.expires) for x, y in synths.items()] == [
+        (1001, True, 2.01),
+        (1002, True, None),
+        (1003, False, None),
+    ]
+    state.expire(2.01)
+    assert sorted(state.synths) == [1002, 1003]
+    assert state.lifetimes[-1] == (0.0, 2.01)
+
+
+def test_Score_find_quiet_points_done_actions(one_shots):
+    line, play_buf = one_shots
+    score = Score()
+    with score.at(0):
+        with score.add_synthdefs(line, play_buf):
+            score.add_synth(line, duration=0.5)
+    with score.at(1):
+        score.add_synth(line, duration=1.25)
+    with score.at(2):
+        score.add_synth(line, duration=0.25)
+    for timestamp in [2.5, 3.0, 4.0, 5.0]:
+        with score.at(timestamp):
+            score.do_nothing()
+    # freed between timestamps, so quiet from the next one on
+    assert score.find_quiet_points() == [1.0, 2.5, 3.0, 4.0]
+    with score.at(3.5):
+        score.add_synth(play_buf)
+    # how long it plays for is unknown, so the score is never quiet again
+    assert score.find_quiet_points() == [1.0, 2.5, 3.0, 3.5]
+    with pytest.warns(UserWarning, match="Synth 1003"):
+        score.split([4.0], preroll=0.25)
+
+
+def test_stitch_segments():
+    numpy = pytest.importorskip("numpy")
+    array = numpy.random.default_rng(0).uniform(-1, 1, (1000, 2))
+    segments = [(0, array[:420]), (256, array[256:720]), (640, array[640:])]
+    stitched = stitch_segments(segments, [400, 700], 20)
+    # identical overlaps crossfade back into the original
+    assert numpy.allclose(stitched, array, atol=1e-6)
+    # unrelated overlaps crossfade linearly
+    segments = [(0, numpy.ones((8, 1))), (0, numpy.zeros((8, 1)))]
+    assert stitch_segments(segments, [2], 3)[:, 0].tolist() == [
+        1.0,
+        1.0,
+        0.75,
+        0.5,
+        0.25,
+        0.0,
+        0.0,
+        0.0,
+    ]
@@ -0,0 +1,227 @@
+import random
+
+import pytest
+
+from supriya.contexts import Group, Server, Synth
+from supriya.contexts.responses import QueryTreeDiff, QueryTreeGroup, QueryTreeSynth
+from supriya.contexts.trees import NodeTree
+from supriya.enums import NodeAction
+from supriya.osc import OscMessage
+
+
+class ListNodeTree:
+    """
+    A list-based reference model of a node tree.
+    """
+
+    def __init__(self):
+        self.children = {0: []}
+        self.parents = {}
+
+    def add(self, node_id, parent_id, previous_id, next_id, is_group=False):
+        if is_group:
+            self.children[node_id] = []
+        self.link(node_id, parent_id, previous_id, next_id)
+
+    def link(self, node_id, parent_id, previous_id, next_id):
+        siblings = self.children[parent_id]
+        self.parents[node_id] = parent_id
+        if previous_id == -1:
+            siblings.insert(0, node_id)
+        elif previous_id in siblings:
+            siblings.insert(siblings.index(previous_id) + 1, node_id)
+        elif next_id in siblings:
+            siblings.insert(siblings.index(next_id), node_id)
+        else:
+            siblings.append(node_id)
+
+    def move(self, node_id, parent_id, previous_id, next_id):
+        self.children[self.parents[node_id]].remove(node_id)
+        self.link(node_id, parent_id, previous_id, next_id)
+
+    def remove(self, node_id):
+        self.children[self.parents.pop(node_id)].remove(node_id)
+        self.children.pop(node_id, None)
+
+
+def locate(reference, node_id):
+    siblings = reference.children[reference.parents[node_id]]
+    index = siblings.index(node_id)
+    previous_id = siblings[index - 1] if index else -1
+    next_id = siblings[index + 1] if index + 1 < len(siblings) else -1
+    return reference.parents[node_id], previous_id, next_id
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_NodeTree_conformance(seed):
+    """
+    Replay random notifications against the tree and a list-based model.
+    """
+    random_ = random.Random(seed)
+    tree, reference = NodeTree(), ListNodeTree()
+    for node_id in range(1, 1000):
+        nodes = list(reference.parents)
+        action = random_.random()
+        if action < 0.5 or not nodes:
+            # Place the new node the way scsynth would, then describe it.
+            group_id = random_.choice(list(reference.children))
+            is_group = random_.random() < 0.2
+            reference.add(
+                node_id,
+                group_id,
+                random_.choice([-1, *reference.children[group_id]]),
+                -1,
+                is_group,
+            )
+            tree.add(node_id, *locate(reference, node_id), is_group=is_group)
+        elif action < 0.8:
+            node_id = random_.choice(nodes)
+            group_id = random_.choice(
+                [x for x in reference.children if node_id not in tree.get_parentage(x)]
+            )
+            reference.move(
+                node_id,
+                group_id,
+                random_.choice([-1, *reference.children[group_id]]),
+                -1,
+            )
+            tree.move(node_id, *locate(reference, node_id))
+        elif not reference.children.get(node_id := random_.choice(nodes)):
+            reference.remove(node_id)
+            tree.remove(node_id)
+        for group_id, children in reference.children.items():
+            assert list(tree.iterate_children(group_id)) == children
+        for node_id, parent_id in reference.parents.items():
+            assert tree.get_parent(node_id) == parent_id
+        assert len(tree) == len(reference.parents) + 1
+
+
+def mutate(tree, random_, node_ids, count):
+    for _ in range(count):
+        groups = [x for x in node_ids if tree.is_group(x)]
+        action = random_.random()
+        if action < 0.5 or len(node_ids) < 2:
+            node_id = max(node_ids) + 1
+            parent_id = random_.choice(groups)
+            previous_id = random_.choice([-1, *tree.iterate_children(parent_id)])
+            tree.add(node_id, parent_id, previous_id, -1, random_.random() < 0.3)
+            node_ids.append(node_id)
+            continue
+        node_id = random_.choice(node_ids[1:])
+        if action < 0.8:
+            parent_id = random_.choice(
+                [x for x in groups if node_id not in tree.get_parentage(x)]
+            )
+            previous_id = random_.choice(
+                [-1, *(x for x in tree.iterate_children(parent_id) if x != node_id)]
+            )
+            tree.move(node_id, parent_id, previous_id, -1)
+        else:
+            for x in [x for x in node_ids if node_id in tree.get_parentage(x)]:
+                tree.remove(x)
+                node_ids.remove(x)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_QueryTreeDiff(seed):
+    """
+    Replaying a diff's changes on the old tree rebuilds the new tree.
+    """
+    random_ = random.Random(seed)
+    tree, node_ids = NodeTree(), [0]
+    mutate(tree, random_, node_ids, 200)
+    old = QueryTreeGroup.from_node_tree(tree)
+    mutate(tree, random_, node_ids, random_.choice([0, 1, 5, 50]))
+    new = QueryTreeGroup.from_node_tree(tree)
+    diff = QueryTreeDiff.from_query_tree_groups(old, new)
+    assert bool(diff) == (old != new)
+    # Replay the diff on a copy of the old tree.
+    replayed = NodeTree()
+    for node_id, (parent_id, previous_id, node) in QueryTreeDiff._flatten(old).items():
+        is_group = isinstance(node, QueryTreeGroup)
+        replayed.add(node_id, parent_id, previous_id, -1, is_group)
+    for item in diff.items:
+        if item.action == NodeAction.NODE_CREATED:
+            replayed.add(
+                item.node_id, item.parent_id, item.previous_id, -1, item.is_group
+            )
+        elif item.action == NodeAction.NODE_MOVED:
+            replayed.move(item.node_id, item.parent_id, item.previous_id, -1)
+        else:
+            replayed.remove(item.node_id)
+    assert QueryTreeGroup.from_node_tree(replayed) == new
+    assert len(replayed) == len(tree)
+
+
+def test_QueryTreeGroup_from_node_tree():
+    server = Server()
+    for message in [
+        OscMessage("/n_go", 1, 0, -1, -1, 1),
+        OscMessage("/n_go", 1000, 1, -1, -1, 1),
+        OscMessage("/n_go", 1001, 1000, -1, -1, 0),
+        OscMessage("/n_go", 1002, 1, 1000, -1, 0),
+    ]:
+        server._handle_osc_callbacks(message)
+    assert server.query_tree(source="local") == QueryTreeGroup(
+        node_id=0,
+        children=[
+            QueryTreeGroup(
+                node_id=1,
+                children=[
+                    QueryTreeGroup(
+                        node_id=1000,
+                        children=[QueryTreeSynth(node_id=1001, synthdef_name=None)],
+                    ),
+                    QueryTreeSynth(node_id=1002, synthdef_name=None),
+                ],
+            )
+        ],
+    )
+    assert server.query_tree(
+        Group(context=server, id_=1000), source="local"
+    ) == QueryTreeGroup(
+        node_id=1000, children=[QueryTreeSynth(node_id=1001, synthdef_name=None)]
+    )
+    assert server.query_tree(
+        Group(context=server, id_=1002), source="local"
+    ) == QueryTreeSynth(node_id=1002, synthdef_name=None)
+    assert server.query_tree(Group(context=server, id_=1003), source="local") is None
+
+
+def test_NodeTree_remove_group():
+    tree = NodeTree()
+    tree.add(1, 0, -1, -1, is_group=True)
+    tree.add(1000, 1, -1, -1)
+    tree.add(1001, 1, 1000, -1)
+    tree.remove(1)
+    assert 1 not in tree
+    assert list(tree.iterate_children(0)) == []
+    assert tree.get_parent(1000) is None
+    tree.remove(1000)
+    tree.remove(1001)
+    assert len(tree) == 1
+    tree.remove(0)
+    assert 0 in tree
+
+
+def test_BaseServer_node_tree():
+    server = Server()
+    for message in [
+        OscMessage("/n_go", 1, 0, -1, -1, 1),
+        OscMessage("/n_go", 1000, 1, -1, -1, 0),
+        OscMessage("/n_go", 1001, 1, 1000, -1, 1),
+        OscMessage("/n_go", 1002, 1001, -1, -1, 0),
+        OscMessage("/n_move", 1000, 1001, 1002, -1),
+        OscMessage("/n_off", 1002),
+    ]:
+        server._handle_osc_callbacks(message)
+    group = Group(context=server, id_=1001)
+    synth = Synth(context=server, id_=1000, synthdef=None)
+    assert [node.id_ for node in Group(context=server, id_=1).children] == [1001]
+    assert [node.id_ for node in group.children] == [1002, 1000]
+    assert [node.id_ for node in synth.parentage] == [1000, 1001, 1, 0]
+    assert synth.parent == group
+    assert not Synth(context=server, id_=1002, synthdef=None).active
+    assert synth.active
+    server._handle_osc_callbacks(OscMessage("/n_end", 1002, 1001, -1, 1000, 0))
+    assert [node.id_ for node in group.children] == [1000]
@@ -516,3 +516,21 @@ def test_nonrealtime():
             timestamp=4.5,
         ),
     ]
+
+
+def test_send_many(mocker):
+    context = Score()
+    send_many = mocker.spy(context, "send_many")
+    pattern = EventPattern(frequency=SequencePattern([440, 550, 660]))
+    pattern.play(context=context, clock=OfflineClock(), at=0.0)
+    # Each tick flushes its moments through one send_many() call.
+    assert [
+        [request_bundle.timestamp for request_bundle in call.args[0]]
+        for call in send_many.call_args_list
+    ] == [[0.0], [2.0], [4.0], [6.0]]
+    assert [osc_bundle.timestamp for osc_bundle in context.iterate_osc_bundles()] == [
+        0.0,
+        2.0,
+        4.0,
+        6.0,
+    ]
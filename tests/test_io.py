@@ -0,0 +1,149 @@
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from supriya import io, render, render_many
+from supriya.io import PlayMemo, RenderCache
+
+
+def entry(i):
+    return f"score-{i:064x}.aiff"
+
+
+def test_RenderCache_get_publish(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    assert cache.get(entry(0)) is None
+    path = cache.publish(entry(0), b"foo")
+    assert path == tmp_path / "cache" / entry(0)
+    (tmp_path / "source.aiff").write_bytes(b"bar")
+    assert cache.publish(entry(1), tmp_path / "source.aiff").read_bytes() == b"bar"
+    assert cache.get(entry(0)) == path
+    assert cache.get(entry(1)).read_bytes() == b"bar"
+    assert cache.statistics == RenderCache.Statistics(hits=2, misses=1)
+    assert cache.statistics.hit_rate == pytest.approx(2 / 3)
+    assert sorted(x.name for x in (tmp_path / "cache").iterdir()) == [
+        entry(0),
+        entry(1),
+    ]
+
+
+def test_RenderCache_evict_size(tmp_path):
+    cache = RenderCache(tmp_path, maximum_size=30)
+    (tmp_path / "plot.png").write_bytes(b"x" * 100)  # not an entry
+    now = time.time()
+    for i in range(3):
+        cache.publish(entry(i), b"x" * 10)
+        os.utime(tmp_path / entry(i), (now - 10 + i, now - 10 + i))
+    # hits make entries most recently used
+    cache.get(entry(0))
+    cache.publish(entry(3), b"x" * 10)
+    assert not (tmp_path / entry(1)).exists()
+    assert sorted(x.name for x in tmp_path.iterdir()) == [
+        "plot.png",
+        entry(0),
+        entry(2),
+        entry(3),
+    ]
+    assert cache.statistics.evictions == 1
+    # entries larger than the cache are evicted as soon as they're published
+    assert not cache.publish(entry(4), b"x" * 100).exists()
+
+
+def test_RenderCache_evict_age(tmp_path):
+    cache = RenderCache(tmp_path, maximum_age=60)
+    now = time.time()
+    for i in range(3):
+        cache.publish(entry(i), b"x")
+        os.utime(tmp_path / entry(i), (now - 50 * i, now - 50 * i))
+    assert cache.evict() == [tmp_path / entry(2)]
+    assert cache.get(entry(0)) is not None
+    assert cache.get(entry(1)) is not None
+
+
+def test_RenderCache_publish_concurrently(tmp_path):
+    cache = RenderCache(tmp_path)
+    contents = bytes(range(256)) * 4096
+    barrier = threading.Barrier(8)
+    observed = []
+
+    def publish():
+        barrier.wait()
+        observed.append(cache.publish(entry(0), contents).read_bytes())
+
+    threads = [threading.Thread(target=publish) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # readers only ever see complete entries, and no staging files linger
+    assert observed == [contents] * 8
+    assert [x.name for x in tmp_path.iterdir()] == [entry(0)]
+
+
+def test_RenderCache_from_expr(tmp_path):
+    cache = RenderCache(tmp_path)
+    assert RenderCache.from_expr(True) is io.render_cache
+    assert RenderCache.from_expr(False) is None
+    assert RenderCache.from_expr(cache) is cache
+
+
+def test_PlayMemo_render_cache(tmp_path):
+    cache = RenderCache(tmp_path)
+    memo = PlayMemo(contents=b"RIFF", suffix=".wav")
+    path, exit_code = render(memo, cache=cache)
+    assert (path.parent, path.suffix, exit_code) == (tmp_path, ".wav", 0)
+    assert render(memo, cache=cache) == (path, 0)
+    assert cache.statistics == RenderCache.Statistics(hits=1, misses=1)
+
+
+class Renderable:
+    def __init__(self, name, jobs, delay=0.01, exception=None):
+        self.delay = delay
+        self.exception = exception
+        self.jobs = jobs
+        self.name = name
+
+    async def __render__(
+        self, output_file_path=None, render_directory_path=None, **kwargs
+    ):
+        self.jobs["running"].add(self.name)
+        self.jobs["peak"] = max(self.jobs["peak"], len(self.jobs["running"]))
+        try:
+            kwargs["on_progress"](0.5)
+            await asyncio.sleep(self.delay)
+            if self.exception is not None:
+                raise self.exception
+            return Path(render_directory_path) / self.name, 0
+        except asyncio.CancelledError:
+            self.jobs["cancelled"].add(self.name)
+            raise
+        finally:
+            self.jobs["running"].remove(self.name)
+
+
+def test_render_many(tmp_path):
+    jobs = {"cancelled": set(), "peak": 0, "running": set()}
+    progress = []
+    renderables = [Renderable(str(i), jobs, delay=0.05 - i / 1000) for i in range(20)]
+    assert render_many(
+        renderables,
+        max_workers=4,
+        on_progress=lambda *args: progress.append(args),
+        render_directory_path=tmp_path,
+    ) == [(tmp_path / str(i), 0) for i in range(20)]
+    assert jobs["peak"] == 4
+    assert sorted(progress) == [(i, x) for i in range(20) for x in (0.5, 1.0)]
+
+
+def test_render_many_failure():
+    jobs = {"cancelled": set(), "peak": 0, "running": set()}
+    renderables = [Renderable(str(i), jobs, delay=10) for i in range(10)]
+    renderables[1] = Renderable("1", jobs, exception=ValueError("1"))
+    with pytest.raises(ValueError):
+        render_many(renderables, max_workers=3, on_progress=lambda *args: None)
+    # running renders are cancelled, queued renders never start
+    assert jobs == {"cancelled": {"0", "2"}, "peak": 3, "running": set()}
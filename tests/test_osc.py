@@ -1,17 +1,30 @@
 import asyncio
 import logging
+import socket
+import socketserver
+import struct
+import threading
 import time
 
 import pytest
 from uqbar.strings import normalize
 
+from supriya.contexts import AsyncServer, Server
 from supriya.osc import (
     NTP_DELTA,
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
     OscBundle,
     OscMessage,
+    OscMessageTemplate,
+    OscProtocolOffline,
+    OscTraceReader,
+    OscTraceWriter,
+    RingCaptureEntry,
+    ThreadedBatchOscProtocol,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
     find_free_port,
 )
 from supriya.scsynth import AsyncProcessProtocol, Options, SyncProcessProtocol
@@ -67,6 +80,150 @@ def test_OscMessage():
     )
 
 
+def test_OscMessage_to_datagram():
+    osc_message = OscMessage(
+        "/n_setn", 1000, "amplitude", 3, 0.5, 0.25, 0.125, b"\x01\x02", [True, None]
+    )
+    assert osc_message.to_datagram() == (
+        b"/n_setn\x00"
+        b",isifffb[TN]\x00\x00\x00\x00"
+        b"\x00\x00\x03\xe8"
+        b"amplitude\x00\x00\x00"
+        b"\x00\x00\x00\x03"
+        b"?\x00\x00\x00>\x80\x00\x00>\x00\x00\x00"
+        b"\x00\x00\x00\x02\x01\x02\x00\x00"
+    )
+    assert (
+        OscMessage(7, 1.5).to_datagram() == b"\x00\x00\x00\x07,f\x00\x00?\xc0\x00\x00"
+    )
+    values = [float(i) for i in range(2000)]
+    osc_message = OscMessage("/n_setn", 1000, 0, len(values), *values)
+    assert OscMessage.from_datagram(osc_message.to_datagram()) == osc_message
+
+
+def test_OscMessage_to_datagram_errors():
+    with pytest.raises(TypeError):
+        OscMessage("/foo", object()).to_datagram()
+    with pytest.raises(struct.error):
+        OscMessage("/foo", 2**40).to_datagram()
+
+
+def test_OscMessage_from_datagram_numeric_runs():
+    values = [float(i) / 8 for i in range(10000)]
+    osc_message = OscMessage("/b_setn", 0, 0, len(values), *values)
+    assert OscMessage.from_datagram(osc_message.to_datagram()) == osc_message
+    osc_message = OscMessage("/foo", 1, 2.5, "bar", [3, 4.5, [b"baz"]], 6, None)
+    assert OscMessage.from_datagram(osc_message.to_datagram()) == osc_message
+    assert (
+        OscMessage.from_datagram(memoryview(osc_message.to_datagram())) == osc_message
+    )
+
+
+def test_OscMessage_from_datagram_truncated():
+    datagram = OscMessage("/foo", 1, 2.5, "bar").to_datagram()
+    for index in range(len(datagram) - 4):
+        with pytest.raises(Exception):
+            OscMessage.from_datagram(datagram[:index])
+
+
+def test_OscBundle_from_datagram_nested():
+    osc_bundle = OscBundle(
+        timestamp=1401557034.5,
+        contents=(
+            OscMessage("/one", 1),
+            OscBundle(contents=(OscMessage("/two", 2.0, "three"),)),
+            OscMessage("/four", OscMessage("/five", 5)),
+        ),
+    )
+    assert OscBundle.from_datagram(osc_bundle.to_datagram()) == osc_bundle
+
+
+def flatten(osc_bundle):
+    for content in osc_bundle.contents:
+        if isinstance(content, OscBundle):
+            yield from ((content.timestamp, x) for _, x in flatten(content))
+        else:
+            yield osc_bundle.timestamp, content
+
+
+def test_OscBundle_pack():
+    messages = [OscMessage("/n_set", 1000 + i, "amplitude", 0.5) for i in range(100)]
+    osc_bundle = OscBundle(
+        timestamp=1401557034.5,
+        contents=[
+            *messages[:50],
+            OscBundle(timestamp=1401557035.0, contents=messages[50:90]),
+            *messages[90:],
+            OscMessage("/b_setn", 0, 0, 256, *([0.25] * 256)),
+        ],
+    )
+    bundles = osc_bundle.pack(maximum_size=512)
+    assert len(bundles) > 1
+    for bundle in bundles:
+        assert bundle.timestamp == osc_bundle.timestamp
+        datagram = bundle.to_datagram()
+        assert len(datagram) <= 512 or len(bundle.contents) == 1
+        # Cached datagrams match a fresh encoding.
+        assert datagram == OscBundle.from_datagram(datagram).to_datagram()
+        assert OscBundle.from_datagram(datagram) == bundle
+    # Order, timestamps and nesting survive splitting.
+    assert [x for bundle in bundles for x in flatten(bundle)] == list(
+        flatten(osc_bundle)
+    )
+    # A bundle that fits is returned as is, and changing it drops the cache.
+    small_bundle = OscBundle(timestamp=1.0, contents=messages[:2])
+    assert small_bundle.pack() == [small_bundle]
+    assert small_bundle.pack()[0] is small_bundle
+    small_bundle.timestamp = 2.0
+    assert OscBundle.from_datagram(small_bundle.to_datagram()).timestamp == 2.0
+    assert OscBundle(contents=[]).pack() == [OscBundle(contents=[])]
+
+
+def test_OscBundle_partition():
+    messages = [OscMessage("/n_set", 1000 + i, "amplitude", 0.5) for i in range(500)]
+    bundles = OscBundle.partition(messages, timestamp=1.5)
+    assert [len(bundle.contents) for bundle in bundles] == [204, 204, 92]
+    assert all(len(bundle.to_datagram()) <= 8192 for bundle in bundles)
+    assert [x for bundle in bundles for x in bundle.contents] == messages
+    assert OscBundle.partition([]) == []
+
+
+@pytest.mark.parametrize(
+    "contents, values",
+    [
+        ((), ()),
+        ((int,), (1,)),
+        ((int, int, int), (1, 2, 3)),
+        (("default", int, int, int, "amplitude", float), (1, 0, 1000, 0.5)),
+        ((int, "frequency", float, "amplitude", float), (1000, 440.0, 0.5)),
+        ((b"\x01\x02\x03", float, [1, "two"], int, None, True), (1.5, -7)),
+        ((OscMessage("/bar", 1), float, float), (2.5, 3.5)),
+    ],
+)
+def test_OscMessageTemplate(contents, values):
+    template = OscMessageTemplate("/foo", *contents)
+    iterator = iter(values)
+    expected = OscMessage(
+        "/foo", *(next(iterator) if x in (int, float) else x for x in contents)
+    )
+    assert template.to_datagram(*values) == expected.to_datagram()
+    osc_message = template.to_osc_message(*values)
+    assert osc_message == expected
+    assert osc_message.to_datagram() == expected.to_datagram()
+    with pytest.raises(ValueError):
+        template.to_datagram(*values, 1)
+    with pytest.raises(ValueError):
+        template.to_osc_message(*values, 1)
+
+
+def test_OscMessageTemplate_stale_datagram():
+    template = OscMessageTemplate("/n_set", int, "frequency", float)
+    osc_message = template.to_osc_message(1000, 440)
+    assert osc_message.contents == (1000, "frequency", 440.0)
+    osc_message.contents = (1001, "frequency", 443.0)
+    assert osc_message.to_datagram() == template.to_datagram(1001, 443.0)
+
+
 def test_new_ntp_era():
     """
     Check for NTP timestamp overflow.
@@ -147,3 +304,417 @@ def test_ThreadedOscProtocol():
             break
     assert healthcheck_failed
     assert not osc_protocol.is_running
+
+
+class EchoHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while data := self.request.recv(4096):
+            self.request.sendall(data)
+
+
+@pytest.fixture
+def tcp_echo_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), EchoHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+class UdpEchoHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        data, socket_ = self.request
+        socket_.sendto(data, self.client_address)
+
+
+@pytest.fixture
+def udp_echo_server():
+    server = socketserver.ThreadingUDPServer(("127.0.0.1", 0), UdpEchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def serial_udp_echo_server():
+    # Handles one datagram at a time, so echoes keep their order.
+    server = socketserver.UDPServer(("127.0.0.1", 0), UdpEchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+ECHO_MESSAGES = [
+    OscMessage("/echo", 1, 2.5, "three"),
+    # Larger than any single UDP datagram and than a single socket read.
+    OscMessage("/echo", 2, b"\xff" * 100_000),
+    OscMessage("/echo", 3, *(float(i) for i in range(1000))),
+]
+
+
+@pytest.mark.asyncio
+async def test_AsyncTcpOscProtocol(tcp_echo_server):
+    received = []
+    osc_protocol = AsyncTcpOscProtocol()
+    osc_protocol.register(pattern="/echo", procedure=received.append)
+    await osc_protocol.connect("127.0.0.1", tcp_echo_server)
+    assert osc_protocol.is_running
+    for osc_message in ECHO_MESSAGES:
+        osc_protocol.send(osc_message)
+    for _ in range(100):
+        if len(received) == len(ECHO_MESSAGES):
+            break
+        await asyncio.sleep(0.01)
+    assert received == ECHO_MESSAGES
+    osc_protocol.disconnect()
+    await asyncio.wait_for(osc_protocol.exit_future, 1.0)
+    assert not osc_protocol.is_running
+
+
+def test_ThreadedTcpOscProtocol(tcp_echo_server):
+    received = []
+    osc_protocol = ThreadedTcpOscProtocol()
+    osc_protocol.register(pattern="/echo", procedure=received.append)
+    osc_protocol.connect("127.0.0.1", tcp_echo_server)
+    assert osc_protocol.is_running
+    for osc_message in ECHO_MESSAGES:
+        osc_protocol.send(osc_message)
+    for _ in range(100):
+        if len(received) == len(ECHO_MESSAGES):
+            break
+        time.sleep(0.01)
+    assert received == ECHO_MESSAGES
+    osc_protocol.disconnect()
+    assert not osc_protocol.is_running
+    assert osc_protocol.socket is None
+
+
+def test_ThreadedTcpOscProtocol_connection_lost(tcp_echo_server):
+    osc_protocol = ThreadedTcpOscProtocol()
+    osc_protocol.connect("127.0.0.1", tcp_echo_server)
+    osc_protocol.socket.shutdown(socket.SHUT_WR)  # echo server hangs up in turn
+    for _ in range(100):
+        if not osc_protocol.is_running:
+            break
+        time.sleep(0.01)
+    assert not osc_protocol.is_running
+
+
+@pytest.mark.parametrize(
+    "server_class, osc_protocol_class",
+    [(AsyncServer, AsyncTcpOscProtocol), (Server, ThreadedTcpOscProtocol)],
+)
+def test_Server_tcp_protocol(server_class, osc_protocol_class):
+    server = server_class(protocol="tcp")
+    assert type(server.osc_protocol) is osc_protocol_class
+    assert server.osc_protocol.callbacks
+
+
+SEND_MANY_MESSAGES = [
+    "/echo",
+    ["/echo", 1],
+    OscMessage("/echo", 2, "three"),
+    OscBundle(contents=[OscMessage("/echo", 4)]),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "osc_protocol_class, server_fixture",
+    [
+        (AsyncOscProtocol, "serial_udp_echo_server"),
+        (AsyncTcpOscProtocol, "tcp_echo_server"),
+    ],
+)
+async def test_AsyncOscProtocol_send_many(osc_protocol_class, server_fixture, request):
+    port = request.getfixturevalue(server_fixture)
+    received = []
+    osc_protocol = osc_protocol_class()
+    osc_protocol.register(pattern="/echo", procedure=received.append)
+    with pytest.raises(OscProtocolOffline):
+        osc_protocol.send_many(SEND_MANY_MESSAGES)
+    await osc_protocol.connect("127.0.0.1", port)
+    with osc_protocol.capture() as transcript:
+        osc_protocol.send_many(SEND_MANY_MESSAGES)
+        for _ in range(100):
+            if len(received) == 3:
+                break
+            await asyncio.sleep(0.01)
+    osc_protocol.disconnect()
+    assert transcript.sent_messages[0][0] == transcript.sent_messages[-1][0]
+    assert [message for _, message in transcript.sent_messages] == [
+        OscMessage("/echo"),
+        OscMessage("/echo", 1),
+        OscMessage("/echo", 2, "three"),
+        OscBundle(contents=[OscMessage("/echo", 4)]),
+    ]
+    # Bundles echo back undecoded as messages, so only messages match.
+    assert received == [
+        OscMessage("/echo"),
+        OscMessage("/echo", 1),
+        OscMessage("/echo", 2, "three"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "osc_protocol_class, server_fixture",
+    [
+        (ThreadedOscProtocol, "serial_udp_echo_server"),
+        (ThreadedTcpOscProtocol, "tcp_echo_server"),
+    ],
+)
+def test_ThreadedOscProtocol_send_many(osc_protocol_class, server_fixture, request):
+    port = request.getfixturevalue(server_fixture)
+    received = []
+    osc_protocol = osc_protocol_class()
+    osc_protocol.register(pattern="/echo", procedure=received.append)
+    with pytest.raises(OscProtocolOffline):
+        osc_protocol.send_many(SEND_MANY_MESSAGES)
+    osc_protocol.connect("127.0.0.1", port)
+    with osc_protocol.capture() as transcript:
+        osc_protocol.send_many(SEND_MANY_MESSAGES)
+        for _ in range(100):
+            if len(received) == 3:
+                break
+            time.sleep(0.01)
+    osc_protocol.disconnect()
+    assert len(transcript.sent_messages) == 4
+    assert received == [
+        OscMessage("/echo"),
+        OscMessage("/echo", 1),
+        OscMessage("/echo", 2, "three"),
+    ]
+
+
+class CountingLock:
+    def __init__(self):
+        self.entered = 0
+        self.held = False
+
+    def __enter__(self):
+        self.entered += 1
+        self.held = True
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.held = False
+
+
+def test_ThreadedBatchOscProtocol(serial_udp_echo_server):
+    def callback(message):
+        if not lock.held:
+            raise RuntimeError(message)
+        received.append(message)
+
+    lock = CountingLock()
+    received = []
+    osc_protocol = ThreadedBatchOscProtocol(
+        receive_buffer_size=1 << 20, batch_size=64, delivery_lock=lock
+    )
+    osc_protocol.register(pattern="/echo", procedure=callback)
+    osc_protocol.register(pattern="/fail", procedure=lambda message: 1 / 0)
+    osc_protocol.connect("127.0.0.1", serial_udp_echo_server)
+    assert osc_protocol.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= (
+        1 << 20
+    )
+    messages = [OscMessage("/echo", i) for i in range(100)]
+    # A raising callback doesn't stop delivery.
+    osc_protocol.send(OscMessage("/fail"))
+    osc_protocol.send_many(messages)
+    for _ in range(200):
+        if len(received) == len(messages):
+            break
+        time.sleep(0.01)
+    osc_protocol.disconnect()
+    assert not osc_protocol.is_running
+    assert osc_protocol.socket is None
+    assert received == messages
+    assert 2 <= lock.entered <= len(messages) + 1
+    assert osc_protocol.dropped_count == 0
+
+
+def test_OscMetrics(udp_echo_server):
+    def callback(message):
+        received.append(message)
+
+    received = []
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.register(pattern="/echo", procedure=callback)
+    assert osc_protocol.metrics is None
+    metrics = osc_protocol.enable_metrics()
+    assert osc_protocol.enable_metrics() is metrics
+    osc_protocol.connect("127.0.0.1", udp_echo_server)
+    osc_protocol.send(OscMessage("/echo", 1))
+    osc_protocol.send_many([OscMessage("/echo", 2), OscMessage("/other")])
+    for _ in range(100):
+        if len(received) == 2:
+            break
+        time.sleep(0.01)
+    time.sleep(0.05)
+    osc_protocol.disconnect()
+    metrics.record_latency(["/done", "/b_alloc", 0], 1500)
+    metrics.record_latency(["/done", "/b_alloc", 1], 3000)
+    metrics.record_latency(["/done", "/b_alloc", 2], None)
+    data = metrics.as_dict()
+    assert data["sent"] == {
+        "/echo": {"count": 2, "bytes": 32},
+        "/other": {"count": 1, "bytes": 12},
+    }
+    assert data["received"] == data["sent"]
+    assert list(data["callbacks"]) == ["test_OscMetrics.<locals>.callback"]
+    assert data["callbacks"]["test_OscMetrics.<locals>.callback"]["count"] == 2
+    assert data["latencies"] == {
+        "/done /b_alloc": {
+            "count": 2,
+            "timeouts": 1,
+            "total_ns": 4500,
+            "minimum_ns": 1500,
+            "maximum_ns": 3000,
+            "buckets_us": {2: 1, 4: 1},
+        }
+    }
+    metrics.reset()
+    assert metrics.as_dict() == {
+        "sent": {},
+        "received": {},
+        "latencies": {},
+        "callbacks": {},
+    }
+    osc_protocol.disable_metrics()
+    assert osc_protocol.metrics is None
+
+
+def test_RingCapture(udp_echo_server, tmp_path):
+    received = []
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.register(pattern="/echo", procedure=received.append)
+    osc_protocol.register(pattern="/status", procedure=received.append)
+    osc_protocol.connect("127.0.0.1", udp_echo_server)
+    path = tmp_path / "trace.osc"
+    with osc_protocol.ring_capture(maximum_length=4, path=path) as transcript:
+        osc_protocol.send_many(SEND_MANY_MESSAGES)
+        osc_protocol.send(OscMessage("/status"))
+        for _ in range(100):
+            if len(received) == 4:
+                break
+            time.sleep(0.01)
+    osc_protocol.disconnect()
+    assert not osc_protocol.ring_captures
+    # Only the most recent datagrams are kept, decoded on demand.
+    assert len(transcript) == 4
+    assert all(isinstance(entry.datagram, bytes) for entry in transcript)
+    assert OscMessage("/status") in transcript.filtered(sent=False)
+    assert OscMessage("/status") not in transcript.filtered(status=False)
+    # Every datagram is spilled to the trace.
+    with OscTraceReader(path) as reader:
+        assert len(reader) == 10
+        timestamps = [entry.timestamp for entry in reader]
+        assert timestamps == sorted(timestamps)
+        assert [entry.message for entry in reader.filtered(received=False)] == [
+            OscMessage("/echo"),
+            OscMessage("/echo", 1),
+            OscMessage("/echo", 2, "three"),
+            OscBundle(contents=[OscMessage("/echo", 4)]),
+            OscMessage("/status"),
+        ]
+        assert len(list(reader.filtered(address="/echo"))) == 8
+        assert len(list(reader.filtered(address="/st*", sent=False))) == 1
+        assert list(reader.filtered(address="/n_go")) == []
+
+
+def test_OscTraceReader(tmp_path):
+    path = tmp_path / "trace.osc"
+    bundle = OscBundle(
+        contents=[OscMessage("/n_set", 1000), OscBundle(contents=[OscMessage("/b_go")])]
+    )
+    with OscTraceWriter(path) as writer:
+        writer.write(
+            [
+                RingCaptureEntry(1, "S", bundle.to_datagram()),
+                RingCaptureEntry(2, "R", OscMessage("/n_go", 1000).to_datagram()),
+            ]
+        )
+    # Appending to an existing trace, then truncating the last record mid-write.
+    with OscTraceWriter(path) as writer:
+        writer.write([RingCaptureEntry(3, "R", OscMessage("/b_go").to_datagram())])
+    with open(path, "ab") as file_:
+        file_.write(OscMessage("/n_end").to_datagram()[:5])
+    with OscTraceReader(path) as reader:
+        assert [entry.timestamp for entry in reader] == [1, 2, 3]
+        assert [entry.message for entry in reader.filtered(address="/n_*")] == [
+            bundle,
+            OscMessage("/n_go", 1000),
+        ]
+        assert [entry.timestamp for entry in reader.filtered(address="/b_go")] == [1, 3]
+    # Corrupt bundle element sizes end the search instead of looping.
+    datagram = bytearray(bundle.to_datagram())
+    datagram[16:20] = struct.pack(">i", -4)
+    with OscTraceWriter(tmp_path / "corrupt.osc") as writer:
+        writer.write(
+            [
+                RingCaptureEntry(1, "R", bytes(datagram)),
+                RingCaptureEntry(2, "R", OscMessage("/n_go", 1000).to_datagram()),
+            ]
+        )
+    with OscTraceReader(tmp_path / "corrupt.osc") as reader:
+        assert [entry.timestamp for entry in reader.filtered(address="/n_*")] == [2]
+    path.write_bytes(b"garbage!")
+    with pytest.raises(ValueError):
+        OscTraceReader(path)
+    with pytest.raises(ValueError):
+        OscTraceWriter(path)
+
+
+def test_OscProtocol_dispatch():
+    def callback(message):
+        received.append(message)
+
+    received = []
+    osc_protocol = AsyncOscProtocol()
+    exact = osc_protocol.register(pattern="/n_go", procedure=callback)
+    node = osc_protocol.register(pattern=["/n_go", 1000], procedure=callback)
+    wildcard = osc_protocol.register(pattern="/n_*", procedure=callback)
+    alternatives = osc_protocol.register(pattern="/{b,g}_[!a-m]?", procedure=callback)
+    once = osc_protocol.register(
+        pattern=["/done", "/b_alloc", 1],
+        failure_pattern=["/fail", "/b_alloc"],
+        procedure=callback,
+        once=True,
+    )
+    assert len(osc_protocol.callbacks) == 5
+    n_go = OscMessage("/n_go", 1000, 1, -1, -1, 0)
+    assert osc_protocol._match_callbacks(n_go) == [exact, node, wildcard]
+    assert osc_protocol._match_callbacks(OscMessage("/n_go", 1001)) == [
+        exact,
+        wildcard,
+    ]
+    assert osc_protocol._match_callbacks(OscMessage("/n_end", 1000)) == [wildcard]
+    assert osc_protocol._match_callbacks(OscMessage("/n_go/foo")) == []
+    assert osc_protocol._match_callbacks(OscMessage("/g_new", [1, 2])) == []
+    assert osc_protocol._match_callbacks(OscMessage("/g_qu")) == [alternatives]
+    assert osc_protocol._match_callbacks(OscMessage("/b_on")) == [alternatives]
+    assert osc_protocol._match_callbacks(OscMessage("/b_go")) == []
+    assert osc_protocol._match_callbacks(OscMessage("/fail", "/b_alloc")) == [once]
+    # One-shot callbacks unregister both their patterns once matched.
+    assert osc_protocol._match_callbacks(OscMessage("/done", "/b_alloc", 1)) == []
+    assert len(osc_protocol.callbacks) == 4
+    assert "/done" not in osc_protocol.callbacks.nodes
+    assert "/fail" not in osc_protocol.callbacks.nodes
+    # Unregistering a wildcard invalidates the cached matches for an address.
+    osc_protocol.unregister(wildcard)
+    osc_protocol.unregister(wildcard)
+    assert osc_protocol._match_callbacks(n_go) == [exact, node]
+    assert osc_protocol._match_callbacks(OscMessage("/n_end", 1000)) == []
+    osc_protocol.unregister(node)
+    osc_protocol.unregister(exact)
+    osc_protocol.unregister(alternatives)
+    assert not osc_protocol.callbacks
+    assert not osc_protocol.callbacks.nodes
+    assert not osc_protocol.callbacks.wildcards
+    assert list(osc_protocol._validate_receive(n_go.to_datagram())) == []
+    assert received == []
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import pathlib
 import stat
@@ -40,3 +41,23 @@ def test_find_on_path(mock_env_scsynth_path, monkeypatch):
             got = scsynth.find()
             expected = scsynth_path.resolve().absolute()
             assert got == expected
+
+
+@pytest.mark.asyncio
+async def test_AsyncNonrealtimeProcessProtocol_handle_line():
+    def on_progress(timestamp):
+        if timestamp > 1:
+            raise ValueError(timestamp)
+        progress.append(timestamp)
+
+    progress = []
+    protocol = scsynth.AsyncNonrealtimeProcessProtocol(
+        asyncio.get_running_loop().create_future(), on_progress=on_progress
+    )
+    for line in ["nextOSCPacket 0", "nextOSCPacket", "nextOSCPacket x", "foo 0.5"]:
+        protocol.handle_line(line)
+    protocol.handle_line("nextOSCPacket 0.75")
+    assert progress == [0.0, 0.75]
+    # errors raised by the callback aren't mistaken for unparseable lines
+    with pytest.raises(ValueError):
+        protocol.handle_line("nextOSCPacket 1.5")
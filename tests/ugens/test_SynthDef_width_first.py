@@ -1,6 +1,7 @@
 # flake8: noqa
 import os
 import platform
+import random
 
 import pytest
 from uqbar.strings import normalize
@@ -8,14 +9,19 @@ from uqbar.strings import normalize
 from supriya.ugens import (
     FFT,
     IFFT,
+    LPF,
     LocalBuf,
     Out,
+    OutputProxy,
     PV_BinScramble,
     PV_MagFreeze,
     PV_MagMul,
     PinkNoise,
+    RandID,
     SuperColliderSynthDef,
+    SynthDef,
     SynthDefBuilder,
+    WhiteNoise,
     decompile_synthdef,
 )
 
@@ -382,3 +388,64 @@ def test_02_supriya_vs_bytes(py_synthdef_02):
     # fmt: on
     py_compiled_synthdef = py_synthdef_02.compile()
     assert py_compiled_synthdef == test_compiled_synthdef
+
+
+def reference_sort(ugens):
+    """
+    Sort UGens as sclang does, depending on every preceding width-first UGen.
+    """
+    antecedents = {ugen: [] for ugen in ugens}
+    descendants = {ugen: [] for ugen in ugens}
+    width_first_ugens = []
+    for ugen in ugens:
+        inputs = [x.source if isinstance(x, OutputProxy) else x for x in ugen.inputs]
+        for input_ in [x for x in inputs if x in antecedents] + width_first_ugens:
+            if input_ not in antecedents[ugen]:
+                antecedents[ugen].append(input_)
+                descendants[input_].append(ugen)
+        if ugen._is_width_first:
+            width_first_ugens.append(ugen)
+    available = [ugen for ugen in reversed(ugens) if not antecedents[ugen]]
+    sorted_ugens = []
+    while available:
+        ugen = available.pop()
+        for descendant in reversed(descendants[ugen]):
+            antecedents[descendant].remove(ugen)
+            if not antecedents[descendant]:
+                available.append(descendant)
+        sorted_ugens.append(ugen)
+    return sorted_ugens
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_03_sort_vs_reference(seed):
+    random_ = random.Random(seed)
+    with SynthDefBuilder() as builder:
+        sources = [PinkNoise.ar(), WhiteNoise.ar()]
+        for _ in range(50):
+            source = random_.choice(sources)
+            if random_.random() < 0.2:
+                RandID.ir(rand_id=random_.randrange(4))
+            if random_.random() < 0.3:
+                pv_chain = FFT.kr(source=source)
+                pv_chain = PV_MagFreeze.kr(pv_chain=pv_chain)
+                sources.append(IFFT.ar(pv_chain=pv_chain))
+            else:
+                sources.append(LPF.ar(source=source * random_.choice(sources)))
+        Out.ar(bus=0, source=sources[-10:])
+    py_synthdef = builder.build(optimize=False)
+    # Shuffle the UGens into some other order they could have been added in
+    ugens, shuffled_ugens = list(py_synthdef.ugens), []
+    while ugens:
+        for ugen in random_.sample(ugens, len(ugens)):
+            if all(
+                x.source in shuffled_ugens
+                for x in ugen.inputs
+                if isinstance(x, OutputProxy)
+            ):
+                shuffled_ugens.append(ugen)
+                ugens.remove(ugen)
+                break
+    assert SynthDef._sort_ugens_topologically(shuffled_ugens) == reference_sort(
+        shuffled_ugens
+    )